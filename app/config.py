@@ -7,8 +7,9 @@ from functools import lru_cache
 class Settings(BaseSettings):
     """Application settings loaded from environment."""
     
-    # Google Sheets base URL
+    # Google Sheets / Docs base URLs (point both at the fake upstream to run offline)
     sheets_base_url: str = "https://docs.google.com/spreadsheets/d"
+    docs_base_url: str = "https://docs.google.com/document/d"
     
     # Individual Sheet IDs
     sheet_id_articles: str = ""
@@ -22,24 +23,120 @@ class Settings(BaseSettings):
     sheet_id_vision: str = ""
     
     # Cache settings
-    cache_ttl_seconds: int = 600  # 10 minutes
+    cache_ttl_seconds: int = 600  # 10 minutes (default for anything without its own TTL)
+    cache_stale_ttl_seconds: int = 86400  # Keep expired data this long to serve during outages
+    negative_cache_ttl_seconds: int = 30  # Don't retry a failed fetch for this long (0 = always retry)
+    response_cache_max_entries: int = 1024  # Rendered list responses (one per route + query)
+    preview_cache_ttl_seconds: int = 5  # ?preview=true reads: fresh from Google, shared only this long
+    change_history_size: int = 1000  # Row changes remembered for /api/changes (one per changed fetch)
+    stream_max_connections: int = 1000  # Concurrent /api/stream clients (per worker)
+    stream_heartbeat_seconds: float = 15.0  # Comment line sent to idle /api/stream clients
+    cache_webhook_secret: str = ""  # Bearer token for POST /api/cache/invalidate (empty = disabled)
     
+    # Per-resource cache policy, keyed like sheet_id_*: entries expire after
+    # cache_ttl_<name> seconds; after refresh_interval_<name> seconds they are
+    # still served but refreshed in the background (0 = no soft refresh)
+    cache_ttl_articles: int = 3600
+    cache_ttl_boutique: int = 3600
+    cache_ttl_church_info: int = 86400  # Changes yearly
+    cache_ttl_contact: int = 600
+    cache_ttl_events: int = 900
+    cache_ttl_home_groups: int = 3600
+    cache_ttl_pastoral_team: int = 86400
+    cache_ttl_services: int = 86400
+    cache_ttl_vision: int = 86400  # Changes yearly
+    cache_ttl_docs: int = 86400  # Article bodies (doc: entries)
+    cache_ttl_doc_revisions: int = 2592000  # Article bodies pinned to the article's updated_at
+    refresh_interval_articles: int = 600
+    refresh_interval_boutique: int = 1800
+    refresh_interval_church_info: int = 3600
+    refresh_interval_contact: int = 0
+    refresh_interval_events: int = 300
+    refresh_interval_home_groups: int = 1800
+    refresh_interval_pastoral_team: int = 3600
+    refresh_interval_services: int = 3600
+    refresh_interval_vision: int = 3600
+    refresh_interval_docs: int = 3600
+    refresh_interval_doc_revisions: int = 86400  # Catches doc edits that didn't touch updated_at
+    
+    # Adaptive refresh: sheets with a refresh interval stretch it while their content
+    # is unchanged and halve it after a change, within these bounds (and the TTL)
+    adaptive_refresh_enabled: bool = True
+    adaptive_refresh_min_seconds: int = 60
+    adaptive_refresh_max_seconds: int = 21600
+    
+    # Upstream circuit breaker (per host)
+    circuit_failure_threshold: int = 3  # Consecutive failures before opening
+    circuit_backoff_seconds: float = 5.0  # First open period, doubled on each re-open
+    circuit_max_backoff_seconds: float = 300.0
+    
+    # Upstream time budgets
+    upstream_timeout_seconds: float = 10.0  # Cap for a single upstream call
+    request_deadline_seconds: float = 15.0  # Total upstream budget per API request (0 = no deadline)
+    upstream_hedge_enabled: bool = False  # Send a second fetch when the first outlasts the host's p95
+    upstream_hedge_min_samples: int = 20  # Latency samples needed before hedging kicks in
+
+    # Response compression settings
+    compression_min_size: int = 1024  # Bodies smaller than this are sent as-is
+    compression_gzip_level: int = 9
+    compression_brotli_quality: int = 9
+    compression_cache_max_bytes: int = 16777216  # Compressed bodies kept for reuse (LRU, 16 MiB)
+    
+    # Cached doc HTML at least this long (chars) is stored compressed in memory (0 = never)
+    doc_compress_min_size: int = 2048
+    doc_compress_level: int = 6  # zlib 1-9, or zstd 1-22 when zstandard is installed
+
     # Language settings
     default_language: str = "fr"
     supported_languages: list[str] = ["fr", "en"]
     
+    # Rate limiting (token buckets per client IP)
+    rate_limit_enabled: bool = True
+    rate_limit_cheap: str = "120/minute"  # Routes served from cached snapshots
+    rate_limit_expensive: str = "20/minute"  # Routes that may fetch from Google
+    rate_limit_expensive_paths: str = "/api/articles/"  # Comma-separated path prefixes
+    rate_limit_store: str = "memory"  # "memory" (per worker) or "shared" (all workers)
+    rate_limit_shared_path: str = "/dev/shm/lr-website-ratelimit"
+    rate_limit_shared_slots: int = 65536
+    trusted_proxies: str = ""  # Comma-separated IPs/CIDRs allowed to set X-Forwarded-For
+    
+    # Startup: import routers (and httpx) on first use instead of at startup
+    lazy_startup: bool = False
+    
+    # Prefork launcher (python -m app.serve); its command-line flags override these
+    serve_workers: int = 0  # 0 = one per CPU
+    serve_loop: str = "auto"  # "auto", "asyncio" or "uvloop"
+    serve_http: str = "auto"  # "auto", "h11" or "httptools"
+    serve_warm: bool = True  # Load every sheet and published doc before forking
+    
     # CORS
     cors_origins: str = "http://localhost:3000,http://localhost:5173"
     
     # Logging settings
     log_level: str = "INFO"
     log_json_format: bool = False  # Set to True for production
+    log_async: bool = True  # Write logs from a background thread
+    log_queue_size: int = 10000  # Records beyond this are dropped, never blocking
+    log_sample_rate: float = 1.0  # Fraction of successful request logs to keep
     
     @property
     def cors_origins_list(self) -> list[str]:
         """Parse CORS origins from comma-separated string."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
     
+    @property
+    def rate_limit_expensive_paths_list(self) -> list[str]:
+        """Parse expensive route prefixes from comma-separated string."""
+        return [path.strip() for path in self.rate_limit_expensive_paths.split(",") if path.strip()]
+    
+    def get_cache_ttl(self, resource: str) -> int:
+        """Cache TTL for a resource ("articles", "docs", ...), defaulting to cache_ttl_seconds."""
+        return getattr(self, f"cache_ttl_{resource}", None) or self.cache_ttl_seconds
+    
+    def get_refresh_interval(self, resource: str) -> int:
+        """Soft-refresh interval for a resource (0 = refresh only on expiry)."""
+        return getattr(self, f"refresh_interval_{resource}", 0)
+    
     def get_sheet_csv_url(self, sheet_id: str, tab_name: str | None = None) -> str:
         """Generate the public CSV export URL for a Google Sheet."""
         url = f"{self.sheets_base_url}/{sheet_id}/gviz/tq?tqx=out:csv"
@@ -47,10 +144,9 @@ class Settings(BaseSettings):
             url += f"&sheet={tab_name}"
         return url
     
-    @staticmethod
-    def get_doc_html_url(doc_id: str) -> str:
+    def get_doc_html_url(self, doc_id: str) -> str:
         """Generate the public HTML export URL for a Google Doc."""
-        return f"https://docs.google.com/document/d/{doc_id}/export?format=html"
+        return f"{self.docs_base_url}/{doc_id}/export?format=html"
     
     @staticmethod
     def extract_doc_id(doc_url: str) -> str | None:
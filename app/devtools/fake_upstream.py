@@ -0,0 +1,205 @@
+"""
+Local stand-in for the Google Sheets CSV and Google Docs HTML exports.
+
+Serves the URLs built by ``Settings.get_sheet_csv_url`` and
+``Settings.get_doc_html_url`` from fixture files, with configurable latency
+(including a slow tail), error rate and content mutation, so the whole app
+can run (and be load tested) without touching Google.
+
+Fixture layout:
+    <fixtures>/sheets/<sheet_id>.csv           # default tab
+    <fixtures>/sheets/<sheet_id>__<tab>.csv    # named tab (falls back to default)
+    <fixtures>/docs/<doc_id>.html
+
+Usage:
+    python -m app.devtools.fake_upstream --port 8001 [--fixtures DIR] [--latency-ms 80]
+
+Then run the API with:
+    SHEETS_BASE_URL=http://127.0.0.1:8001/spreadsheets/d
+    DOCS_BASE_URL=http://127.0.0.1:8001/document/d
+    SHEET_ID_ARTICLES=articles  (and so on, one per fixture file)
+
+Runtime controls:
+    GET  /_fake/stats    request, error and mutation counters
+    POST /_fake/config   update latency/error/mutation settings (JSON body)
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import random
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route
+
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+class FakeUpstreamConfig(BaseModel):
+    """Behaviour of the fake upstream."""
+    latency_ms: float = Field(0.0, ge=0)  # Base latency added to every response
+    jitter_ms: float = Field(0.0, ge=0)  # Extra uniform random latency
+    slow_rate: float = Field(0.0, ge=0, le=1)  # Probability of a tail-latency response
+    slow_ms: float = Field(0.0, ge=0)  # Extra latency of those slow responses
+    error_rate: float = Field(0.0, ge=0, le=1)  # Probability of a 500 response
+    mutation_rate: float = Field(0.0, ge=0, le=1)  # Probability a request edits the content
+
+
+class FakeUpstream:
+    """In-memory content store and ASGI app serving fixture exports."""
+
+    def __init__(self, fixtures_dir: Path | str = DEFAULT_FIXTURES, config: FakeUpstreamConfig | None = None):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.config = config or FakeUpstreamConfig()
+        self.sheets: dict[str, str] = {}
+        self.docs: dict[str, str] = {}
+        self.stats = {"requests": 0, "errors": 0, "mutations": 0, "not_found": 0, "slow": 0}
+        self._rng = random.Random()
+        self.load_fixtures()
+
+        self.app = Starlette(routes=[
+            Route("/spreadsheets/d/{sheet_id}/gviz/tq", self.sheet_csv),
+            Route("/document/d/{doc_id}/export", self.doc_html),
+            Route("/_fake/stats", self.get_stats),
+            Route("/_fake/config", self.update_config, methods=["POST"]),
+        ])
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.app(scope, receive, send)
+
+    def load_fixtures(self) -> None:
+        """(Re)load all fixture files, discarding mutations."""
+        self.sheets = {
+            path.stem: path.read_text(encoding="utf-8")
+            for path in sorted((self.fixtures_dir / "sheets").glob("*.csv"))
+        }
+        self.docs = {
+            path.stem: path.read_text(encoding="utf-8")
+            for path in sorted((self.fixtures_dir / "docs").glob("*.html"))
+        }
+
+    async def _simulate(self) -> Response | None:
+        """Apply latency and maybe fail; returns an error response or None."""
+        self.stats["requests"] += 1
+        delay = self.config.latency_ms + self._rng.uniform(0, self.config.jitter_ms)
+        if self._rng.random() < self.config.slow_rate:
+            self.stats["slow"] += 1
+            delay += self.config.slow_ms
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        if self._rng.random() < self.config.error_rate:
+            self.stats["errors"] += 1
+            return PlainTextResponse("Simulated upstream error", status_code=500)
+        return None
+
+    def _should_mutate(self) -> bool:
+        if self._rng.random() < self.config.mutation_rate:
+            self.stats["mutations"] += 1
+            return True
+        return False
+
+    async def sheet_csv(self, request: Request) -> Response:
+        error = await self._simulate()
+        if error:
+            return error
+
+        sheet_id = request.path_params["sheet_id"]
+        tab = request.query_params.get("sheet")
+        key = f"{sheet_id}__{tab}" if tab and f"{sheet_id}__{tab}" in self.sheets else sheet_id
+        if key not in self.sheets:
+            self.stats["not_found"] += 1
+            return PlainTextResponse("Sheet not found", status_code=404)
+
+        if self._should_mutate():
+            self.sheets[key] = mutate_csv(self.sheets[key], self._rng)
+        return Response(self.sheets[key], media_type="text/csv; charset=utf-8")
+
+    async def doc_html(self, request: Request) -> Response:
+        error = await self._simulate()
+        if error:
+            return error
+
+        doc_id = request.path_params["doc_id"]
+        if doc_id not in self.docs:
+            self.stats["not_found"] += 1
+            return PlainTextResponse("Document not found", status_code=404)
+
+        if self._should_mutate():
+            self.docs[doc_id] = mutate_html(self.docs[doc_id])
+        return Response(self.docs[doc_id], media_type="text/html; charset=utf-8")
+
+    async def get_stats(self, request: Request) -> Response:
+        return JSONResponse({**self.stats, "config": self.config.model_dump()})
+
+    async def update_config(self, request: Request) -> Response:
+        try:
+            self.config = FakeUpstreamConfig.model_validate(
+                {**self.config.model_dump(), **await request.json()}
+            )
+        except ValidationError as e:
+            return JSONResponse({"detail": e.errors(include_url=False)}, status_code=422)
+        return JSONResponse(self.config.model_dump())
+
+
+def mutate_csv(csv_text: str, rng: random.Random) -> str:
+    """Simulate an editor changing one row: bump its updated_at (or last cell)."""
+    rows = list(csv.reader(io.StringIO(csv_text)))
+    if len(rows) < 2:
+        return csv_text
+
+    header, row = rows[0], rng.choice(rows[1:])
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    if "updated_at" in header and header.index("updated_at") < len(row):
+        row[header.index("updated_at")] = now
+    elif row:
+        row[-1] = f"{row[-1]} ({now})"
+
+    output = io.StringIO()
+    csv.writer(output, quoting=csv.QUOTE_ALL, lineterminator="\n").writerows(rows)
+    return output.getvalue()
+
+
+def mutate_html(html: str) -> str:
+    """Simulate an editor appending a paragraph to a document."""
+    now = datetime.now(timezone.utc).isoformat()
+    paragraph = f"<p>Mis à jour le {now}</p>"
+    if "</body>" in html:
+        return html.replace("</body>", f"{paragraph}</body>", 1)
+    return html + paragraph
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Fake Google Sheets/Docs export server")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES), help="Fixture directory")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--slow-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--mutation-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    upstream = FakeUpstream(args.fixtures, FakeUpstreamConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        slow_rate=args.slow_rate,
+        slow_ms=args.slow_ms,
+        error_rate=args.error_rate,
+        mutation_rate=args.mutation_rate,
+    ))
+    uvicorn.run(upstream, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Render the public API to static JSON files for a CDN.
+
+Every public GET endpoint is requested in-process (through the full app, so
+the output is byte-for-byte what the API serves) and written to
+``<out>/<path>/index.json``; e.g. ``/api/articles/<slug>`` becomes
+``<out>/api/articles/<slug>/index.json``. Detail pages are discovered from the
+list responses: every published article (with ``content_html``), event and
+product.
+
+Sheets are fetched concurrently up front, then pages are rendered with up to
+``--concurrency`` requests (and so Google Docs fetches) in flight.
+
+Usage:
+    python -m app.export --out dist [--concurrency 8]
+
+Exits with status 1 if any page failed or had to be built from stale data.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+import httpx
+from fastapi import FastAPI
+
+from app.config import get_settings
+from app.logging_config import get_logger
+from app.main import create_app
+from app.services import sheets_service
+
+
+logger = get_logger(__name__)
+
+# Endpoints rendered as-is
+LIST_PATHS = (
+    "/api/articles",
+    "/api/boutique",
+    "/api/church-info",
+    "/api/events",
+    "/api/events/upcoming",
+    "/api/home-groups",
+    "/api/pastoral-team",
+    "/api/services",
+    "/api/vision",
+)
+
+# List path -> (items key in its response, id field, detail path template)
+DETAIL_PATHS = {
+    "/api/articles": ("articles", "slug", "/api/articles/{}"),
+    "/api/boutique": ("products", "id", "/api/boutique/{}"),
+    "/api/events": ("events", "id", "/api/events/{}"),
+}
+
+# Sheets behind the public endpoints
+PUBLIC_RESOURCES = (
+    "articles", "boutique", "church_info", "events",
+    "home_groups", "pastoral_team", "services", "vision",
+)
+
+
+def output_file(out_dir: Path, path: str) -> Path:
+    """Map an API path to the file that holds its response."""
+    return out_dir / path.strip("/") / "index.json"
+
+
+async def export_site(app: FastAPI, out_dir: Path, concurrency: int = 8) -> dict[str, list[str]]:
+    """
+    Render every public endpoint of ``app`` into ``out_dir``.
+
+    Returns:
+        Paths that were "written", "stale" (written from last good data) or "failed".
+    """
+    result: dict[str, list[str]] = {"written": [], "stale": [], "failed": []}
+    limit = asyncio.Semaphore(concurrency)
+
+    # Warm every sheet at once so concurrent pages don't all miss the same one
+    await asyncio.gather(*(sheets_service.get_resource(name) for name in PUBLIC_RESOURCES))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://export") as client:
+
+        async def render(path: str) -> dict | None:
+            async with limit:
+                response = await client.get(path, headers={"Accept-Encoding": "identity"})
+            if response.status_code != 200:
+                logger.error(f"Export failed for {path}", extra={"path": path, "status_code": response.status_code})
+                result["failed"].append(path)
+                return None
+
+            target = output_file(out_dir, path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(response.content)
+            result["stale" if "warning" in response.headers else "written"].append(path)
+            return response.json()
+
+        listings = dict(zip(LIST_PATHS, await asyncio.gather(*map(render, LIST_PATHS))))
+
+        detail_paths = [
+            template.format(quote(str(item[id_field]), safe=""))
+            for list_path, (items_key, id_field, template) in DETAIL_PATHS.items()
+            for item in (listings[list_path] or {}).get(items_key, [])
+            if item.get(id_field)
+        ]
+        await asyncio.gather(*map(render, detail_paths))
+
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render the public API to static JSON files")
+    parser.add_argument("--out", type=Path, default=Path("dist"), help="Output directory")
+    parser.add_argument("--concurrency", type=int, default=8, help="Pages rendered at once")
+    args = parser.parse_args()
+
+    # The exporter is a single client hitting every page: don't rate limit it
+    get_settings().rate_limit_enabled = False
+
+    start = time.perf_counter()
+    result = asyncio.run(export_site(create_app(), args.out, args.concurrency))
+
+    print(
+        f"Exported {len(result['written']) + len(result['stale'])} pages to {args.out} "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+    for status in ("stale", "failed"):
+        for path in result[status]:
+            print(f"  {status}: {path}")
+    if result["stale"] or result["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
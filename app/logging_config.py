@@ -2,21 +2,47 @@
 Logging configuration for the application.
 
 Provides structured JSON logging for production and human-readable logs for development.
+Records are handed to a background thread through a queue, so a slow stdout never
+blocks the event loop.
 """
 
+import atexit
+import copy
 import logging
+import queue
+import random
 import sys
-import json
-from datetime import datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+from pydantic_core import to_json
+
+
+# Background listener writing queued records (see setup_logging)
+_listener: QueueListener | None = None
+
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging in production."""
     
+    def __init__(self) -> None:
+        super().__init__()
+        # Cache of the formatted timestamp prefix for the current second
+        self._ts_second = -1
+        self._ts_prefix = ""
+    
+    def format_timestamp(self, created: float) -> str:
+        """Format a record's creation time as ISO 8601 UTC with milliseconds."""
+        second = int(created)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        return f"{self._ts_prefix}.{int((created - second) * 1000):03d}Z"
+    
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self.format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -25,15 +51,17 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
         
-        # Add exception info if present
+        # Add exception info if present (already rendered when queued)
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
         
         # Add extra fields
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
         
-        return json.dumps(log_data)
+        return to_json(log_data, serialize_unknown=True).decode()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -54,10 +82,63 @@ class ColoredFormatter(logging.Formatter):
         return super().format(record)
 
 
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the caller.
+    
+    Records are dropped (and counted) when the queue is full instead of
+    waiting for the writer thread to catch up.
+    """
+    
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only merge the message args here; formatting happens on the listener
+        # thread. Exceptions are rendered now since tracebacks reference frames.
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class SuccessSampleFilter(logging.Filter):
+    """
+    Keep only a fraction of successful request logs.
+    
+    Applies to records carrying a ``status_code`` below 400 (as emitted by
+    the request logging middleware); errors and all other records pass.
+    """
+    
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.rate = rate
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        status_code = getattr(record, "status_code", None)
+        if status_code is None or status_code >= 400:
+            return True
+        return random.random() < self.rate
+
+
 def setup_logging(
     level: str = "INFO",
     json_format: bool = False,
-    app_name: str = "lr-website-backend"
+    app_name: str = "lr-website-backend",
+    async_logging: bool = True,
+    queue_size: int = 10000,
+    sample_rate: float = 1.0,
 ) -> logging.Logger:
     """
     Configure structured logging for the application.
@@ -66,15 +147,21 @@ def setup_logging(
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_format: If True, use JSON format; otherwise use colored console format
         app_name: Application name for the logger
+        async_logging: If True, format and write records on a background thread
+        queue_size: Maximum number of queued records before new ones are dropped
+        sample_rate: Fraction (0-1) of successful request logs to keep
     
     Returns:
         Configured root logger
     """
+    global _listener
+    
     # Get the root logger
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, level.upper()))
     
-    # Remove existing handlers
+    # Remove existing handlers (and stop a previous background writer)
+    stop_logging()
     logger.handlers.clear()
     
     # Create console handler
@@ -91,6 +178,14 @@ def setup_logging(
         )
         handler.setFormatter(formatter)
     
+    if async_logging:
+        _listener = QueueListener(queue.Queue(maxsize=queue_size), handler)
+        _listener.start()
+        handler = NonBlockingQueueHandler(_listener.queue)
+    
+    if sample_rate < 1.0:
+        handler.addFilter(SuccessSampleFilter(sample_rate))
+    
     logger.addHandler(handler)
     
     # Create app-specific logger
@@ -99,6 +194,20 @@ def setup_logging(
     return app_logger
 
 
+def stop_logging() -> None:
+    """Stop the background writer, flushing any queued records."""
+    global _listener
+    if _listener is not None:
+        try:
+            _listener.stop()
+        except queue.Full:
+            pass  # No room for the stop sentinel; the daemon thread exits with us
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the given name.
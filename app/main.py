@@ -1,118 +1,158 @@
 """FastAPI application entry point."""
 
+import importlib
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-import time
 
 from app.config import get_settings
 from app.logging_config import setup_logging, get_logger
-from app.routers import (
-    articles,
-    boutique,
-    church_info,
-    events,
-    home_groups,
-    pastoral_team,
-    services,
-    vision,
-)
-
-settings = get_settings()
-
-# Setup structured logging
-setup_logging(
-    level=settings.log_level,
-    json_format=settings.log_json_format,
-    app_name="lr-website-backend"
-)
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.deadline import DeadlineMiddleware
+from app.middleware.lazy import LazyRouterMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.stale import StaleContentMiddleware
+from app.middleware.timing import RequestLoggingMiddleware
+from app.responses import FastJSONResponse
+from app.services.rate_limit import get_bucket_store
+
+
+# URL prefix -> (module in app.routers, OpenAPI tag)
+ROUTERS = {
+    "/api/articles": ("articles", "Articles"),
+    "/api/boutique": ("boutique", "Boutique"),
+    "/api/church-info": ("church_info", "Church Info"),
+    "/api/events": ("events", "Events"),
+    "/api/home-groups": ("home_groups", "Home Groups"),
+    "/api/pastoral-team": ("pastoral_team", "Pastoral Team"),
+    "/api/services": ("services", "Services"),
+    "/api/vision": ("vision", "Vision"),
+    "/api/changes": ("changes", "Changes"),
+    "/api/stream": ("stream", "Stream"),
+    "/api/cache": ("cache", "Cache"),
+}
 
 logger = get_logger(__name__)
 
-# Initialize rate limiter
-# Default: 60 requests per minute per IP
-limiter = Limiter(key_func=get_remote_address, default_limits=["60/minute"])
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
+    settings = get_settings()
     logger.info("Starting Église LaRencontre API", extra={
         "version": "0.1.0",
         "log_level": settings.log_level,
-        "rate_limit": "60/minute",
+        "rate_limit": settings.rate_limit_cheap if settings.rate_limit_enabled else None,
     })
     yield
+    # Imported here so lazy startup doesn't pull httpx in before it's needed
+    from app.services.http_client import close_http_client
+    await close_http_client()
     logger.info("Shutting down Église LaRencontre API")
 
 
-app = FastAPI(
-    title="Église LaRencontre API",
-    description="Backend API for the LaRencontre church website",
-    version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    lifespan=lifespan,
-)
+def include_router(app: FastAPI, prefix: str, module: str, tag: str) -> None:
+    """Import a router module and mount it under ``prefix``."""
+    router = importlib.import_module(f"app.routers.{module}").router
+    app.include_router(router, prefix=prefix, tags=[tag])
+
 
-# Register rate limiter with app
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+def configure_logging() -> None:
+    """Set up structured logging from the settings (again in each forked worker)."""
+    settings = get_settings()
+    setup_logging(
+        level=settings.log_level,
+        json_format=settings.log_json_format,
+        app_name="lr-website-backend",
+        async_logging=settings.log_async,
+        queue_size=settings.log_queue_size,
+        sample_rate=settings.log_sample_rate,
+    )
 
 
-# Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all incoming requests with timing."""
-    start_time = time.time()
+def create_app(lazy: bool | None = None) -> FastAPI:
+    """
+    Build the application.
     
-    # Process request
-    response = await call_next(request)
+    Args:
+        lazy: Import each router (with its models and services, and httpx) on
+            the first request to its prefix instead of up front, for faster
+            worker spawns and cold starts. Defaults to the LAZY_STARTUP setting.
+    """
+    settings = get_settings()
+    if lazy is None:
+        lazy = settings.lazy_startup
     
-    # Calculate duration
-    duration_ms = (time.time() - start_time) * 1000
+    configure_logging()
     
-    # Log request (skip health checks to reduce noise)
-    if request.url.path != "/api/health":
-        logger.info(
-            f"{request.method} {request.url.path}",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "query": str(request.query_params),
-                "status_code": response.status_code,
-                "duration_ms": round(duration_ms, 2),
-            }
+    app = FastAPI(
+        title="Église LaRencontre API",
+        description="Backend API for the LaRencontre church website",
+        version="0.1.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        lifespan=lifespan,
+        default_response_class=FastJSONResponse,
+    )
+    
+    # Rate limit per client IP (cheap cached routes vs routes that can miss upstream)
+    if settings.rate_limit_enabled:
+        app.add_middleware(
+            RateLimitMiddleware,
+            store=get_bucket_store(),
+            cheap_rate=settings.rate_limit_cheap,
+            expensive_rate=settings.rate_limit_expensive,
+            expensive_paths=tuple(settings.rate_limit_expensive_paths_list),
+            trusted_proxies=settings.trusted_proxies,
         )
     
-    return response
-
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(articles.router, prefix="/api/articles", tags=["Articles"])
-app.include_router(boutique.router, prefix="/api/boutique", tags=["Boutique"])
-app.include_router(church_info.router, prefix="/api/church-info", tags=["Church Info"])
-app.include_router(events.router, prefix="/api/events", tags=["Events"])
-app.include_router(home_groups.router, prefix="/api/home-groups", tags=["Home Groups"])
-app.include_router(pastoral_team.router, prefix="/api/pastoral-team", tags=["Pastoral Team"])
-app.include_router(services.router, prefix="/api/services", tags=["Services"])
-app.include_router(vision.router, prefix="/api/vision", tags=["Vision"])
+    # Bound the time each request may spend waiting on Google
+    if settings.request_deadline_seconds > 0:
+        app.add_middleware(DeadlineMiddleware, seconds=settings.request_deadline_seconds)
+    
+    # Flag responses served from the last good snapshot during upstream outages
+    app.add_middleware(StaleContentMiddleware)
+    
+    # Log all requests with timing (including rate-limited ones)
+    app.add_middleware(RequestLoggingMiddleware)
+    
+    # Compress large responses (compressed bodies are cached per content digest)
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_min_size)
+    
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins_list,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    # Include routers (in lazy mode, on the first request to each prefix)
+    if lazy:
+        app.add_middleware(
+            LazyRouterMiddleware,
+            prefixes=list(ROUTERS),
+            load=lambda prefix: include_router(app, prefix, *ROUTERS[prefix]),
+            load_all_paths=(app.openapi_url, app.docs_url, app.redoc_url),
+        )
+    else:
+        for prefix, (module, tag) in ROUTERS.items():
+            include_router(app, prefix, module, tag)
+    
+    @app.get("/api/health", tags=["Health"])
+    async def health_check():
+        """Health check endpoint."""
+        return {"status": "healthy", "service": "lr-website-backend"}
+    
+    return app
 
 
-@app.get("/api/health", tags=["Health"])
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "lr-website-backend"}
+def __getattr__(name: str):
+    # `app` is built on first access (e.g. by uvicorn), so importing this module
+    # stays cheap; `uvicorn app.main:create_app --factory` works too
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,79 @@
+"""Response compression middleware serving precompressed bodies."""
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.compression import compress, get_compressed, is_compressible, negotiate_encoding
+
+
+class CompressionMiddleware:
+    """
+    Compress complete response bodies according to Accept-Encoding.
+
+    Unlike Starlette's GZipMiddleware, bodies are not compressed on every
+    request: the compressed copy is looked up by content digest (see
+    ``compression.get_compressed``), except for ``Cache-Control: no-store``
+    responses. Streaming responses, already-encoded
+    responses and bodies below ``minimum_size`` are passed through untouched.
+    Bodies that would be compressed for other clients carry
+    ``Vary: Accept-Encoding`` even when sent uncompressed, so shared caches
+    don't hand them to clients that could take the compressed one (and the
+    other way round).
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start_message: Message | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                # Hold the headers back until we know what the body looks like
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+                or not is_compressible(headers.get("content-type", ""))
+            ):
+                await send(start)
+                await send(message)
+                return
+
+            headers.add_vary_header("Accept-Encoding")
+            if encoding is None:
+                await send(start)
+                await send(message)
+                return
+
+            if "no-store" in headers.get("cache-control", ""):
+                # Private (e.g. preview) bodies stay out of the shared compressed cache
+                compressed = compress(body, encoding)
+            else:
+                compressed = get_compressed(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
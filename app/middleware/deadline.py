@@ -0,0 +1,24 @@
+"""Per-request deadline for upstream calls."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.services.request_context import set_deadline
+
+
+class DeadlineMiddleware:
+    """
+    Start a deadline for each request.
+
+    Every upstream fetch made while handling the request gets at most the time
+    left on it, so a slow Google export can't hold a request (and a worker
+    slot) past ``seconds`` no matter how many calls the route makes.
+    """
+
+    def __init__(self, app: ASGIApp, seconds: float) -> None:
+        self.app = app
+        self.seconds = seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            set_deadline(self.seconds)
+        await self.app(scope, receive, send)
@@ -0,0 +1,43 @@
+"""Mount routers on first use."""
+
+from collections.abc import Callable, Iterable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class LazyRouterMiddleware:
+    """
+    Call ``load(prefix)`` the first time a request path falls under ``prefix``.
+
+    Lets the app start without importing its routers (and everything they
+    import); each one is mounted just before its first request is routed.
+    Requests for ``load_all_paths`` (the OpenAPI schema and docs) load every
+    router so the schema is complete.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        prefixes: Iterable[str],
+        load: Callable[[str], None],
+        load_all_paths: Iterable[str | None] = (),
+    ) -> None:
+        self.app = app
+        self.pending = set(prefixes)
+        self.load = load
+        self.load_all_paths = {path for path in load_all_paths if path}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.pending and scope["type"] in ("http", "websocket"):
+            path = scope["path"]
+            if path in self.load_all_paths:
+                for prefix in sorted(self.pending):
+                    self._load(prefix)
+            else:
+                for prefix in [p for p in self.pending if path == p or path.startswith(p + "/")]:
+                    self._load(prefix)
+        await self.app(scope, receive, send)
+
+    def _load(self, prefix: str) -> None:
+        self.load(prefix)
+        self.pending.discard(prefix)
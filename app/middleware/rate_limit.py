@@ -0,0 +1,63 @@
+"""Token-bucket rate limiting middleware."""
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.responses import FastJSONResponse
+from app.services.rate_limit import BucketStore, client_ip, parse_networks, parse_rate
+
+
+class RateLimitMiddleware:
+    """
+    Rate limit requests per client IP with separate budgets.
+
+    Requests under one of ``expensive_paths`` (routes that may have to call
+    Google on a cache miss, like single articles) draw from the expensive
+    budget; everything else draws from the cheap budget. Client IPs are taken
+    from X-Forwarded-For when the peer is one of ``trusted_proxies``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: BucketStore,
+        cheap_rate: str = "120/minute",
+        expensive_rate: str = "20/minute",
+        expensive_paths: tuple[str, ...] = (),
+        trusted_proxies: str = "",
+        exempt_paths: tuple[str, ...] = ("/api/health",),
+    ) -> None:
+        self.app = app
+        self.store = store
+        self.budgets = {
+            "cheap": parse_rate(cheap_rate),
+            "expensive": parse_rate(expensive_rate),
+        }
+        self.expensive_paths = expensive_paths
+        self.trusted_proxies = parse_networks(trusted_proxies)
+        self.exempt_paths = exempt_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if scope["type"] != "http" or path in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        peer = scope["client"][0] if scope.get("client") else ""
+        forwarded_for = Headers(scope=scope).get("x-forwarded-for") if self.trusted_proxies else None
+        ip = client_ip(peer, forwarded_for, self.trusted_proxies)
+
+        budget = "expensive" if path.startswith(self.expensive_paths) else "cheap"
+        capacity, rate = self.budgets[budget]
+        retry_after = self.store.consume(f"{budget}:{ip}", capacity, rate)
+
+        if retry_after > 0:
+            response = FastJSONResponse(
+                {"detail": "Rate limit exceeded"},
+                status_code=429,
+                headers={"Retry-After": str(int(retry_after) + 1)},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
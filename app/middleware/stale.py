@@ -0,0 +1,31 @@
+"""Flag responses built from stale upstream data."""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.request_context import begin_request
+
+
+class StaleContentMiddleware:
+    """
+    Add ``Warning: 110 - "Response is Stale"`` when a service had to fall
+    back to its last good snapshot because the upstream was failing.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stale_sources = begin_request()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and stale_sources:
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append("Warning", '110 - "Response is Stale"')
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
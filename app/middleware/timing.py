@@ -0,0 +1,58 @@
+"""Request timing and logging middleware."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class RequestLoggingMiddleware:
+    """
+    Log all incoming requests with timing.
+
+    Implemented as a plain ASGI middleware rather than ``@app.middleware("http")``
+    so requests don't pay for BaseHTTPMiddleware's extra task and body stream
+    wrapping, and streaming responses pass through untouched. The duration
+    covers the whole response, including the body.
+    """
+
+    def __init__(self, app: ASGIApp, skip_paths: tuple[str, ...] = ("/api/health",)) -> None:
+        self.app = app
+        self.skip_paths = skip_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+
+            # Log request (skip health checks to reduce noise)
+            path = scope["path"]
+            if path not in self.skip_paths:
+                logger.info(
+                    f"{scope['method']} {path}",
+                    extra={
+                        "method": scope["method"],
+                        "path": path,
+                        "query": scope["query_string"].decode("latin-1"),
+                        "status_code": status_code,
+                        "duration_ms": round(duration_ms, 2),
+                    }
+                )
@@ -0,0 +1,36 @@
+"""Pydantic models for cache management."""
+
+from pydantic import BaseModel, model_validator
+
+
+class CacheInvalidateRequest(BaseModel):
+    """Sheet or doc edited upstream whose cached copy should be refreshed."""
+    sheet_id: str | None = None
+    doc_id: str | None = None
+
+    @model_validator(mode="after")
+    def check_target(self) -> "CacheInvalidateRequest":
+        if not self.sheet_id and not self.doc_id:
+            raise ValueError("sheet_id or doc_id is required")
+        return self
+
+
+class CacheInvalidateResponse(BaseModel):
+    """Cache keys refreshed by an invalidation."""
+    refreshed: list[str]
+
+
+class SheetRefreshMetrics(BaseModel):
+    """Adaptive refresh state of one cached sheet."""
+    cache_key: str
+    interval_seconds: float
+    generation: int
+    fetches: int
+    last_fetched_at: float | None = None
+    last_changed_at: float | None = None
+
+
+class CacheMetricsResponse(BaseModel):
+    """Response for cache metrics."""
+    entries: int
+    sheets: list[SheetRefreshMetrics]
@@ -0,0 +1,21 @@
+"""Pydantic models for incremental sync."""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class ResourceChanges(BaseModel):
+    """Changed items of one resource."""
+    resource: str  # e.g. "articles", "home_groups"
+    upserted: list[dict[str, Any]]  # Added or updated items, as served by the list endpoint
+    removed: list[str]  # Ids of items to drop (deleted, or no longer published)
+
+
+class ChangesResponse(BaseModel):
+    """Items changed since a client's last sync."""
+    generation: str  # Opaque token naming the content synced, passed as ?since= on the next sync
+    # True on a first sync, or when `since` is too old (or unknown): `upserted`
+    # then lists every item and clients should drop anything else they have
+    reset: bool
+    changes: list[ResourceChanges]
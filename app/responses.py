@@ -0,0 +1,26 @@
+"""Fast JSON response class used as the application default."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+# Headers of responses that must not be stored by shared caches (CDNs, proxies),
+# e.g. previews of unpublished content
+PRIVATE_HEADERS = {"Cache-Control": "private, no-store"}
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core's Rust serializer.
+
+    Routes can return ``FastJSONResponse(model)`` to serialize a Pydantic
+    model straight to bytes, skipping FastAPI's response_model round trip
+    (dump, re-validate, ``jsonable_encoder``, ``json.dumps``). Plain dicts
+    and lists are serialized the same way, so it also works as the app's
+    ``default_response_class``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -1,48 +1,48 @@
 """Articles API endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from app.models.articles import ArticleBase, ArticleFull, ArticleListResponse
+from app.responses import PRIVATE_HEADERS, FastJSONResponse
+from app.routers.listing import cached_response, list_response, sparse_fields
 from app.services import sheets_service, docs_service
+from app.services.filters import Equals, Order, RowFilter
 
 
 router = APIRouter()
 
+# Newest first
+FILTERS = RowFilter(order=Order("published_at", reverse=True), category=Equals("category"))
+
 
 @router.get("", response_model=ArticleListResponse)
 async def list_articles(
+    request: Request,
     category: str | None = Query(None, description="Filter by category"),
     limit: int | None = Query(None, description="Limit number of results"),
     preview: bool = Query(False, description="Include draft content for preview"),
+    fields: frozenset[str] | None = Depends(sparse_fields(ArticleBase)),
 ):
     """
     List all published articles (metadata only, no content).
     
     Use the single article endpoint to get full content.
     """
-    data = await sheets_service.get_articles()
-    
-    # Filter by status
-    if preview:
-        # Show published and draft (not archived)
-        data = [a for a in data if a.get("status", "").lower() in ("published", "draft")]
-    else:
-        # Only show published
-        data = [a for a in data if a.get("status", "").lower() == "published"]
+    snapshot = await sheets_service.get_articles(preview=preview)
+    cached = cached_response(request, snapshot)
+    if cached is not None:
+        return cached
     
-    # Filter by category if provided
-    if category:
-        data = [a for a in data if a.get("category", "").lower() == category.lower()]
-    
-    # Sort by published_at (newest first)
-    data.sort(key=lambda x: x.get("published_at", ""), reverse=True)
+    # Published (and drafts in preview), in the requested category, newest first
+    data = FILTERS.select(snapshot, preview=preview, category=category)
     
     # Limit results if specified
     if limit:
         data = data[:limit]
     
     articles = [ArticleBase(**article) for article in data]
-    return ArticleListResponse(articles=articles, total=len(articles))
+    response = ArticleListResponse(articles=articles, total=len(articles))
+    return list_response(request, snapshot, response, "articles", fields, private=preview)
 
 
 @router.get("/{slug}", response_model=ArticleFull)
@@ -53,7 +53,7 @@ async def get_article(
     """
     Get a single article by slug, including full HTML content from Google Doc.
     """
-    data = await sheets_service.get_articles()
+    data = await sheets_service.get_articles(preview=preview)
     
     # Find article by slug
     article_data = next((a for a in data if a.get("slug") == slug), None)
@@ -68,9 +68,11 @@ async def get_article(
     
     # Fetch content from Google Doc - use 'link' column for doc URL
     doc_url = article_data.get("link") or article_data.get("content")
-    content_html = await docs_service.get_article_content(doc_url)
+    content_html = await docs_service.get_article_content(
+        doc_url, preview=preview, revision=article_data.get("updated_at")
+    )
     
-    return ArticleFull(
-        **article_data,
-        content_html=content_html
+    return FastJSONResponse(
+        ArticleFull(**article_data, content_html=content_html),
+        headers=PRIVATE_HEADERS if preview else None,
     )
@@ -1,51 +1,48 @@
 """Boutique API endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from app.models.boutique import Product, ProductListResponse
+from app.routers.listing import cached_response, item_response, list_response, sparse_fields
 from app.services import sheets_service
+from app.services.filters import Equals, RowFilter
 
 
 router = APIRouter()
 
+FILTERS = RowFilter(category=Equals("category"), in_stock=Equals("is_in_stock"))
+
 
 @router.get("", response_model=ProductListResponse)
 async def list_products(
+    request: Request,
     category: str | None = Query(None, description="Filter by category"),
     in_stock: bool | None = Query(None, description="Filter by stock status"),
     preview: bool = Query(False, description="Include draft content for preview"),
+    fields: frozenset[str] | None = Depends(sparse_fields(Product)),
 ):
     """List all published products."""
-    data = await sheets_service.get_boutique()
-    
-    # Filter by status
-    if preview:
-        # Show published and draft (not archived)
-        data = [p for p in data if p.get("status", "").lower() in ("published", "draft")]
-    else:
-        # Only show published
-        data = [p for p in data if p.get("status", "").lower() == "published"]
-    
-    # Filter by category if provided
-    if category:
-        data = [p for p in data if p.get("category", "").lower() == category.lower()]
+    snapshot = await sheets_service.get_boutique(preview=preview)
+    cached = cached_response(request, snapshot)
+    if cached is not None:
+        return cached
     
-    # Filter by stock status if provided
-    if in_stock is not None:
-        stock_value = "TRUE" if in_stock else "FALSE"
-        data = [p for p in data if p.get("is_in_stock", "").upper() == stock_value]
+    # Published (and drafts in preview), in the requested category and stock status
+    data = FILTERS.select(snapshot, preview=preview, category=category, in_stock=in_stock)
     
     products = [Product(**product) for product in data]
-    return ProductListResponse(products=products, total=len(products))
+    response = ProductListResponse(products=products, total=len(products))
+    return list_response(request, snapshot, response, "products", fields, private=preview)
 
 
 @router.get("/{product_id}", response_model=Product)
 async def get_product(
+    request: Request,
     product_id: str,
     preview: bool = Query(False, description="Allow viewing draft products"),
 ):
     """Get a single product by ID."""
-    data = await sheets_service.get_boutique()
+    data = await sheets_service.get_boutique(preview=preview)
     
     product_data = next((p for p in data if p.get("id") == product_id), None)
     
@@ -57,4 +54,7 @@ async def get_product(
     if not preview and status != "published":
         raise HTTPException(status_code=404, detail="Product not found")
     
-    return Product(**product_data)
+    cached = cached_response(request, product_data)
+    if cached is not None:
+        return cached
+    return item_response(request, product_data, Product(**product_data), private=preview)
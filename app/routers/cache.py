@@ -0,0 +1,71 @@
+"""Cache management API endpoints."""
+
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from app.config import get_settings
+from app.models.cache import (
+    CacheInvalidateRequest,
+    CacheInvalidateResponse,
+    CacheMetricsResponse,
+    SheetRefreshMetrics,
+)
+from app.responses import FastJSONResponse
+from app.services import sheets_service, docs_service
+from app.services.cache_service import get_cache
+from app.services.change_tracker import tracker_metrics
+
+
+router = APIRouter()
+
+
+def verify_webhook_secret(authorization: str | None = Header(None)) -> None:
+    """Require ``Authorization: Bearer <CACHE_WEBHOOK_SECRET>``."""
+    secret = get_settings().cache_webhook_secret
+    if not secret:
+        raise HTTPException(status_code=503, detail="Cache invalidation is not configured")
+    
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), secret.encode()):
+        raise HTTPException(status_code=401, detail="Invalid webhook secret")
+
+
+@router.post(
+    "/invalidate",
+    response_model=CacheInvalidateResponse,
+    dependencies=[Depends(verify_webhook_secret)],
+)
+async def invalidate(request: CacheInvalidateRequest):
+    """
+    Refresh the cached copy of an edited sheet or doc.
+    
+    Meant to be called by an Apps Script trigger when editors change content,
+    so edits show up immediately instead of after the cache TTL. Only the
+    affected snapshot is refetched; if Google fails, the previous one is kept.
+    """
+    refreshed = []
+    if request.sheet_id:
+        refreshed += await sheets_service.refresh_sheet(request.sheet_id)
+    if request.doc_id:
+        refreshed += await docs_service.refresh_doc(request.doc_id)
+    
+    return FastJSONResponse(CacheInvalidateResponse(refreshed=refreshed))
+
+
+@router.get(
+    "/metrics",
+    response_model=CacheMetricsResponse,
+    dependencies=[Depends(verify_webhook_secret)],
+)
+async def metrics():
+    """
+    Get cache size and the refresh interval learned for each sheet.
+    
+    Protected by the same secret as the invalidation webhook.
+    """
+    sheets = [
+        SheetRefreshMetrics(cache_key=key, **values)
+        for key, values in tracker_metrics().items()
+    ]
+    return FastJSONResponse(CacheMetricsResponse(entries=len(get_cache().keys()), sheets=sheets))
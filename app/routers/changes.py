@@ -0,0 +1,86 @@
+"""Incremental sync API endpoints."""
+
+import asyncio
+
+from fastapi import APIRouter, Query
+from pydantic import BaseModel
+
+from app.models.articles import ArticleBase
+from app.models.boutique import Product
+from app.models.changes import ChangesResponse, ResourceChanges
+from app.models.events import Event
+from app.models.home_groups import HomeGroup
+from app.models.pastoral_team import TeamMember
+from app.models.services import Service
+from app.models.vision import VisionSection
+from app.responses import FastJSONResponse
+from app.routers import articles, boutique, events, home_groups, pastoral_team, services, vision
+from app.services import sheets_service
+from app.services.changes import get_change_log
+from app.services.filters import RowFilter
+
+
+router = APIRouter()
+
+# Resource -> (item model, filters deciding which rows are public), as used by its list endpoint.
+# church_info isn't a feed: /api/church-info serves its first row as a single
+# record, not a list of published items, so it has no items to sync by id.
+FEEDS: dict[str, tuple[type[BaseModel], RowFilter]] = {
+    "articles": (ArticleBase, articles.FILTERS),
+    "boutique": (Product, boutique.FILTERS),
+    "events": (Event, events.FILTERS),
+    "home_groups": (HomeGroup, home_groups.FILTERS),
+    "pastoral_team": (TeamMember, pastoral_team.FILTERS),
+    "services": (Service, services.FILTERS),
+    "vision": (VisionSection, vision.FILTERS),
+}
+
+
+@router.get("", response_model=ChangesResponse)
+async def list_changes(
+    since: str | None = Query(None, description="Generation returned by the previous sync (omit on the first sync)"),
+):
+    """
+    Get the published items added, updated or removed since a generation.
+    
+    Lets static site builders and apps sync without refetching every list:
+    store the returned ``generation`` and pass it as ``since`` next time.
+    Items are identified by their ``id``.
+    """
+    # Fetch (or soft-refresh) every resource so the change log is current
+    await asyncio.gather(*(sheets_service.get_resource(name) for name in FEEDS))
+    
+    change_log = get_change_log()
+    generation = change_log.token()
+    # A first sync (or one older than the history, or naming content this
+    # worker never held) gets everything
+    changed = change_log.changed_since(since, FEEDS) if since else None
+    reset = changed is None
+    
+    changes = []
+    for resource, (model, filters) in FEEDS.items():
+        snapshot = change_log.snapshot(resource)
+        if snapshot is None:
+            continue
+        
+        if reset:
+            rows, removed = filters.select(snapshot), []
+        else:
+            if not changed.get(resource):
+                continue
+            public = filters.mask(snapshot)
+            positions = snapshot.ids()
+            published = {
+                key: positions[key] for key in changed[resource]
+                if key in positions and public >> positions[key] & 1
+            }
+            rows = [snapshot[position] for position in sorted(published.values())]
+            removed = sorted(changed[resource] - published.keys())
+        
+        changes.append(ResourceChanges(
+            resource=resource,
+            upserted=[model.model_validate(row).model_dump() for row in rows],
+            removed=removed,
+        ))
+    
+    return FastJSONResponse(ChangesResponse(generation=generation, reset=reset, changes=changes))
@@ -3,6 +3,7 @@
 from fastapi import APIRouter
 
 from app.models.church_info import ChurchInfo
+from app.responses import FastJSONResponse
 from app.services import sheets_service
 
 
@@ -19,7 +20,7 @@ async def get_church_info():
     data = await sheets_service.get_church_info()
     
     if not data:
-        return ChurchInfo(church_name="Église LaRencontre")
+        return FastJSONResponse(ChurchInfo(church_name="Église LaRencontre"))
     
     # Return first row (should only be one row of church info)
-    return ChurchInfo(**data[0])
+    return FastJSONResponse(ChurchInfo(**data[0]))
@@ -1,14 +1,18 @@
 """Events API endpoints."""
 
 from datetime import datetime, date
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from app.models.events import Event, EventListResponse
+from app.routers.listing import cached_response, item_response, list_response, sparse_fields
 from app.services import sheets_service
+from app.services.filters import Equals, Order, RowFilter
 
 
 router = APIRouter()
 
+FILTERS = RowFilter(order=Order("start_date"), category=Equals("category"))
+
 
 def parse_date(date_str: str | None) -> date | None:
     """Parse date string to date object."""
@@ -22,78 +26,70 @@ def parse_date(date_str: str | None) -> date | None:
 
 @router.get("", response_model=EventListResponse)
 async def list_events(
+    request: Request,
     category: str | None = Query(None, description="Filter by category"),
     limit: int | None = Query(None, description="Limit number of results"),
     preview: bool = Query(False, description="Include draft content for preview"),
+    fields: frozenset[str] | None = Depends(sparse_fields(Event)),
 ):
     """List all published events."""
-    data = await sheets_service.get_events()
-    
-    # Filter by status
-    if preview:
-        # Show published and draft (not archived)
-        data = [e for e in data if e.get("status", "").lower() in ("published", "draft")]
-    else:
-        # Only show published
-        data = [e for e in data if e.get("status", "").lower() == "published"]
-    
-    # Filter by category if provided
-    if category:
-        data = [e for e in data if e.get("category", "").lower() == category.lower()]
+    snapshot = await sheets_service.get_events(preview=preview)
+    cached = cached_response(request, snapshot)
+    if cached is not None:
+        return cached
     
-    # Sort by start_date
-    data.sort(key=lambda x: x.get("start_date", ""))
+    # Published (and drafts in preview), in the requested category, by start_date
+    data = FILTERS.select(snapshot, preview=preview, category=category)
     
     # Limit if specified
     if limit:
         data = data[:limit]
     
     events = [Event(**event) for event in data]
-    return EventListResponse(events=events, total=len(events))
+    response = EventListResponse(events=events, total=len(events))
+    return list_response(request, snapshot, response, "events", fields, private=preview)
 
 
 @router.get("/upcoming", response_model=EventListResponse)
 async def list_upcoming_events(
+    request: Request,
     limit: int = Query(5, description="Number of events to return"),
     preview: bool = Query(False, description="Include draft content for preview"),
+    fields: frozenset[str] | None = Depends(sparse_fields(Event)),
 ):
     """List upcoming events (starting from today)."""
-    data = await sheets_service.get_events()
+    snapshot = await sheets_service.get_events(preview=preview)
     
     today = date.today()
+    # The result changes at midnight even if the sheet doesn't
+    vary = (today.isoformat(),)
+    cached = cached_response(request, snapshot, vary)
+    if cached is not None:
+        return cached
     
-    # Filter by status
-    if preview:
-        # Show published and draft (not archived)
-        data = [e for e in data if e.get("status", "").lower() in ("published", "draft")]
-    else:
-        # Only show published
-        data = [e for e in data if e.get("status", "").lower() == "published"]
-    
-    # Filter to only future events
+    # Published (and drafts in preview) by start_date, then only future events
     upcoming = []
-    for event in data:
+    for event in FILTERS.select(snapshot, preview=preview):
         event_date = parse_date(event.get("start_date"))
         if event_date and event_date >= today:
             upcoming.append(event)
     
-    # Sort by start_date
-    upcoming.sort(key=lambda x: x.get("start_date", ""))
-    
     # Limit results
     upcoming = upcoming[:limit]
     
     events = [Event(**event) for event in upcoming]
-    return EventListResponse(events=events, total=len(events))
+    response = EventListResponse(events=events, total=len(events))
+    return list_response(request, snapshot, response, "events", fields, vary, private=preview)
 
 
 @router.get("/{event_id}", response_model=Event)
 async def get_event(
+    request: Request,
     event_id: str,
     preview: bool = Query(False, description="Allow viewing draft events"),
 ):
     """Get a single event by ID."""
-    data = await sheets_service.get_events()
+    data = await sheets_service.get_events(preview=preview)
     
     event_data = next((e for e in data if e.get("id") == event_id), None)
     
@@ -105,4 +101,7 @@ async def get_event(
     if not preview and status != "published":
         raise HTTPException(status_code=404, detail="Event not found")
     
-    return Event(**event_data)
+    cached = cached_response(request, event_data)
+    if cached is not None:
+        return cached
+    return item_response(request, event_data, Event(**event_data), private=preview)
@@ -1,18 +1,25 @@
 """Home Groups API endpoints."""
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query, Request
 
 from app.models.home_groups import HomeGroup, HomeGroupListResponse
+from app.routers.listing import cached_response, list_response, sparse_fields
 from app.services import sheets_service
+from app.services.filters import Contains, RowFilter
 
 
 router = APIRouter()
 
+# Rows without a status (older sheets have no such column) count as published
+FILTERS = RowFilter(missing_status="published", frequency=Contains("Fréquence"))
+
 
 @router.get("", response_model=HomeGroupListResponse)
 async def list_home_groups(
+    request: Request,
     frequency: str | None = Query(None, description="Filter by frequency (e.g., '1 fois par mois')"),
     preview: bool = Query(False, description="Include draft content for preview"),
+    fields: frozenset[str] | None = Depends(sparse_fields(HomeGroup)),
 ):
     """
     List all published home groups.
@@ -20,21 +27,16 @@ async def list_home_groups(
     Note: The sheet uses French column names which are mapped to English model fields.
     Response uses English field names (home, leaders, schedule, etc.)
     """
-    data = await sheets_service.get_home_groups()
-    
-    # Filter by status if column exists
-    if preview:
-        # Show published and draft (not archived)
-        data = [g for g in data if g.get("status", "published").lower() in ("published", "draft", "")]
-    else:
-        # Only show published (or items without status for backward compatibility)
-        data = [g for g in data if g.get("status", "published").lower() in ("published", "")]
+    snapshot = await sheets_service.get_home_groups(preview=preview)
+    cached = cached_response(request, snapshot)
+    if cached is not None:
+        return cached
     
-    # Filter by frequency if provided
-    if frequency:
-        data = [g for g in data if frequency.lower() in g.get("Fréquence", "").lower()]
+    # Published (and drafts in preview), meeting at the requested frequency
+    data = FILTERS.select(snapshot, preview=preview, frequency=frequency)
     
     # Parse using aliases (French column names) - output will use English field names
     groups = [HomeGroup.model_validate(group) for group in data]
     
-    return HomeGroupListResponse(home_groups=groups, total=len(groups))
+    response = HomeGroupListResponse(home_groups=groups, total=len(groups))
+    return list_response(request, snapshot, response, "home_groups", fields, private=preview)
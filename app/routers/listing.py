@@ -0,0 +1,112 @@
+"""Helpers shared by the list and detail endpoints: sparse fieldsets and response caching."""
+
+from typing import Any, Awaitable, Callable
+
+from fastapi import HTTPException, Query, Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from app.responses import PRIVATE_HEADERS
+
+from app.services.response_cache import get_response_cache
+
+
+def sparse_fields(item_model: type[BaseModel]) -> Callable[..., Awaitable[frozenset[str] | None]]:
+    """
+    Build a dependency parsing ``?fields=title,slug`` for a list of ``item_model``.
+    
+    Returns None when all fields are wanted; unknown field names are a 400.
+    The dependency is async so FastAPI doesn't send every list request
+    through the threadpool to parse a query string.
+    """
+    available = frozenset(item_model.model_fields)
+    
+    async def dependency(
+        fields: str | None = Query(
+            None,
+            description=f"Comma-separated item fields to return ({', '.join(item_model.model_fields)})",
+        ),
+    ) -> frozenset[str] | None:
+        if not fields:
+            return None
+        requested = frozenset(name.strip() for name in fields.split(",") if name.strip())
+        unknown = requested - available
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+        return requested or None
+    
+    return dependency
+
+
+def response_key(request: Request, vary: tuple[str, ...] = ()) -> str:
+    """Cache key for a request: path plus normalized query parameters."""
+    params = []
+    for name, value in sorted(request.query_params.multi_items()):
+        if name == "fields":
+            value = ",".join(sorted(part.strip() for part in value.split(",") if part.strip()))
+        params.append(f"{name}={value}")
+    return "|".join((request.url.path, "&".join(params), *vary))
+
+
+def cached_response(request: Request, snapshot: Any, vary: tuple[str, ...] = ()) -> Response | None:
+    """
+    Get the cached response for this request if it was rendered from ``snapshot``.
+    
+    ``snapshot`` is whatever the response was built from: the sheet's
+    snapshot for a list, or the item's row for a detail page (rows that
+    didn't change are carried over between fetches, so their responses stay
+    cached when other rows are edited).
+    """
+    body = get_response_cache().get(response_key(request, vary), snapshot)
+    if body is None:
+        return None
+    return Response(body, media_type="application/json")
+
+
+def list_response(
+    request: Request,
+    snapshot: Any,
+    model: BaseModel,
+    items_key: str,
+    fields: frozenset[str] | None,
+    vary: tuple[str, ...] = (),
+    private: bool = False,
+) -> Response:
+    """
+    Render a list response, keeping only ``fields`` of each item, and cache it.
+    
+    Args:
+        request: The current request (its path and query form the cache key)
+        snapshot: The sheet data the response was built from
+        model: The full list response model
+        items_key: Name of the list field in ``model``
+        fields: Item fields to keep (None = all)
+        vary: Extra cache key parts, for responses that depend on more than
+            the query (e.g. today's date)
+        private: The response holds preview data: don't cache it here, and
+            mark it uncacheable for CDNs and proxies
+    """
+    include = None
+    if fields is not None:
+        include = {name: True for name in type(model).model_fields}
+        include[items_key] = {"__all__": set(fields)}
+    body = type(model).__pydantic_serializer__.to_json(model, include=include)
+    
+    return _store(request, snapshot, body, vary, private)
+
+
+def item_response(request: Request, row: Any, model: BaseModel, private: bool = False) -> Response:
+    """Render a single item and cache it for as long as its ``row`` is unchanged."""
+    body = type(model).__pydantic_serializer__.to_json(model)
+    return _store(request, row, body, (), private)
+
+
+def _store(request: Request, snapshot: Any, body: bytes, vary: tuple[str, ...], private: bool) -> Response:
+    if private:
+        return Response(body, media_type="application/json", headers=PRIVATE_HEADERS)
+    
+    get_response_cache().set(response_key(request, vary), snapshot, body)
+    return Response(body, media_type="application/json")
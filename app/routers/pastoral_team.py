@@ -1,36 +1,34 @@
 """Pastoral Team API endpoints."""
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query, Request
 
 from app.models.pastoral_team import TeamMember, TeamListResponse
+from app.routers.listing import cached_response, list_response, sparse_fields
 from app.services import sheets_service
+from app.services.filters import Equals, Order, RowFilter, display_order
 
 
 router = APIRouter()
 
+FILTERS = RowFilter(order=Order("display_order", key=display_order), role=Equals("role"))
+
 
 @router.get("", response_model=TeamListResponse)
 async def list_team_members(
+    request: Request,
     role: str | None = Query(None, description="Filter by role"),
     preview: bool = Query(False, description="Include draft content for preview"),
+    fields: frozenset[str] | None = Depends(sparse_fields(TeamMember)),
 ):
     """List all published pastoral team members."""
-    data = await sheets_service.get_pastoral_team()
-    
-    # Filter by status
-    if preview:
-        # Show published and draft (not archived)
-        data = [m for m in data if m.get("status", "").lower() in ("published", "draft")]
-    else:
-        # Only show published
-        data = [m for m in data if m.get("status", "").lower() == "published"]
-    
-    # Filter by role if provided
-    if role:
-        data = [m for m in data if m.get("role", "").lower() == role.lower()]
+    snapshot = await sheets_service.get_pastoral_team(preview=preview)
+    cached = cached_response(request, snapshot)
+    if cached is not None:
+        return cached
     
-    # Sort by display_order
-    data.sort(key=lambda x: int(x.get("display_order", "999") or "999"))
+    # Published (and drafts in preview), with the requested role, by display_order
+    data = FILTERS.select(snapshot, preview=preview, role=role)
     
     team = [TeamMember(**member) for member in data]
-    return TeamListResponse(team=team, total=len(team))
+    response = TeamListResponse(team=team, total=len(team))
+    return list_response(request, snapshot, response, "team", fields, private=preview)
@@ -1,47 +1,45 @@
 """Services API endpoints."""
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query, Request
 
 from app.config import get_settings
 from app.models.services import Service, ServiceListResponse
+from app.routers.listing import cached_response, list_response, sparse_fields
 from app.services import sheets_service
+from app.services.filters import Equals, Order, RowFilter, display_order
 
 
 router = APIRouter()
 settings = get_settings()
 
+FILTERS = RowFilter(
+    order=Order("display_order", key=display_order),
+    lang=Equals("language"),
+    service_type=Equals("service_type"),
+)
+
 
 @router.get("", response_model=ServiceListResponse)
 async def list_services(
+    request: Request,
     lang: str = Query(default=None, description="Filter by language (fr, en)"),
     service_type: str | None = Query(None, description="Filter by service type"),
     preview: bool = Query(False, description="Include draft content for preview"),
+    fields: frozenset[str] | None = Depends(sparse_fields(Service)),
 ):
     """
     List all published church services.
     
     The services sheet has a language column to filter by language.
     """
-    data = await sheets_service.get_services()
-    
-    # Filter by status
-    if preview:
-        # Show published and draft (not archived)
-        data = [s for s in data if s.get("status", "").lower() in ("published", "draft")]
-    else:
-        # Only show published
-        data = [s for s in data if s.get("status", "").lower() == "published"]
-    
-    # Filter by language if provided
-    if lang:
-        data = [s for s in data if s.get("language", "").lower() == lang.lower()]
-    
-    # Filter by service_type if provided
-    if service_type:
-        data = [s for s in data if s.get("service_type", "").lower() == service_type.lower()]
+    snapshot = await sheets_service.get_services(preview=preview)
+    cached = cached_response(request, snapshot)
+    if cached is not None:
+        return cached
     
-    # Sort by display_order
-    data.sort(key=lambda x: int(x.get("display_order", "999") or "999"))
+    # Published (and drafts in preview), in the requested language and type, by display_order
+    data = FILTERS.select(snapshot, preview=preview, lang=lang, service_type=service_type)
     
     services = [Service(**service) for service in data]
-    return ServiceListResponse(services=services, total=len(services))
+    response = ServiceListResponse(services=services, total=len(services))
+    return list_response(request, snapshot, response, "services", fields, private=preview)
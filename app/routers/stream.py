@@ -0,0 +1,109 @@
+"""Live update (server-sent events) API endpoints."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.config import get_settings
+from app.services.changes import get_change_log
+from app.services.notifications import TooManySubscribersError, get_broadcaster
+
+
+router = APIRouter()
+
+# How long clients wait before reconnecting after the stream drops (ms)
+RETRY_MS = 5000
+
+
+def format_event(event: str, data: dict[str, Any], event_id: str | None = None) -> str:
+    """Format one server-sent event."""
+    lines = [f"event: {event}", f"data: {json.dumps(data, separators=(',', ':'))}"]
+    if event_id is not None:
+        lines.insert(0, f"id: {event_id}")
+    return "\n".join(lines) + "\n\n"
+
+
+def catch_up(last_event_id: str) -> list[str]:
+    """Events telling a reconnecting client which resources changed while it was away."""
+    change_log = get_change_log()
+    generation = change_log.token()
+    changed = change_log.changed_since(last_event_id)
+    
+    if changed is None:
+        return [format_event("reset", {"generation": generation}, generation)]
+    return [
+        format_event("sheet", {"resource": resource, "generation": generation}, generation)
+        for resource in sorted(changed)
+    ]
+
+
+async def event_stream(
+    last_event_id: str | None = None,
+    heartbeat: float = 15.0,
+) -> AsyncIterator[str]:
+    """
+    Subscribe and stream the notifications, with a comment line when idle.
+    
+    The subscription only exists while the generator runs, so a response
+    that fails before its body starts never holds a subscriber slot. Ends
+    once the subscriber has overflowed (or right away if the slots filled up
+    since the endpoint checked); the client then reconnects and catches up
+    from its Last-Event-ID.
+    """
+    broadcaster = get_broadcaster()
+    try:
+        subscription = broadcaster.subscribe()
+    except TooManySubscribersError:
+        yield f"retry: {RETRY_MS}\n\n"
+        return
+    
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        if last_event_id:
+            for message in catch_up(last_event_id):
+                yield message
+        
+        while not subscription.overflowed or not subscription.queue.empty():
+            try:
+                async with asyncio.timeout(heartbeat):
+                    event, data, event_id = await subscription.queue.get()
+            except TimeoutError:
+                # Keeps proxies from closing the idle connection
+                yield ": heartbeat\n\n"
+                continue
+            yield format_event(event, data, event_id)
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+@router.get("", response_class=StreamingResponse)
+async def stream(last_event_id: str | None = Header(None)):
+    """
+    Stream content change notifications as server-sent events.
+    
+    - ``sheet`` events: ``{"resource": "articles", "generation": "<token>"}``
+      when a sheet refresh changed rows (fetch them with ``/api/changes?since=``).
+      The event id is the generation, so reconnecting clients (which send it
+      back as ``Last-Event-ID``) get a ``sheet`` event per resource they
+      missed (whichever worker they reconnect to), or a ``reset`` event if
+      the history doesn't go back that far.
+    - ``doc`` events: ``{"doc_id": "...", "etag": "..."}`` when an article's
+      Google Doc content changed.
+    """
+    settings = get_settings()
+    if get_broadcaster().full:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many stream clients",
+            headers={"Retry-After": str(RETRY_MS // 1000)},
+        )
+    
+    return StreamingResponse(
+        event_stream(last_event_id, settings.stream_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
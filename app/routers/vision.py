@@ -1,31 +1,33 @@
 """Vision API endpoints."""
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query, Request
 
 from app.models.vision import VisionSection, VisionListResponse
+from app.routers.listing import cached_response, list_response, sparse_fields
 from app.services import sheets_service
+from app.services.filters import Order, RowFilter, display_order
 
 
 router = APIRouter()
 
+FILTERS = RowFilter(order=Order("display_order", key=display_order))
+
 
 @router.get("", response_model=VisionListResponse)
 async def list_vision_sections(
+    request: Request,
     preview: bool = Query(False, description="Include draft content for preview"),
+    fields: frozenset[str] | None = Depends(sparse_fields(VisionSection)),
 ):
     """List all published vision/mission sections."""
-    data = await sheets_service.get_vision()
-    
-    # Filter by status
-    if preview:
-        # Show published and draft (not archived)
-        data = [s for s in data if s.get("status", "").lower() in ("published", "draft")]
-    else:
-        # Only show published
-        data = [s for s in data if s.get("status", "").lower() == "published"]
+    snapshot = await sheets_service.get_vision(preview=preview)
+    cached = cached_response(request, snapshot)
+    if cached is not None:
+        return cached
     
-    # Sort by display_order
-    data.sort(key=lambda x: int(x.get("display_order", "999") or "999"))
+    # Published (and drafts in preview), by display_order
+    data = FILTERS.select(snapshot, preview=preview)
     
     sections = [VisionSection(**section) for section in data]
-    return VisionListResponse(sections=sections, total=len(sections))
+    response = VisionListResponse(sections=sections, total=len(sections))
+    return list_response(request, snapshot, response, "sections", fields, private=preview)
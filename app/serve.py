@@ -0,0 +1,269 @@
+"""
+Production launcher: warm the caches once, then fork the workers.
+
+``uvicorn --workers N`` spawns fresh interpreters, so every worker imports
+the app and fetches every sheet and doc on its own. This launcher does that
+work once in a master process, then forks the workers, which share those
+pages copy-on-write until they change them::
+
+    python -m app.serve --host 0.0.0.0 --port 8000 --workers 4 --loop uvloop --http httptools
+
+The master fetches every configured sheet, validates its rows against the
+API models, builds the list indexes and fetches the docs of published
+articles. It then moves all of it to the garbage collector's permanent
+generation (``gc.freeze``), so collections in the workers don't write to
+those objects and copy their pages. Later refreshes happen per worker, as
+with plain uvicorn; only what was loaded before the fork is shared.
+
+Workers that die are replaced, after a growing delay if they keep dying
+soon after starting; SIGTERM or SIGINT shuts them all down gracefully.
+"""
+
+import argparse
+import asyncio
+import gc
+import importlib.util
+import os
+import signal
+import socket
+import sys
+import time
+
+import uvicorn
+from pydantic import ValidationError
+
+from app.config import get_settings
+from app.logging_config import get_logger, stop_logging
+from app.main import configure_logging, create_app
+
+
+logger = get_logger(__name__)
+
+# Exit status of a worker whose app failed to start (the master then gives up)
+STARTUP_FAILURE = 3
+
+# Delay before replacing a worker that died within STABLE_SECONDS of starting,
+# doubled for each such exit in a row (so a worker failing on every start
+# doesn't keep the master forking in a tight loop)
+RESPAWN_DELAY = 0.5
+RESPAWN_MAX_DELAY = 30.0
+STABLE_SECONDS = 10.0
+
+# --loop / --http choice -> module it needs
+OPTIONAL_MODULES = {"uvloop": "uvloop", "httptools": "httptools"}
+
+
+async def warm() -> dict[str, int]:
+    """
+    Load every configured sheet and the docs of published articles.
+
+    Rows that don't validate against their API model are logged (they would
+    fail the requests that return them).
+
+    Returns:
+        Resource name -> number of rows loaded.
+    """
+    # Imported here so the launcher's --help stays cheap
+    from app.routers.changes import FEEDS
+    from app.services import docs_service, sheets_service
+    from app.services.http_client import close_http_client
+    from app.services.refresh import wait_for_refreshes
+
+    settings = get_settings()
+    names = [name for name in sheets_service.SHEET_RESOURCES if getattr(settings, f"sheet_id_{name}")]
+    snapshots = dict(zip(names, await asyncio.gather(*(sheets_service.get_resource(name) for name in names))))
+
+    for name, (model, filters) in FEEDS.items():
+        if name not in snapshots:
+            continue
+        # Builds the status index and sort order the list route uses
+        invalid = 0
+        for row in filters.select(snapshots[name]):
+            try:
+                model(**row)
+            except ValidationError:
+                invalid += 1
+        if invalid:
+            logger.warning(f"{invalid} published {name} rows don't validate", extra={"resource": name})
+
+    if "articles" in snapshots:
+        articles = FEEDS["articles"][1].select(snapshots["articles"])
+        await asyncio.gather(*(
+            docs_service.get_article_content(
+                article.get("link") or article.get("content"), revision=article.get("updated_at")
+            )
+            for article in articles
+        ))
+
+    await wait_for_refreshes()
+    # The client's connections belong to this event loop; workers open their own
+    await close_http_client()
+    return {name: len(snapshot) for name, snapshot in snapshots.items()}
+
+
+def bind(host: str, port: int) -> socket.socket:
+    """Open the listening socket shared by all workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def respawn_delay(early_exits: int) -> float:
+    """Seconds to wait before replacing a worker after ``early_exits`` early exits in a row."""
+    if early_exits <= 0:
+        return 0.0
+    return min(RESPAWN_MAX_DELAY, RESPAWN_DELAY * 2 ** (early_exits - 1))
+
+
+def run_worker(app, sock: socket.socket, loop: str, http: str) -> None:
+    """Serve ``app`` on ``sock`` in a forked worker, then exit the process."""
+    gc.enable()
+    # The master's log writer thread didn't survive the fork
+    configure_logging()
+    server = uvicorn.Server(uvicorn.Config(
+        app, loop=loop, http=http, lifespan="on", log_config=None, access_log=False,
+    ))
+    status = 0
+    try:
+        server.run(sockets=[sock])
+        if not server.started:
+            status = STARTUP_FAILURE
+    except BaseException:
+        logger.exception("Worker crashed")
+        status = 1
+    finally:
+        stop_logging()
+        os._exit(status)
+
+
+def serve(
+    host: str,
+    port: int,
+    workers: int,
+    loop: str = "auto",
+    http: str = "auto",
+    warm_caches: bool = True,
+    freeze: bool = True,
+) -> int:
+    """
+    Warm the caches, fork ``workers`` uvicorn workers and supervise them.
+
+    Returns:
+        The exit status for the master process.
+    """
+    # Objects allocated and freed while loading would leave holes in the
+    # shared pages; collect only once everything is loaded
+    gc.disable()
+    app = create_app(lazy=False)
+    if warm_caches:
+        rows = asyncio.run(warm())
+        logger.info("Warmed caches before forking", extra={"rows": rows})
+
+    sock = bind(host, port)
+    gc.collect()
+    if freeze:
+        gc.freeze()
+    logger.info(f"Forking {workers} workers on {host}:{port}", extra={"loop": loop, "http": http})
+    # No background writer thread may be running across fork
+    stop_logging()
+
+    # Worker pid -> time.monotonic() it was started at
+    children: dict[int, float] = {}
+    stopping = False
+    early_exits = 0
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            run_worker(app, sock, loop, http)
+        children[pid] = time.monotonic()
+
+    def shutdown(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+    for _ in range(workers):
+        spawn()
+    configure_logging()
+
+    status = 0
+    while children:
+        try:
+            pid, wait_status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if stopping:
+            continue
+
+        code = os.waitstatus_to_exitcode(wait_status)
+        if code == STARTUP_FAILURE:
+            logger.error("Worker failed to start, shutting down")
+            status = STARTUP_FAILURE
+            shutdown(signal.SIGTERM, None)
+            continue
+        if started is not None and time.monotonic() - started < STABLE_SECONDS:
+            early_exits += 1
+        else:
+            early_exits = 0
+        delay = respawn_delay(early_exits)
+        logger.warning(
+            f"Worker {pid} exited ({code}), starting a new one",
+            extra={"pid": pid, "delay": delay},
+        )
+        # In short steps: sleep() resumes after the signal handler sets ``stopping``
+        resume_at = time.monotonic() + delay
+        while not stopping and time.monotonic() < resume_at:
+            time.sleep(min(0.1, resume_at - time.monotonic()))
+        if stopping:
+            continue
+        stop_logging()
+        spawn()
+        configure_logging()
+
+    sock.close()
+    logger.info("All workers stopped")
+    return status
+
+
+def main(argv: list[str] | None = None) -> int:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=settings.serve_workers or os.cpu_count() or 1)
+    parser.add_argument("--loop", choices=("auto", "asyncio", "uvloop"), default=settings.serve_loop)
+    parser.add_argument("--http", choices=("auto", "h11", "httptools"), default=settings.serve_http)
+    parser.add_argument(
+        "--no-warm", dest="warm", action="store_false", default=settings.serve_warm,
+        help="Fork right away; each worker fills its own caches",
+    )
+    parser.add_argument(
+        "--no-gc-freeze", dest="freeze", action="store_false",
+        help="Don't freeze the loaded objects (to measure what freezing saves)",
+    )
+    args = parser.parse_args(argv)
+
+    for choice in (args.loop, args.http):
+        module = OPTIONAL_MODULES.get(choice)
+        if module and importlib.util.find_spec(module) is None:
+            parser.error(f"{choice} is not installed (pip install {module})")
+
+    return serve(args.host, args.port, args.workers, args.loop, args.http, args.warm, args.freeze)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,13 +8,28 @@ from threading import Lock
 class CacheEntry:
     """A single cache entry with value and expiration time."""
     
-    def __init__(self, value: Any, ttl_seconds: int):
+    def __init__(
+        self,
+        value: Any,
+        ttl_seconds: int,
+        stale_ttl_seconds: int = 0,
+        refresh_after_seconds: int | None = None,
+    ):
+        now = time.time()
         self.value = value
-        self.expires_at = time.time() + ttl_seconds
+        self.expires_at = now + ttl_seconds
+        # Still served until expiry, but due for a background refresh from then
+        self.refresh_at = now + refresh_after_seconds if refresh_after_seconds else self.expires_at
+        # Expired entries are kept until then as a fallback (see get_stale)
+        self.stale_until = self.expires_at + stale_ttl_seconds
     
     def is_expired(self) -> bool:
         """Check if this entry has expired."""
         return time.time() > self.expires_at
+    
+    def is_discardable(self) -> bool:
+        """Check if this entry is past its stale window and can be dropped."""
+        return time.time() > self.stale_until
 
 
 class CacheService:
@@ -42,11 +57,34 @@ class CacheService:
             if entry is None:
                 return None
             if entry.is_expired():
+                if entry.is_discardable():
+                    del self._cache[key]
+                return None
+            return entry.value
+    
+    def get_stale(self, key: str) -> Any | None:
+        """
+        Get a value even if it has expired, as long as it is within its stale window.
+        
+        Used to serve the last good data while the upstream is failing.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry.is_discardable():
                 del self._cache[key]
                 return None
             return entry.value
     
-    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+        stale_ttl: int = 0,
+        refresh_after: int | None = None,
+    ) -> None:
         """
         Set a value in the cache.
         
@@ -54,9 +92,18 @@ class CacheService:
             key: Cache key
             value: Value to store
             ttl: Optional TTL override in seconds
+            stale_ttl: How long after expiry the value stays available to get_stale
+            refresh_after: Seconds after which needs_refresh reports the entry
+                (it keeps being served until the TTL)
         """
         with self._lock:
-            self._cache[key] = CacheEntry(value, ttl or self._default_ttl)
+            self._cache[key] = CacheEntry(value, ttl or self._default_ttl, stale_ttl, refresh_after)
+    
+    def needs_refresh(self, key: str) -> bool:
+        """Check if a live entry is past its refresh time (see set)."""
+        with self._lock:
+            entry = self._cache.get(key)
+            return entry is not None and entry.refresh_at <= time.time() < entry.expires_at
     
     def delete(self, key: str) -> bool:
         """
@@ -70,6 +117,18 @@ class CacheService:
                 return True
             return False
     
+    def keys(self, prefix: str = "") -> list[str]:
+        """
+        List the keys starting with ``prefix``.
+        
+        Includes expired entries still within their stale window.
+        """
+        with self._lock:
+            return [
+                key for key, entry in self._cache.items()
+                if key.startswith(prefix) and not entry.is_discardable()
+            ]
+    
     def clear(self) -> None:
         """Clear all entries from the cache."""
         with self._lock:
@@ -77,14 +136,14 @@ class CacheService:
     
     def cleanup_expired(self) -> int:
         """
-        Remove all expired entries.
+        Remove all expired entries (once past their stale window).
         
         Returns the number of entries removed.
         """
         with self._lock:
             expired_keys = [
                 key for key, entry in self._cache.items() 
-                if entry.is_expired()
+                if entry.is_discardable()
             ]
             for key in expired_keys:
                 del self._cache[key]
@@ -0,0 +1,92 @@
+"""Learn how often each cached sheet actually changes."""
+
+import hashlib
+import time
+from threading import Lock
+from typing import Any
+
+
+class ChangeTracker:
+    """
+    Adaptive refresh interval for one cached sheet.
+    
+    Every fetch reports the content it got. While the content hash stays the
+    same the interval grows by ``growth``; when it changes the interval is
+    halved, so refreshes are spent on the sheets editors actually touch.
+    The interval always stays within [min_interval, max_interval].
+    """
+    
+    def __init__(self, interval: float, min_interval: float, max_interval: float, growth: float = 1.5):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.growth = growth
+        self.interval = self._clamp(interval)
+        self.content_hash: str | None = None
+        self.generation = 0  # Incremented on every content change
+        self.fetches = 0
+        self.last_fetched_at: float | None = None
+        self.last_changed_at: float | None = None
+        self._lock = Lock()
+    
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+    
+    def observe(self, content: bytes) -> bool:
+        """
+        Record the content of a fetch and adapt the interval.
+        
+        Returns:
+            True if the content differs from the previous fetch.
+        """
+        content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+        now = time.time()
+        with self._lock:
+            self.fetches += 1
+            self.last_fetched_at = now
+            if self.content_hash is None:
+                changed = False
+                self.generation = 1
+            elif content_hash != self.content_hash:
+                changed = True
+                self.generation += 1
+                self.last_changed_at = now
+                self.interval = self._clamp(self.interval / 2)
+            else:
+                changed = False
+                self.interval = self._clamp(self.interval * self.growth)
+            self.content_hash = content_hash
+            return changed
+    
+    def metrics(self) -> dict[str, Any]:
+        """Snapshot of this tracker's state."""
+        return {
+            "interval_seconds": round(self.interval, 1),
+            "generation": self.generation,
+            "fetches": self.fetches,
+            "last_fetched_at": self.last_fetched_at,
+            "last_changed_at": self.last_changed_at,
+        }
+
+
+# Trackers keyed by sheet cache key
+_trackers: dict[str, ChangeTracker] = {}
+
+
+def get_tracker(cache_key: str, interval: float, min_interval: float, max_interval: float) -> ChangeTracker:
+    """Get or create the tracker for a cache key, starting at ``interval``."""
+    tracker = _trackers.get(cache_key)
+    if tracker is None:
+        tracker = _trackers[cache_key] = ChangeTracker(interval, min_interval, max_interval)
+    else:
+        tracker.max_interval = max(tracker.min_interval, max_interval)  # follow TTL changes
+    return tracker
+
+
+def tracker_metrics() -> dict[str, dict[str, Any]]:
+    """Metrics for every tracked sheet, keyed by cache key."""
+    return {key: tracker.metrics() for key, tracker in sorted(_trackers.items())}
+
+
+def clear_trackers() -> None:
+    """Forget everything learned so far."""
+    _trackers.clear()
@@ -0,0 +1,151 @@
+"""Row-level change history of the sheet-backed resources."""
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from threading import Lock
+
+from app.config import get_settings
+from app.logging_config import get_logger
+from app.services.snapshot import RowDiff, Snapshot
+
+
+logger = get_logger(__name__)
+
+# Called with (previous snapshot, new snapshot, diff) when a resource's rows change
+ChangeListener = Callable[[Snapshot | None, Snapshot, RowDiff], None]
+
+
+class ChangeEntry:
+    """The rows of one resource that changed since one of its states."""
+
+    __slots__ = ("resource", "since", "ids")
+
+    def __init__(self, resource: str, since: str, ids: frozenset[str]):
+        self.resource = resource
+        self.since = since  # Digest of the resource's snapshot before the change
+        self.ids = ids
+
+
+class ChangeLog:
+    """
+    Bounded history of row changes across all resources.
+
+    Every fetch of a sheet is diffed against the previous snapshot. Each
+    resource's state is named by the digest of its snapshot (see
+    Snapshot.digest), so every worker, and the server after a restart, name
+    the same sheet content the same way. Clients remember the token of the
+    states they are up to date with (see ``token``) and ask for the ids
+    changed since.
+
+    A state this process never held (a peer worker fetched an edit this one
+    skipped) or that is older than the history is reported as unknown.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self._entries: deque[ChangeEntry] = deque(maxlen=max_entries)
+        self._states: dict[str, str] = {}  # Resource -> digest of its latest snapshot
+        self._snapshots: dict[str, Snapshot] = {}
+        self._lock = Lock()
+
+    def token(self) -> str:
+        """Opaque sync token naming the current state of every recorded resource."""
+        with self._lock:
+            return ",".join(f"{resource}:{state}" for resource, state in sorted(self._states.items()))
+
+    def record(self, resource: str, snapshot: Snapshot, diff: RowDiff) -> str | None:
+        """
+        Record the latest snapshot of a resource and the rows it changed.
+
+        Returns:
+            The new token, or None if no row changed.
+        """
+        state = snapshot.digest()
+        with self._lock:
+            self._snapshots[resource] = snapshot
+            previous = self._states.get(resource)
+            if previous is not None and not diff:
+                return None
+
+            self._states[resource] = state
+            if previous is not None:
+                self._entries.append(ChangeEntry(resource, previous, diff.changed))
+        return self.token() if diff else None
+
+    def snapshot(self, resource: str) -> Snapshot | None:
+        """The latest recorded snapshot of a resource."""
+        return self._snapshots.get(resource)
+
+    def changed_since(self, token: str, resources: Iterable[str] | None = None) -> dict[str, set[str]] | None:
+        """
+        Ids changed after the states named by ``token``, by resource.
+
+        Args:
+            token: A token from ``token`` (of any process)
+            resources: Resources to report (default: every one in the token)
+
+        Returns:
+            None if the history doesn't cover every change since then for
+            one of ``resources`` (unknown or too old state, or malformed token).
+        """
+        try:
+            states = dict(part.split(":") for part in token.split(","))
+        except ValueError:
+            return None
+
+        with self._lock:
+            changed: dict[str, set[str]] = {}
+            for resource in states if resources is None else resources:
+                since = states.get(resource)
+                if since is None or resource not in self._states:
+                    return None
+                if since == self._states[resource]:
+                    continue
+
+                ids: set[str] = set()
+                for entry in reversed(self._entries):
+                    if entry.resource != resource:
+                        continue
+                    ids.update(entry.ids)
+                    if entry.since == since:
+                        changed[resource] = ids
+                        break
+                else:
+                    return None
+            return changed
+
+    def clear(self) -> None:
+        """Forget all history."""
+        with self._lock:
+            self._entries.clear()
+            self._states.clear()
+            self._snapshots.clear()
+
+
+# Resource -> listeners keeping caches derived from its rows up to date
+_listeners: dict[str, list[ChangeListener]] = {}
+
+
+def on_change(resource: str, listener: ChangeListener) -> None:
+    """Call ``listener`` whenever a fetch of ``resource`` changes rows."""
+    _listeners.setdefault(resource, []).append(listener)
+
+
+def notify_change(resource: str, previous: Snapshot | None, snapshot: Snapshot, diff: RowDiff) -> None:
+    """Run the listeners of ``resource`` (a failing listener doesn't stop the others)."""
+    for listener in _listeners.get(resource, ()):
+        try:
+            listener(previous, snapshot, diff)
+        except Exception:
+            logger.exception(f"Change listener failed for {resource}", extra={"resource": resource})
+
+
+# Global change log instance
+_change_log: ChangeLog | None = None
+
+
+def get_change_log() -> ChangeLog:
+    """Get or create the global change log."""
+    global _change_log
+    if _change_log is None:
+        _change_log = ChangeLog(get_settings().change_history_size)
+    return _change_log
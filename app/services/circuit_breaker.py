@@ -0,0 +1,93 @@
+"""Per-host circuit breaker for upstream requests."""
+
+import time
+from threading import Lock
+
+import httpx
+
+from app.config import get_settings
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """Raised instead of sending a request while the host's circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker with exponential backoff.
+    
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast. Once the backoff has elapsed a single probe request is
+    let through (half-open): success closes the circuit, failure re-opens it
+    with the backoff doubled, up to ``max_backoff`` seconds.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 3, backoff: float = 5.0, max_backoff: float = 300.0):
+        self.failure_threshold = failure_threshold
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.state = self.CLOSED
+        self.failures = 0
+        self.open_count = 0  # Consecutive openings, drives the backoff
+        self.open_until = 0.0
+        self._lock = Lock()
+    
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() >= self.open_until:
+                self.state = self.HALF_OPEN  # Let exactly one probe through
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.open_count = 0
+    
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.open_count += 1
+                backoff = min(self.max_backoff, self.backoff * 2 ** (self.open_count - 1))
+                self.open_until = time.monotonic() + backoff
+                self.state = self.OPEN
+    
+    def abandon(self) -> None:
+        """Forget a request that was cancelled before completing (neither success nor failure)."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN  # open_until has passed, so the next request probes
+    
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)."""
+        if self.state == self.CLOSED:
+            return 0.0
+        return max(0.0, self.open_until - time.monotonic())
+
+
+# Breakers keyed by upstream host
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """Get or create the circuit breaker for a host."""
+    breaker = _breakers.get(host)
+    if breaker is None:
+        settings = get_settings()
+        breaker = _breakers[host] = CircuitBreaker(
+            failure_threshold=settings.circuit_failure_threshold,
+            backoff=settings.circuit_backoff_seconds,
+            max_backoff=settings.circuit_max_backoff_seconds,
+        )
+    return breaker
@@ -0,0 +1,204 @@
+"""Response body compression with gzip and (optionally) brotli, and compressed in-memory text."""
+
+import gzip
+import hashlib
+import zlib
+from collections import OrderedDict
+from threading import Lock
+
+try:
+    import brotli
+except ImportError:  # brotli is an optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is an optional dependency
+    zstandard = None
+
+from app.config import get_settings
+
+# Content types worth compressing (JSON responses and text/*)
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Encodings this server can produce, in order of preference."""
+    if brotli is not None:
+        return ("br", "gzip")
+    return ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """
+    Pick the best supported encoding from an Accept-Encoding header.
+
+    Honours q-values (q=0 disables an encoding) and the "*" wildcard.
+    When several encodings share the best q-value, brotli wins over gzip.
+
+    Returns None if the client accepts none of our encodings.
+    """
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+
+    best: str | None = None
+    best_q = 0.0
+    for encoding in supported_encodings():
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """Check whether a response content type should be compressed."""
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a body with the given encoding ("br" or "gzip")."""
+    settings = get_settings()
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.compression_brotli_quality)
+    # mtime=0 keeps the output deterministic for identical bodies
+    return gzip.compress(body, compresslevel=settings.compression_gzip_level, mtime=0)
+
+
+class CompressedBodies:
+    """
+    LRU cache of compressed response bodies, bounded by their total size.
+
+    Keyed by encoding and a digest of the uncompressed body, so a body that
+    was replaced (e.g. by a sheet refresh) simply ages out.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self._entries: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+        self._lock = Lock()
+        self._max_bytes = max_bytes
+        self.size = 0  # Total bytes of the stored bodies
+
+    def get(self, encoding: str, digest: bytes) -> bytes | None:
+        """Get a stored body, marking it as recently used."""
+        with self._lock:
+            compressed = self._entries.get((encoding, digest))
+            if compressed is not None:
+                self._entries.move_to_end((encoding, digest))
+            return compressed
+
+    def set(self, encoding: str, digest: bytes, compressed: bytes) -> None:
+        """Store a body, evicting the least recently used ones beyond ``max_bytes``."""
+        if len(compressed) > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop((encoding, digest), None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[(encoding, digest)] = compressed
+            self.size += len(compressed)
+            while self.size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self) -> None:
+        """Clear all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global compressed body cache instance
+_compressed_bodies: CompressedBodies | None = None
+
+
+def get_compressed_bodies() -> CompressedBodies:
+    """Get or create the global compressed body cache."""
+    global _compressed_bodies
+    if _compressed_bodies is None:
+        _compressed_bodies = CompressedBodies(get_settings().compression_cache_max_bytes)
+    return _compressed_bodies
+
+
+def get_compressed(body: bytes, encoding: str) -> bytes:
+    """
+    Get a compressed copy of a response body.
+
+    Compressed bodies are kept in a bounded LRU keyed by a digest of the
+    uncompressed body, so each distinct content generation is only
+    compressed once and repeat requests just hash and look it up.
+    """
+    digest = hashlib.blake2b(body, digest_size=16).digest()
+    bodies = get_compressed_bodies()
+
+    compressed = bodies.get(encoding, digest)
+    if compressed is None:
+        compressed = compress(body, encoding)
+        bodies.set(encoding, digest, compressed)
+    return compressed
+
+
+class CompressedText:
+    """
+    Text kept compressed in memory (zstd if available, else zlib).
+
+    Large cached strings such as article HTML are mostly markup and repeated
+    words, so they shrink several-fold; ``str()`` decompresses on access.
+    """
+
+    __slots__ = ("data", "codec", "length")
+
+    def __init__(self, text: str, level: int = 6):
+        raw = text.encode("utf-8")
+        if zstandard is not None:
+            self.codec = "zstd"
+            self.data = zstandard.ZstdCompressor(level=level).compress(raw)
+        else:
+            self.codec = "zlib"
+            self.data = zlib.compress(raw, level)
+        self.length = len(text)
+
+    def __str__(self) -> str:
+        if self.codec == "zstd":
+            raw = zstandard.ZstdDecompressor().decompress(self.data)
+        else:
+            raw = zlib.decompress(self.data)
+        return raw.decode("utf-8")
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        return f"<CompressedText {self.codec} {self.length} chars in {len(self.data)} bytes>"
+
+
+def pack_text(text: str) -> str | CompressedText:
+    """Compress text for caching if it is at least ``doc_compress_min_size`` long."""
+    settings = get_settings()
+    if 0 < settings.doc_compress_min_size <= len(text):
+        return CompressedText(text, level=settings.doc_compress_level)
+    return text
+
+
+def unpack_text(value: str | CompressedText | None) -> str | None:
+    """Get the text back from a value stored with pack_text."""
+    if isinstance(value, CompressedText):
+        return str(value)
+    return value
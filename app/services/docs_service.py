@@ -1,5 +1,6 @@
 """Service for fetching content from public Google Docs."""
 
+import hashlib
 import re
 
 import httpx
@@ -7,23 +8,43 @@ import httpx
 from app.config import get_settings
 from app.logging_config import get_logger
 from app.services.cache_service import get_cache
+from app.services.changes import on_change
+from app.services.compression import pack_text, unpack_text
+from app.services.http_client import fetch
+from app.services.notifications import get_broadcaster
+from app.services.preview import fetch_fresh
+from app.services.refresh import refresh_in_background
+from app.services.request_context import mark_stale
+from app.services.snapshot import Row, RowDiff, Snapshot
+from app.services.upstream_cache import cached_fetch, refetch
 
 
 settings = get_settings()
 cache = get_cache(settings.cache_ttl_seconds)
 logger = get_logger(__name__)
 
+# Digest of each doc's last fetched HTML, to notify stream clients of edits
+_digests: dict[str, str] = {}
 
-async def fetch_doc_html(doc_url: str, use_cache: bool = True) -> str | None:
+
+async def fetch_doc_html(
+    doc_url: str,
+    use_cache: bool = True,
+    preview: bool = False,
+    revision: str | None = None,
+) -> str | None:
     """
     Fetch HTML content from a public Google Doc.
     
     Args:
         doc_url: The Google Doc URL (edit or view link)
         use_cache: Whether to use cached data if available
+        preview: Fetch the current content for an editor (see fetch_preview_doc)
+        revision: Version of the doc the caller expects (see fetch_doc_by_id)
         
     Returns:
-        HTML content of the document, or None if fetch fails
+        HTML content of the document. If the fetch fails, the last good
+        content (flagging the response as stale), or None if there is none.
     """
     # Extract doc ID from URL
     doc_id = settings.extract_doc_id(doc_url)
@@ -31,46 +52,154 @@ async def fetch_doc_html(doc_url: str, use_cache: bool = True) -> str | None:
         logger.warning("Could not extract doc ID from URL", extra={"doc_url": doc_url})
         return None
     
-    cache_key = f"doc:{doc_id}"
-    
-    # Check cache first
-    if use_cache:
-        cached = cache.get(cache_key)
-        if cached is not None:
-            logger.debug(f"Cache hit for doc {doc_id}", extra={"doc_id": doc_id})
-            return cached
+    if preview:
+        return await fetch_preview_doc(doc_id, revision=revision)
+    return await fetch_doc_by_id(doc_id, use_cache=use_cache, revision=revision)
+
+
+def doc_cache_key(doc_id: str, revision: str | None = None) -> str:
+    """Cache key of a doc, pinned to ``revision`` if given."""
+    return f"doc:{doc_id}@{revision}" if revision else f"doc:{doc_id}"
+
+
+def _doc_keys(doc_id: str) -> list[str]:
+    """Cache keys held for a doc, every revision included (oldest first)."""
+    base = doc_cache_key(doc_id)
+    return [key for key in cache.keys(base) if key == base or key.startswith(f"{base}@")]
+
+
+def _revision(cache_key: str) -> str | None:
+    """The revision a doc cache key is pinned to (None if it isn't)."""
+    _, _, revision = cache_key.partition("@")
+    return revision or None
+
+
+async def fetch_doc_by_id(doc_id: str, use_cache: bool = True, revision: str | None = None) -> str | None:
+    """
+    Fetch HTML content from a public Google Doc by its ID.
     
-    # Fetch HTML from Google Docs
+    Args:
+        doc_id: The Google Doc ID
+        use_cache: Whether to use cached data if available
+        revision: Version of the doc the caller expects, e.g. the article's
+            ``updated_at``. Content cached for another revision isn't used,
+            so an edit recorded in the sheet shows up at once, while an
+            unchanged revision is kept for the much longer
+            ``cache_ttl_doc_revisions``.
+        
+    Returns:
+        Same as fetch_doc_html.
+    """
+    cache_key = doc_cache_key(doc_id, revision)
+    return unpack_text(await cached_fetch(
+        cache_key,
+        lambda: _load_doc(doc_id, revision),
+        lambda: _last_good_content(doc_id, cache_key),
+        use_cache=use_cache,
+    ))
+
+
+async def _load_doc(doc_id: str, revision: str | None) -> str:
+    """Fetch a doc's HTML, clean it up and cache it (see fetch_doc_by_id)."""
+    cache_key = doc_cache_key(doc_id, revision)
     export_url = settings.get_doc_html_url(doc_id)
     
     logger.debug(f"Fetching doc content", extra={"doc_id": doc_id})
     
+    response = await fetch(export_url)
+    
+    html_content = response.text
+    
+    # Clean up the HTML - extract body content and clean Google's styling
+    html_content = clean_google_doc_html(html_content)
+    
+    logger.info(f"Fetched doc content successfully", extra={
+        "doc_id": doc_id,
+        "content_length": len(html_content),
+    })
+    
+    digest = hashlib.blake2b(html_content.encode(), digest_size=8).hexdigest()
+    if _digests.get(doc_id, digest) != digest:
+        get_broadcaster().publish("doc", {"doc_id": doc_id, "etag": digest})
+    _digests[doc_id] = digest
+    
+    # Cache the result, compressed if large (kept past expiry as a fallback for outages)
+    resource = "doc_revisions" if revision else "docs"
+    cache.set(
+        cache_key, pack_text(html_content), ttl=settings.get_cache_ttl(resource),
+        stale_ttl=settings.cache_stale_ttl_seconds,
+        refresh_after=settings.get_refresh_interval(resource),
+    )
+    
+    # Other revisions are superseded (they were kept until now as a fallback)
+    for key in _doc_keys(doc_id):
+        if key != cache_key:
+            cache.delete(key)
+    
+    return html_content
+
+
+async def fetch_preview_doc(doc_id: str, revision: str | None = None) -> str | None:
+    """
+    Fetch a doc as it is right now, for editors previewing drafts.
+    
+    Reads go to Google (shared only briefly between concurrent previews) and
+    never touch the public cache. If Google fails, the public copy is
+    returned instead.
+    """
+    async def load() -> str:
+        response = await fetch(settings.get_doc_html_url(doc_id))
+        return clean_google_doc_html(response.text)
+    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(export_url, follow_redirects=True)
-            response.raise_for_status()
-            
-        html_content = response.text
-        
-        # Clean up the HTML - extract body content and clean Google's styling
-        html_content = clean_google_doc_html(html_content)
-        
-        logger.info(f"Fetched doc content successfully", extra={
-            "doc_id": doc_id,
-            "content_length": len(html_content),
-        })
-        
-        # Cache the result
-        cache.set(cache_key, html_content)
-        
-        return html_content
-        
+        return await fetch_fresh(f"doc:{doc_id}", load)
     except httpx.HTTPError as e:
-        logger.error(f"Failed to fetch doc content", extra={
+        logger.error(f"Failed to fetch doc preview", extra={
             "doc_id": doc_id,
             "error": str(e),
         })
-        return None
+        return await fetch_doc_by_id(doc_id, revision=revision)
+
+
+def _last_good_content(doc_id: str, cache_key: str) -> str | None:
+    """
+    Get the last successfully fetched HTML for a doc, flagged as stale.
+    
+    Falls back to the latest other revision still cached, so an article
+    edited during an outage keeps showing its previous content.
+    """
+    for key in [cache_key, *reversed(_doc_keys(doc_id))]:
+        stale = cache.get_stale(key)
+        if stale is not None:
+            logger.warning(f"Serving stale content for {key}", extra={"cache_key": key})
+            mark_stale(cache_key)
+            return unpack_text(stale)
+    return None
+
+
+async def refresh_doc(doc_id: str) -> list[str]:
+    """
+    Refetch a doc if it is cached, e.g. after an editor changed it.
+    
+    Only the latest cached revision is refetched (older ones are dropped
+    once it succeeds).
+    
+    Returns:
+        The cache keys that were refreshed successfully (empty if the doc
+        wasn't cached).
+    """
+    keys = _doc_keys(doc_id)
+    for key in keys:
+        cache.delete(f"failed:{key}")
+    if not keys:
+        return []
+    
+    cache_key = keys[-1]
+    try:
+        await refetch(cache_key, lambda: _load_doc(doc_id, _revision(cache_key)))
+    except httpx.HTTPError:
+        return []
+    return [cache_key]
 
 
 def clean_google_doc_html(html: str) -> str:
@@ -97,7 +226,61 @@ def clean_google_doc_html(html: str) -> str:
     return html.strip()
 
 
-async def get_article_content(doc_url: str | None, use_cache: bool = True) -> str | None:
+def article_doc(article: Row) -> tuple[str | None, str | None]:
+    """
+    The Google Doc holding an article's content (its 'link' column) and
+    the revision to cache it under (the article's ``updated_at``).
+    """
+    doc_id = settings.extract_doc_id(article.get("link") or article.get("content") or "")
+    return doc_id, article.get("updated_at") or None
+
+
+def _articles_changed(previous: Snapshot | None, articles: Snapshot, diff: RowDiff) -> None:
+    """
+    Keep cached article docs in line with the articles sheet.
+    
+    When an article's ``link`` or ``updated_at`` changes, its new revision
+    is fetched in the background (if the doc was cached), replacing the
+    old one once it succeeds. Docs of deleted or relinked articles are
+    dropped; edits to other columns or other articles leave them alone.
+    """
+    if previous is None:
+        return
+    old_ids, new_ids = previous.ids(), articles.ids()
+    
+    prefetch, drop = set(), set()
+    for key in diff.updated:
+        old, new = article_doc(previous[old_ids[key]]), article_doc(articles[new_ids[key]])
+        if old == new:
+            continue
+        if old[0] != new[0]:
+            drop.add(old[0])
+        if old[0] and _doc_keys(old[0]):
+            prefetch.add(new)
+    for key in diff.removed:
+        drop.add(article_doc(previous[old_ids[key]])[0])
+    
+    for doc_id in drop - {doc_id for doc_id, _ in prefetch} - {None}:
+        for cache_key in _doc_keys(doc_id):
+            cache.delete(cache_key)
+    for doc_id, revision in prefetch:
+        if doc_id:
+            logger.info(f"Article metadata changed, refetching doc {doc_id}", extra={"doc_id": doc_id})
+            refresh_in_background(
+                doc_cache_key(doc_id, revision),
+                lambda doc_id=doc_id, revision=revision: fetch_doc_by_id(doc_id, revision=revision),
+            )
+
+
+on_change("articles", _articles_changed)
+
+
+async def get_article_content(
+    doc_url: str | None,
+    use_cache: bool = True,
+    preview: bool = False,
+    revision: str | None = None,
+) -> str | None:
     """
     Get article content from a Google Doc URL.
     
@@ -105,4 +288,4 @@ async def get_article_content(doc_url: str | None, use_cache: bool = True) -> st
     """
     if not doc_url:
         return None
-    return await fetch_doc_html(doc_url, use_cache=use_cache)
+    return await fetch_doc_html(doc_url, use_cache=use_cache, preview=preview, revision=revision)
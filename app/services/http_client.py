@@ -0,0 +1,180 @@
+"""Shared HTTP client for upstream (Google) requests."""
+
+import asyncio
+import time
+import weakref
+from collections import deque
+
+import httpx
+
+from app.config import get_settings
+from app.services.circuit_breaker import CircuitOpenError, get_breaker
+from app.services.request_context import time_remaining
+
+
+# One pooled client per event loop (httpx connections are bound to their loop)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_transport: httpx.AsyncBaseTransport | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the pooled upstream client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(transport=_transport, follow_redirects=True)
+        _clients[loop] = client
+    return client
+
+
+class DeadlineExceededError(httpx.TimeoutException):
+    """Raised when the current request's deadline runs out before an upstream call completes."""
+
+
+class LatencyWindow:
+    """Rolling window of recent response times for one upstream host."""
+
+    def __init__(self, size: int = 200):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float, min_samples: int = 1) -> float | None:
+        """Return the ``q`` quantile in seconds, or None with too few samples."""
+        if len(self._samples) < max(1, min_samples):
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+# Response times keyed by upstream host
+_latencies: dict[str, LatencyWindow] = {}
+
+# Hedged fetches sent, and how many of them answered before the original
+hedge_stats = {"sent": 0, "won": 0}
+
+
+def get_latency_window(host: str) -> LatencyWindow:
+    """Get or create the latency window for a host."""
+    window = _latencies.get(host)
+    if window is None:
+        window = _latencies[host] = LatencyWindow()
+    return window
+
+
+async def fetch(url: str, timeout: float | None = None) -> httpx.Response:
+    """
+    GET an upstream URL through its host's circuit breaker.
+
+    The call gets ``timeout`` seconds (default ``upstream_timeout_seconds``),
+    cut down to whatever is left of the current request's deadline. With
+    hedging enabled, a second identical request is sent once the first has
+    been outstanding for the host's p95 latency, and the first good answer wins.
+
+    Transport errors, timeouts and 5xx responses count as failures; while the
+    circuit is open the request is not sent and CircuitOpenError is raised instead.
+
+    Raises:
+        httpx.HTTPError: On any failure, including non-2xx responses
+        DeadlineExceededError: If the request's deadline ran out first
+    """
+    settings = get_settings()
+    if timeout is None:
+        timeout = settings.upstream_timeout_seconds
+    clipped = False
+    remaining = time_remaining()
+    if remaining is not None and remaining < timeout:
+        if remaining <= 0:
+            raise DeadlineExceededError(f"Request deadline exceeded before fetching {url}")
+        timeout, clipped = remaining, True
+
+    host = httpx.URL(url).host
+    breaker = get_breaker(host)
+    if not breaker.allow_request():
+        raise CircuitOpenError(f"Circuit open for {host}, retrying in {breaker.retry_in():.0f}s")
+
+    latency = get_latency_window(host)
+    hedge_after = None
+    if settings.upstream_hedge_enabled and breaker.state == breaker.CLOSED:
+        hedge_after = latency.quantile(0.95, min_samples=settings.upstream_hedge_min_samples)
+
+    start = time.perf_counter()
+    try:
+        async with asyncio.timeout(timeout):
+            response = await _get(url, timeout, hedge_after)
+    except (httpx.TimeoutException, TimeoutError) as e:
+        if clipped:
+            # Our budget ran out, which says nothing about the upstream's health
+            breaker.abandon()
+            raise DeadlineExceededError(f"Request deadline exceeded fetching {url}") from e
+        breaker.record_failure()
+        if isinstance(e, httpx.TimeoutException):
+            raise
+        raise httpx.TimeoutException(f"Timed out after {timeout:.1f}s fetching {url}") from e
+    except httpx.HTTPError:
+        breaker.record_failure()
+        raise
+    except asyncio.CancelledError:
+        breaker.abandon()
+        raise
+
+    if response.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+        latency.record(time.perf_counter() - start)
+    response.raise_for_status()
+    return response
+
+
+async def _get(url: str, timeout: float, hedge_after: float | None) -> httpx.Response:
+    """Send the GET, hedging it with a duplicate after ``hedge_after`` seconds."""
+    client = get_http_client()
+    if hedge_after is None:
+        return await client.get(url, timeout=timeout)
+
+    primary = asyncio.ensure_future(client.get(url, timeout=timeout))
+    pending = {primary}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=hedge_after)
+        if done:
+            return primary.result()
+
+        hedge = asyncio.ensure_future(client.get(url, timeout=timeout))
+        hedge_stats["sent"] += 1
+        pending = {primary, hedge}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None and task.result().status_code < 500:
+                    if task is hedge:
+                        hedge_stats["won"] += 1
+                    return task.result()
+        # Both failed: report the original request's outcome
+        return primary.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def set_transport(transport: httpx.AsyncBaseTransport | None) -> None:
+    """
+    Route upstream requests through a custom transport.
+
+    Used by benchmarks and tests to serve Google from an in-process app, e.g.
+    ``set_transport(httpx.ASGITransport(app=FakeUpstream()))``. Pass None to
+    go back to the network.
+    """
+    global _transport
+    _transport = transport
+    _clients.clear()
+
+
+async def close_http_client() -> None:
+    """Close the client for the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,87 @@
+"""Fan-out of content change notifications to streaming clients."""
+
+import asyncio
+from typing import Any
+
+from app.config import get_settings
+from app.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class TooManySubscribersError(Exception):
+    """The subscriber limit is reached."""
+
+
+class Subscription:
+    """One client's queue of pending notifications."""
+
+    __slots__ = ("queue", "overflowed")
+
+    def __init__(self, size: int):
+        self.queue: asyncio.Queue[tuple[str, dict[str, Any], str | None]] = asyncio.Queue(size)
+        # Set when the client fell too far behind; it should reconnect and catch up
+        self.overflowed = False
+
+
+class Broadcaster:
+    """
+    Publish notifications to every subscriber.
+
+    Each subscriber is just a bounded queue awaited by its connection, so
+    idle clients cost no CPU. Publishing never waits: a subscriber whose
+    queue is full is flagged and dropped rather than slowing the others.
+    """
+
+    def __init__(self, max_subscribers: int = 1000, queue_size: int = 64):
+        self.max_subscribers = max_subscribers
+        self.queue_size = queue_size
+        self._subscribers: set[Subscription] = set()
+
+    def subscribe(self) -> Subscription:
+        """
+        Register a new subscriber.
+
+        Raises:
+            TooManySubscribersError: If ``max_subscribers`` are already connected.
+        """
+        if self.full:
+            raise TooManySubscribersError()
+        subscription = Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    @property
+    def full(self) -> bool:
+        """Whether ``max_subscribers`` are connected."""
+        return len(self._subscribers) >= self.max_subscribers
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber (no-op if it is already gone)."""
+        self._subscribers.discard(subscription)
+
+    def publish(self, event: str, data: dict[str, Any], event_id: str | None = None) -> None:
+        """Queue a notification for every subscriber."""
+        for subscription in list(self._subscribers):
+            try:
+                subscription.queue.put_nowait((event, data, event_id))
+            except asyncio.QueueFull:
+                subscription.overflowed = True
+                self._subscribers.discard(subscription)
+                logger.warning("Dropped a slow stream subscriber")
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+
+# Global broadcaster instance
+_broadcaster: Broadcaster | None = None
+
+
+def get_broadcaster() -> Broadcaster:
+    """Get or create the global broadcaster."""
+    global _broadcaster
+    if _broadcaster is None:
+        _broadcaster = Broadcaster(get_settings().stream_max_connections)
+    return _broadcaster
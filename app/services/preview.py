@@ -0,0 +1,37 @@
+"""Fresh upstream reads for editors previewing drafts, kept apart from public caches."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.config import get_settings
+from app.services.cache_service import CacheService
+from app.services.refresh import load_once
+
+
+settings = get_settings()
+
+# Separate from the shared cache, so previews never replace or evict the
+# snapshots serving public traffic (and public reads never see drafts early)
+cache = CacheService(default_ttl=settings.preview_cache_ttl_seconds)
+
+
+async def fetch_fresh(key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Get ``load()``'s result, at most ``preview_cache_ttl_seconds`` old.
+    
+    Concurrent calls for the same key share a single ``load()``, so an editor
+    reloading a page (or a page firing several requests) makes one upstream
+    call. Errors from ``load()`` propagate and are not cached.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+    
+    async def load_and_cache() -> Any:
+        cache.cleanup_expired()
+        value = await load()
+        cache.set(key, value, ttl=settings.preview_cache_ttl_seconds)
+        return value
+    
+    # Keyed apart from the public fetch of the same data
+    return await load_once(f"preview:{key}", load_and_cache)
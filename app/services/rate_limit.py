@@ -0,0 +1,196 @@
+"""Token-bucket rate limiting with in-process or shared-memory state."""
+
+import hashlib
+import ipaddress
+import mmap
+import os
+import struct
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+
+from app.config import get_settings
+
+
+RATE_UNITS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_rate(rate: str) -> tuple[float, float]:
+    """
+    Parse a rate string like "60/minute" into (capacity, tokens per second).
+
+    The capacity (burst size) equals the number of requests per period.
+    """
+    count, _, unit = rate.partition("/")
+    period = RATE_UNITS[unit.strip().lower()]
+    capacity = float(count)
+    return capacity, capacity / period
+
+
+def refill(tokens: float, updated: float, now: float, capacity: float, rate: float) -> float:
+    """Return the bucket level at ``now`` after refilling since ``updated``."""
+    return min(capacity, tokens + (now - updated) * rate)
+
+
+class BucketStore(ABC):
+    """Interface for token-bucket state storage."""
+
+    @abstractmethod
+    def consume(self, key: str, capacity: float, rate: float, cost: float = 1.0) -> float:
+        """
+        Try to take ``cost`` tokens from the bucket for ``key``.
+
+        Args:
+            key: Bucket key (budget name + client)
+            capacity: Maximum tokens (burst size)
+            rate: Refill rate in tokens per second
+            cost: Tokens this request costs
+
+        Returns:
+            0 if the request is allowed, otherwise seconds until it would be.
+        """
+
+
+class MemoryBucketStore(BucketStore):
+    """
+    Per-process bucket store.
+
+    Each client costs one small list entry. Past ``max_keys`` clients the
+    least recently seen one is forgotten (its next request starts from a
+    full bucket), so memory stays bounded however many clients show up.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        # key -> [tokens, updated], least recently seen first
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = Lock()
+        self._max_keys = max_keys
+
+    def consume(self, key: str, capacity: float, rate: float, cost: float = 1.0) -> float:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self._max_keys:
+                    self._buckets.popitem(last=False)
+                bucket = self._buckets[key] = [capacity, now]
+            else:
+                self._buckets.move_to_end(key)
+            tokens = refill(bucket[0], bucket[1], now, capacity, rate)
+            if tokens < cost:
+                return (cost - tokens) / rate
+            bucket[0], bucket[1] = tokens - cost, now
+            return 0.0
+
+
+class SharedMemoryBucketStore(BucketStore):
+    """
+    Bucket store in a memory-mapped file shared by all worker processes.
+
+    The file holds a fixed table of ``slots`` entries (key hash, tokens,
+    updated time), grouped in sets of ``WAYS`` slots. A key hashes to one set;
+    when the set is full the least recently used slot is recycled, so memory
+    stays fixed no matter how many clients show up. Each set is guarded by an
+    fcntl byte-range lock, so workers only contend on the same set.
+
+    ``consume`` blocks: ``lockf`` waits for the set's lock in the calling
+    thread, stalling the event loop meanwhile. The lock is only held while
+    the set's slots are read and one is written back (no allocation or I/O),
+    so waits are a few microseconds unless a worker dies holding it.
+
+    Put the file on a tmpfs (e.g. /dev/shm) so it never touches disk.
+    """
+
+    SLOT = struct.Struct("<Qdd")
+    WAYS = 4
+
+    def __init__(self, path: str, slots: int = 65536):
+        import fcntl  # POSIX only
+
+        self._fcntl = fcntl
+        self._sets = max(1, slots // self.WAYS)
+        size = self._sets * self.WAYS * self.SLOT.size
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size != size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+
+    def consume(self, key: str, capacity: float, rate: float, cost: float = 1.0) -> float:
+        key_hash = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+        set_size = self.WAYS * self.SLOT.size
+        offset = (key_hash % self._sets) * set_size
+        slots = [offset + way * self.SLOT.size for way in range(self.WAYS)]
+
+        self._fcntl.lockf(self._fd, self._fcntl.LOCK_EX, set_size, offset, os.SEEK_SET)
+        try:
+            now = time.time()
+            entries = [self.SLOT.unpack_from(self._map, slot) for slot in slots]
+            for slot, (slot_hash, tokens, updated) in zip(slots, entries):
+                if slot_hash == key_hash:
+                    break
+            else:
+                # Recycle the least recently updated slot of the set
+                slot = min(zip(slots, entries), key=lambda entry: entry[1][2])[0]
+                tokens, updated = capacity, now
+            tokens = refill(tokens, updated, now, capacity, rate)
+            if tokens >= cost:
+                self.SLOT.pack_into(self._map, slot, key_hash, tokens - cost, now)
+        finally:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN, set_size, offset, os.SEEK_SET)
+        return 0.0 if tokens >= cost else (cost - tokens) / rate
+
+
+def parse_networks(value: str) -> list[ipaddress.IPv4Network | ipaddress.IPv6Network]:
+    """Parse comma-separated IPs/CIDRs into networks."""
+    return [
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in value.split(",") if item.strip()
+    ]
+
+
+def _is_trusted(address: str, trusted: list) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted)
+
+
+def client_ip(peer: str, forwarded_for: str | None, trusted: list) -> str:
+    """
+    Determine the real client IP behind trusted reverse proxies.
+
+    X-Forwarded-For is only honoured when the direct peer is a trusted proxy.
+    The header is then walked right to left, skipping trusted hops; the first
+    untrusted address is the client (anything further left is client-supplied
+    and cannot be trusted).
+    """
+    if not forwarded_for or not _is_trusted(peer, trusted):
+        return peer
+
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop, trusted):
+            return hop
+    return hops[0] if hops else peer
+
+
+# Global bucket store instance
+_store: BucketStore | None = None
+
+
+def get_bucket_store() -> BucketStore:
+    """Get or create the bucket store configured in settings."""
+    global _store
+    if _store is None:
+        settings = get_settings()
+        if settings.rate_limit_store == "shared":
+            _store = SharedMemoryBucketStore(
+                settings.rate_limit_shared_path,
+                slots=settings.rate_limit_shared_slots,
+            )
+        else:
+            _store = MemoryBucketStore()
+    return _store
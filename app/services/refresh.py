@@ -0,0 +1,73 @@
+"""Single-flight upstream fetches: background refreshes and concurrent cache misses."""
+
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Refreshes in progress, keyed by cache key (also keeps the tasks referenced)
+_in_flight: dict[str, asyncio.Task] = {}
+
+# Fetches in progress, keyed by cache key, awaited by every concurrent caller
+_loading: dict[str, asyncio.Task] = {}
+
+
+async def load_once(key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Await ``load()``, sharing one call between concurrent callers for ``key``.
+    
+    A burst of requests missing the same cache entry (e.g. right after it
+    expired) thus makes one upstream call. Every caller gets its result or
+    its exception.
+    """
+    task = _loading.get(key)
+    if task is None:
+        task = asyncio.create_task(_load(key, load))
+        _loading[key] = task
+    # A caller giving up (e.g. client disconnect) mustn't cancel the others' fetch
+    return await asyncio.shield(task)
+
+
+async def _load(key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+    try:
+        return await load()
+    finally:
+        _loading.pop(key, None)
+
+
+def refresh_in_background(key: str, refresh: Callable[[], Awaitable[object]]) -> bool:
+    """
+    Run ``refresh()`` in a background task unless one is already running for ``key``.
+    
+    The task runs in a fresh context, so it isn't bound by the deadline of the
+    request that triggered it and can't flag that request's response as stale.
+    
+    Returns:
+        True if a refresh was started.
+    """
+    if key in _in_flight:
+        return False
+    
+    task = asyncio.create_task(_run(key, refresh), context=contextvars.Context())
+    _in_flight[key] = task
+    return True
+
+
+async def _run(key: str, refresh: Callable[[], Awaitable[object]]) -> None:
+    try:
+        await refresh()
+    except Exception:
+        logger.exception(f"Background refresh failed for {key}", extra={"cache_key": key})
+    finally:
+        _in_flight.pop(key, None)
+
+
+async def wait_for_refreshes() -> None:
+    """Wait for the background refreshes currently running (used by tests and shutdown)."""
+    while _in_flight:
+        await asyncio.gather(*_in_flight.values(), return_exceptions=True)
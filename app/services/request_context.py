@@ -0,0 +1,38 @@
+"""Per-request state shared between services and middleware."""
+
+import time
+from contextvars import ContextVar
+
+
+# Cache keys served from stale data during the current request
+_stale_sources: ContextVar[set[str] | None] = ContextVar("stale_sources", default=None)
+
+# time.monotonic() by which the current request's upstream calls must finish
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+def begin_request() -> set[str]:
+    """Start tracking a request; returns the set that collects stale sources."""
+    sources: set[str] = set()
+    _stale_sources.set(sources)
+    return sources
+
+
+def mark_stale(source: str) -> None:
+    """Record that the current request is being served stale data from ``source``."""
+    sources = _stale_sources.get()
+    if sources is not None:
+        sources.add(source)
+
+
+def set_deadline(seconds: float) -> None:
+    """Give the current request ``seconds`` to complete its upstream calls."""
+    _deadline.set(time.monotonic() + seconds)
+
+
+def time_remaining() -> float | None:
+    """Seconds left before the current request's deadline, or None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
@@ -0,0 +1,61 @@
+"""Cache of rendered API responses, tied to the snapshot they were built from."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+
+from app.config import get_settings
+
+
+class ResponseCache:
+    """
+    LRU cache of rendered response bodies.
+    
+    Each entry remembers the sheet snapshot (the cached data object) it was
+    rendered from and only hits while the service still returns that very
+    object, so a refreshed sheet invalidates its responses without any
+    bookkeeping. Keys include the query parameters, so every filter and
+    ``fields=`` projection gets its own entry.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        self._entries: OrderedDict[str, tuple[Any, bytes]] = OrderedDict()
+        self._lock = Lock()
+        self._max_entries = max_entries
+    
+    def get(self, key: str, snapshot: Any) -> bytes | None:
+        """Get the body rendered for ``key`` from ``snapshot``, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not snapshot:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key: str, snapshot: Any, body: bytes) -> None:
+        """Store a body rendered from ``snapshot``, evicting the least recently used."""
+        with self._lock:
+            self._entries[key] = (snapshot, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Clear all entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global response cache instance
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the global response cache."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(get_settings().response_cache_max_entries)
+    return _response_cache
@@ -1,13 +1,18 @@
 """Service for fetching data from public Google Sheets."""
 
-import csv
-import io
-from typing import Any
 import httpx
 
 from app.config import get_settings
 from app.logging_config import get_logger
 from app.services.cache_service import get_cache
+from app.services.change_tracker import get_tracker
+from app.services.changes import get_change_log, notify_change
+from app.services.http_client import fetch
+from app.services.notifications import get_broadcaster
+from app.services.preview import fetch_fresh
+from app.services.request_context import mark_stale
+from app.services.snapshot import EMPTY, Snapshot
+from app.services.upstream_cache import cached_fetch, refetch
 
 
 settings = get_settings()
@@ -15,41 +20,76 @@ cache = get_cache(settings.cache_ttl_seconds)
 logger = get_logger(__name__)
 
 
+# Sheet-backed resources, named like the sheet_id_* / cache_ttl_* / refresh_interval_*
+# settings, with the tab each one reads (None = first tab)
+SHEET_RESOURCES: dict[str, str | None] = {
+    "articles": None,
+    "boutique": None,
+    "church_info": None,
+    "contact": None,
+    "events": None,
+    "home_groups": "LR_WEBSITE",
+    "pastoral_team": None,
+    "services": None,
+    "vision": None,
+}
+
+
+def find_resource(sheet_id: str) -> str | None:
+    """Get the name of the resource configured with this sheet ID, if any."""
+    return next(
+        (name for name in SHEET_RESOURCES if getattr(settings, f"sheet_id_{name}") == sheet_id),
+        None,
+    )
+
+
 async def fetch_sheet_data(
     sheet_id: str,
     tab_name: str | None = None,
     use_cache: bool = True,
-    gid: str | None = None
-) -> list[dict[str, Any]]:
+    gid: str | None = None,
+    ttl: int | None = None,
+    refresh_interval: int = 0,
+) -> Snapshot:
     """
-    Fetch data from a public Google Sheet as a list of dictionaries.
+    Fetch data from a public Google Sheet as a list of dict-like rows.
     
     Args:
         sheet_id: The Google Sheet ID
         tab_name: Optional tab/sheet name within the spreadsheet
         use_cache: Whether to use cached data if available
+        ttl: Cache TTL in seconds (default: cache_ttl_seconds)
+        refresh_interval: Seconds after which a cached copy is still served but
+            refetched in the background (0 = only refetch once it expires).
+            With adaptive refresh this is only the starting point: it then
+            follows how often the sheet's content actually changes.
         
     Returns:
-        List of dictionaries where keys are column headers.
-        Returns empty list if sheet is not accessible.
+        Snapshot of rows keyed by column header (shared by all callers: don't
+        mutate it). If the sheet is not accessible, returns the last good
+        snapshot (flagging the response as stale), or an empty one if there is none.
     """
     if not sheet_id:
         logger.warning("Empty sheet_id provided")
-        return []
+        return EMPTY
     
     cache_key = f"sheet:{sheet_id}:{tab_name or 'default'}"
-    
-    # Check cache first
-    if use_cache:
-        cached = cache.get(cache_key)
-        if cached is not None:
-            logger.debug(f"Cache hit for {cache_key}", extra={
-                "cache_key": cache_key,
-                "cached_rows": len(cached),
-            })
-            return cached
-    
-    # Fetch from Google Sheets
+    return await cached_fetch(
+        cache_key,
+        lambda: _load_sheet(sheet_id, tab_name, ttl, refresh_interval),
+        lambda: _last_good_snapshot(cache_key),
+        use_cache=use_cache,
+    )
+
+
+async def _load_sheet(
+    sheet_id: str,
+    tab_name: str | None,
+    ttl: int | None,
+    refresh_interval: int,
+) -> Snapshot:
+    """Fetch a sheet, record what changed and cache it (see fetch_sheet_data)."""
+    cache_key = f"sheet:{sheet_id}:{tab_name or 'default'}"
     url = settings.get_sheet_csv_url(sheet_id, tab_name)
     
     logger.debug(f"Fetching sheet data", extra={
@@ -57,80 +97,182 @@ async def fetch_sheet_data(
         "tab_name": tab_name,
     })
     
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True, timeout=10.0)
-            response.raise_for_status()
-            
-        # Parse CSV
-        csv_text = response.text
-        reader = csv.DictReader(io.StringIO(csv_text))
-        data = list(reader)
-        
-        logger.info(f"Fetched sheet data successfully", extra={
-            "sheet_id": sheet_id,
-            "tab_name": tab_name,
-            "rows": len(data),
-        })
-        
-        # Cache the result
-        cache.set(cache_key, data)
-        
-        return data
+    response = await fetch(url)
+    
+    # Parse CSV
+    data = Snapshot.from_csv(response.text)
+    
+    logger.info(f"Fetched sheet data successfully", extra={
+        "sheet_id": sheet_id,
+        "tab_name": tab_name,
+        "rows": len(data),
+    })
+    
+    # Record which rows changed since the previous fetch (see /api/changes),
+    # keeping the previous objects for unchanged rows so caches derived
+    # from them stay valid, and invalidate what depends on changed rows
+    resource = find_resource(sheet_id)
+    if resource is not None and tab_name == SHEET_RESOURCES[resource]:
+        change_log = get_change_log()
+        previous = change_log.snapshot(resource)
+        diff = data.diff(previous)
+        data = data.carry_over(previous, diff)
+        generation = change_log.record(resource, data, diff)
+        if generation is not None:
+            notify_change(resource, previous, data, diff)
+            get_broadcaster().publish(
+                "sheet", {"resource": resource, "generation": generation}, event_id=generation,
+            )
+    
+    # Learn how often the sheet changes and refresh it accordingly
+    if refresh_interval and settings.adaptive_refresh_enabled:
+        tracker = get_tracker(
+            cache_key, refresh_interval,
+            min_interval=settings.adaptive_refresh_min_seconds,
+            max_interval=min(settings.adaptive_refresh_max_seconds, ttl or settings.cache_ttl_seconds),
+        )
+        tracker.observe(response.content)
+        refresh_interval = round(tracker.interval)
+    
+    # Cache the result (kept past expiry as a fallback for outages)
+    cache.set(
+        cache_key, data, ttl=ttl,
+        stale_ttl=settings.cache_stale_ttl_seconds,
+        refresh_after=refresh_interval,
+    )
+    return data
+
+
+def _last_good_snapshot(cache_key: str) -> Snapshot:
+    """Get the last successfully fetched data for a sheet, flagged as stale."""
+    stale = cache.get_stale(cache_key)
+    if stale is None:
+        return EMPTY
+    
+    logger.warning(f"Serving stale data for {cache_key}", extra={"cache_key": cache_key})
+    mark_stale(cache_key)
+    return stale
+
+
+async def fetch_preview_sheet(sheet_id: str, tab_name: str | None = None) -> Snapshot:
+    """
+    Fetch a sheet as it is right now, for editors previewing drafts.
+    
+    Reads go to Google (shared only briefly between concurrent previews) and
+    never touch the public cache. If Google fails, the public snapshot is
+    returned instead.
+    """
+    if not sheet_id:
+        return EMPTY
+    
+    async def load() -> Snapshot:
+        response = await fetch(settings.get_sheet_csv_url(sheet_id, tab_name))
+        return Snapshot.from_csv(response.text)
     
+    try:
+        return await fetch_fresh(f"sheet:{sheet_id}:{tab_name or 'default'}", load)
     except httpx.HTTPError as e:
-        logger.error(f"Failed to fetch sheet data", extra={
+        logger.error(f"Failed to fetch sheet preview", extra={
             "sheet_id": sheet_id,
             "tab_name": tab_name,
             "error": str(e),
         })
-        return []
+        # Through the resource definition, so the public entry keeps its TTL and refresh interval
+        resource = find_resource(sheet_id)
+        if resource is not None and tab_name == SHEET_RESOURCES[resource]:
+            return await get_resource(resource)
+        return await fetch_sheet_data(sheet_id, tab_name)
+
+
+async def refresh_sheet(sheet_id: str) -> list[str]:
+    """
+    Refetch every cached tab of a sheet, e.g. after an editor changed it.
+    
+    Tabs that were never requested are left alone: their first request
+    fetches them fresh anyway. If a refetch fails the previous snapshot is kept.
+    
+    Returns:
+        The cache keys that were refreshed successfully.
+    """
+    prefix = f"sheet:{sheet_id}:"
+    for key in cache.keys(f"failed:{prefix}"):
+        cache.delete(key)
+    
+    resource = find_resource(sheet_id)
+    ttl = settings.get_cache_ttl(resource) if resource else None
+    refresh_interval = settings.get_refresh_interval(resource) if resource else 0
+    refreshed = []
+    for cache_key in cache.keys(prefix):
+        tab_name = cache_key.removeprefix(prefix)
+        tab_name = None if tab_name == "default" else tab_name
+        try:
+            await refetch(cache_key, lambda: _load_sheet(sheet_id, tab_name, ttl, refresh_interval))
+        except httpx.HTTPError:
+            continue
+        refreshed.append(cache_key)
+    
+    logger.info(f"Refreshed sheet {sheet_id}", extra={"sheet_id": sheet_id, "keys": refreshed})
+    return refreshed
+
+
+async def get_resource(name: str, use_cache: bool = True, preview: bool = False) -> Snapshot:
+    """
+    Fetch a sheet-backed resource with its configured tab, TTL and refresh interval.
+    
+    With ``preview``, the current content is fetched for an editor instead
+    (see fetch_preview_sheet).
+    """
+    if preview:
+        return await fetch_preview_sheet(getattr(settings, f"sheet_id_{name}"), SHEET_RESOURCES[name])
+    return await fetch_sheet_data(
+        getattr(settings, f"sheet_id_{name}"),
+        tab_name=SHEET_RESOURCES[name],
+        use_cache=use_cache,
+        ttl=settings.get_cache_ttl(name),
+        refresh_interval=settings.get_refresh_interval(name),
+    )
 
 
-async def get_articles(use_cache: bool = True) -> list[dict[str, Any]]:
+async def get_articles(use_cache: bool = True, preview: bool = False) -> Snapshot:
     """Fetch articles from the articles sheet."""
-    return await fetch_sheet_data(settings.sheet_id_articles, use_cache=use_cache)
+    return await get_resource("articles", use_cache=use_cache, preview=preview)
 
 
-async def get_boutique(use_cache: bool = True) -> list[dict[str, Any]]:
+async def get_boutique(use_cache: bool = True, preview: bool = False) -> Snapshot:
     """Fetch products from the boutique sheet."""
-    return await fetch_sheet_data(settings.sheet_id_boutique, use_cache=use_cache)
+    return await get_resource("boutique", use_cache=use_cache, preview=preview)
 
 
-async def get_church_info(use_cache: bool = True) -> list[dict[str, Any]]:
+async def get_church_info(use_cache: bool = True, preview: bool = False) -> Snapshot:
     """Fetch church information from the church_info sheet."""
-    return await fetch_sheet_data(settings.sheet_id_church_info, use_cache=use_cache)
+    return await get_resource("church_info", use_cache=use_cache, preview=preview)
 
 
-async def get_contact(use_cache: bool = True) -> list[dict[str, Any]]:
+async def get_contact(use_cache: bool = True, preview: bool = False) -> Snapshot:
     """Fetch contact submissions from the contact sheet."""
-    return await fetch_sheet_data(settings.sheet_id_contact, use_cache=use_cache)
+    return await get_resource("contact", use_cache=use_cache, preview=preview)
 
 
-async def get_events(use_cache: bool = True) -> list[dict[str, Any]]:
+async def get_events(use_cache: bool = True, preview: bool = False) -> Snapshot:
     """Fetch events from the events sheet."""
-    return await fetch_sheet_data(settings.sheet_id_events, use_cache=use_cache)
+    return await get_resource("events", use_cache=use_cache, preview=preview)
 
 
-async def get_home_groups(use_cache: bool = True) -> list[dict[str, Any]]:
+async def get_home_groups(use_cache: bool = True, preview: bool = False) -> Snapshot:
     """Fetch home groups from the home_groups sheet (LR_WEBSITE tab)."""
-    return await fetch_sheet_data(
-        settings.sheet_id_home_groups, 
-        tab_name="LR_WEBSITE",
-        use_cache=use_cache
-    )
+    return await get_resource("home_groups", use_cache=use_cache, preview=preview)
 
 
-async def get_pastoral_team(use_cache: bool = True) -> list[dict[str, Any]]:
+async def get_pastoral_team(use_cache: bool = True, preview: bool = False) -> Snapshot:
     """Fetch pastoral team from the pastoral_team sheet."""
-    return await fetch_sheet_data(settings.sheet_id_pastoral_team, use_cache=use_cache)
+    return await get_resource("pastoral_team", use_cache=use_cache, preview=preview)
 
 
-async def get_services(use_cache: bool = True) -> list[dict[str, Any]]:
+async def get_services(use_cache: bool = True, preview: bool = False) -> Snapshot:
     """Fetch services from the services sheet."""
-    return await fetch_sheet_data(settings.sheet_id_services, use_cache=use_cache)
+    return await get_resource("services", use_cache=use_cache, preview=preview)
 
 
-async def get_vision(use_cache: bool = True) -> list[dict[str, Any]]:
+async def get_vision(use_cache: bool = True, preview: bool = False) -> Snapshot:
     """Fetch vision content from the vision sheet."""
-    return await fetch_sheet_data(settings.sheet_id_vision, use_cache=use_cache)
+    return await get_resource("vision", use_cache=use_cache, preview=preview)
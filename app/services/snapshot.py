@@ -0,0 +1,295 @@
+"""Compact, immutable storage for parsed sheet data."""
+
+import csv
+import hashlib
+import io
+import sys
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import Any
+
+
+class Row(Mapping[str, str | None]):
+    """
+    One sheet row, read like a dict of column header -> cell value.
+
+    Rows of a snapshot share a single header -> position index and store
+    only a tuple of cell values, instead of one dict per row repeating
+    every header.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: dict[str, int], values: tuple[str | None, ...]):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: str) -> str | None:
+        return self._values[self._index[key]]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        position = self._index.get(key)
+        return default if position is None else self._values[position]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"Row({dict(self)!r})"
+
+
+class RowDiff:
+    """Ids of the rows added, updated and removed between two snapshots of a sheet."""
+
+    __slots__ = ("added", "updated", "removed")
+
+    def __init__(self, added: frozenset[str], updated: frozenset[str], removed: frozenset[str]):
+        self.added = added
+        self.updated = updated
+        self.removed = removed
+
+    @property
+    def changed(self) -> frozenset[str]:
+        """Every id that was added, updated or removed."""
+        return self.added | self.updated | self.removed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+    def __repr__(self) -> str:
+        return f"RowDiff(added={sorted(self.added)}, updated={sorted(self.updated)}, removed={sorted(self.removed)})"
+
+
+class Snapshot(Sequence[Row]):
+    """
+    Immutable list of the rows of a sheet, as fetched at one point in time.
+
+    Cell values are deduplicated across the whole snapshot, so repeated
+    values (statuses, languages, categories, blank cells) are stored once.
+    Indexes derived from the rows are built on first use and kept with the
+    snapshot, so they are dropped along with it when the sheet is refetched.
+    """
+
+    __slots__ = ("columns", "_rows", "_derived")
+
+    def __init__(self, columns: tuple[str, ...], rows: tuple[Row, ...]):
+        self.columns = columns
+        self._rows = rows
+        self._derived: dict[Any, Any] = {}
+
+    @classmethod
+    def from_records(cls, header: Sequence[str], records: Iterator[Sequence[str]]) -> "Snapshot":
+        """
+        Build a snapshot from a header and raw records (e.g. CSV rows).
+
+        Like ``csv.DictReader``: columns with a blank header are dropped, the
+        last of several same-named columns wins, and missing trailing cells
+        are None.
+        """
+        positions = {sys.intern(name): i for i, name in enumerate(header) if name}
+        columns = tuple(positions)
+        index = {name: i for i, name in enumerate(columns)}
+        picks = tuple(positions.values())
+
+        values: dict[str, str] = {}
+        rows = []
+        for record in records:
+            if not record:
+                continue
+            width = len(record)
+            rows.append(Row(index, tuple(
+                values.setdefault(record[i], record[i]) if i < width else None
+                for i in picks
+            )))
+        return cls(columns, tuple(rows))
+
+    @classmethod
+    def from_csv(cls, text: str) -> "Snapshot":
+        """Parse CSV text whose first line is the header."""
+        reader = csv.reader(io.StringIO(text))
+        return cls.from_records(next(reader, ()), reader)
+
+    def derived(self, key: Any, build: Callable[["Snapshot"], Any]) -> Any:
+        """Get the value computed by ``build(self)``, computing it on first use."""
+        try:
+            return self._derived[key]
+        except KeyError:
+            return self._derived.setdefault(key, build(self))
+
+    def value_masks(self, column: str, missing: str = "") -> dict[str, int]:
+        """
+        Index a column: lowercased cell value -> bitset of the rows holding it.
+
+        Bit ``i`` is set for row ``i``. Rows where the cell is missing or
+        empty count as holding ``missing``.
+        """
+        def build(snapshot: "Snapshot") -> dict[str, int]:
+            masks: dict[str, int] = {}
+            for i, row in enumerate(snapshot._rows):
+                value = (row.get(column) or missing).lower()
+                masks[value] = masks.get(value, 0) | 1 << i
+            return masks
+
+        return self.derived(("value_masks", column, missing), build)
+
+    def row_ids(self) -> tuple[str, ...]:
+        """
+        Each row's id, in sheet order.
+
+        Rows are identified by their ``id`` cell, or by ``#<position>`` when
+        it is blank.
+        """
+        def build(snapshot: "Snapshot") -> tuple[str, ...]:
+            return tuple(row.get("id") or f"#{i}" for i, row in enumerate(snapshot._rows))
+
+        return self.derived("row_ids", build)
+
+    def ids(self) -> dict[str, int]:
+        """Map each row's id to its position (if several rows share an id, the last one wins)."""
+        def build(snapshot: "Snapshot") -> dict[str, int]:
+            return {key: i for i, key in enumerate(snapshot.row_ids())}
+
+        return self.derived("ids", build)
+
+    def id_groups(self) -> dict[str, tuple[int, ...]]:
+        """Map each id to the positions of every row holding it, in order."""
+        def build(snapshot: "Snapshot") -> dict[str, tuple[int, ...]]:
+            groups: dict[str, tuple[int, ...]] = {}
+            for i, key in enumerate(snapshot.row_ids()):
+                groups[key] = groups.get(key, ()) + (i,)
+            return groups
+
+        return self.derived("id_groups", build)
+
+    def digest(self) -> str:
+        """
+        Short digest of the content, the same in every process.
+
+        Like ``diff``, it ignores the order of rows and columns, so two
+        snapshots get the same digest when diffing them finds no change.
+        """
+        def build(snapshot: "Snapshot") -> str:
+            order = sorted(range(len(snapshot.columns)), key=snapshot.columns.__getitem__)
+            rows = sorted(
+                hashlib.blake2b(
+                    "\x1f".join(
+                        "\x00" if row._values[i] is None else row._values[i] for i in order
+                    ).encode(),
+                    digest_size=16,
+                ).digest()
+                for row in snapshot._rows
+            )
+            digest = hashlib.blake2b(
+                "\x1f".join(snapshot.columns[i] for i in order).encode(), digest_size=6
+            )
+            for row in rows:
+                digest.update(row)
+            return digest.hexdigest()
+
+        return self.derived("digest", build)
+
+    def diff(self, previous: "Snapshot | None") -> RowDiff:
+        """
+        Rows added, updated and removed since ``previous`` (None: every row is new).
+
+        An id held by several rows is updated when any of those rows, or
+        their number, changed. Moving rows around is not a change.
+        """
+        groups = self.id_groups()
+        if previous is None:
+            return RowDiff(frozenset(groups), frozenset(), frozenset())
+
+        old_groups = previous.id_groups()
+        same_columns = previous.columns == self.columns
+        updated = set()
+        for key in groups.keys() & old_groups.keys():
+            positions, old_positions = groups[key], old_groups[key]
+            if len(positions) != len(old_positions):
+                updated.add(key)
+                continue
+            for position, old_position in zip(positions, old_positions):
+                row, old_row = self._rows[position], previous._rows[old_position]
+                if (row._values != old_row._values) if same_columns else (row != old_row):
+                    updated.add(key)
+                    break
+        return RowDiff(
+            frozenset(groups.keys() - old_groups.keys()),
+            frozenset(updated),
+            frozenset(old_groups.keys() - groups.keys()),
+        )
+
+    def carry_over(self, previous: "Snapshot | None", diff: RowDiff) -> "Snapshot":
+        """
+        Reuse ``previous``'s objects for everything ``diff`` says is unchanged.
+
+        With no row changes and the rows in the same order, that is
+        ``previous`` itself, keeping every index and rendered response
+        derived from it valid. Otherwise unchanged rows are taken from
+        ``previous`` (when the header is the same), so caches keyed by row
+        stay valid for them.
+        """
+        if previous is None or previous.columns != self.columns:
+            return self
+        if not diff and previous.row_ids() == self.row_ids():
+            return previous
+
+        rows = list(self._rows)
+        old_groups, changed = previous.id_groups(), diff.added | diff.updated
+        for key, positions in self.id_groups().items():
+            if key not in changed:
+                for position, old_position in zip(positions, old_groups[key]):
+                    rows[position] = previous._rows[old_position]
+        return Snapshot(self.columns, tuple(rows))
+
+    @property
+    def all_mask(self) -> int:
+        """Bitset of every row."""
+        return (1 << len(self._rows)) - 1
+
+    def select(self, mask: int, order: Sequence[int] | None = None) -> list[Row]:
+        """
+        Rows whose bit is set in ``mask``.
+
+        Args:
+            mask: Bitset of the rows to return
+            order: Row positions in the order to return them (default: sheet order)
+        """
+        rows = self._rows
+        if order is None:
+            if mask == self.all_mask:
+                return list(rows)
+            return [rows[i] for i, bit in enumerate(reversed(bin(mask))) if bit == "1"]
+        if mask == self.all_mask:
+            return [rows[i] for i in order]
+        bits = bin(mask)[:1:-1]
+        return [rows[i] for i in order if i < len(bits) and bits[i] == "1"]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._rows[index])
+        return self._rows[index]
+
+    def __iter__(self) -> Iterator[Row]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Snapshot(columns={self.columns!r}, rows={len(self._rows)})"
+
+
+# Snapshot of a sheet that has no data (or couldn't be fetched)
+EMPTY = Snapshot((), ())
@@ -0,0 +1,87 @@
+"""Serve upstream data from the shared cache, with soft refreshes and outage fallbacks."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+
+from app.config import get_settings
+from app.logging_config import get_logger
+from app.services.cache_service import get_cache
+from app.services.http_client import DeadlineExceededError
+from app.services.refresh import load_once, refresh_in_background
+
+
+logger = get_logger(__name__)
+
+
+async def cached_fetch(
+    cache_key: str,
+    load: Callable[[], Awaitable[Any]],
+    fallback: Callable[[], Any],
+    use_cache: bool = True,
+) -> Any:
+    """
+    Get ``cache_key`` from the cache, or from the upstream through ``load()``.
+    
+    ``load()`` fetches the data and caches it under ``cache_key`` with its
+    own TTL and refresh interval. Concurrent misses on one key share a single
+    ``load()`` (with use_cache=False, each call makes its own). A cached
+    entry past its refresh interval is still returned, and refetched in the
+    background. When the upstream fails, ``fallback()`` is returned instead
+    (typically the last good copy, flagged as stale), and it isn't asked
+    again until the negative entry expires (see refetch).
+    
+    Args:
+        cache_key: Key ``load()`` caches the data under
+        load: Fetch, cache and return the data; raises httpx.HTTPError
+        fallback: What to return when the data can't be fetched
+        use_cache: Whether to use cached data if available
+    """
+    cache = get_cache()
+    if use_cache:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Cache hit for {cache_key}", extra={"cache_key": cache_key})
+            if cache.needs_refresh(cache_key) and cache.get(f"failed:{cache_key}") is None:
+                refresh_in_background(
+                    cache_key, lambda: cached_fetch(cache_key, load, fallback, use_cache=False)
+                )
+            return cached
+    
+        # Upstream failed recently: don't hammer it again until the negative entry expires
+        if cache.get(f"failed:{cache_key}") is not None:
+            return fallback()
+    
+    try:
+        if not use_cache:
+            return await refetch(cache_key, load)
+        return await load_once(cache_key, lambda: refetch(cache_key, load))
+    except httpx.HTTPError:
+        return fallback()
+
+
+async def refetch(cache_key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run ``load()`` for ``cache_key`` now, bypassing the cache.
+    
+    A failure is logged and, unless it is the request running out of time,
+    remembered for ``negative_cache_ttl_seconds`` (0 = never) so cached_fetch
+    doesn't retry it meanwhile; a success clears it.
+    
+    Raises:
+        httpx.HTTPError: If the upstream fetch failed.
+    """
+    cache = get_cache()
+    try:
+        value = await load()
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to fetch {cache_key}", extra={"cache_key": cache_key, "error": str(e)})
+        negative_ttl = get_settings().negative_cache_ttl_seconds
+        # Out of request budget says nothing about the upstream, so don't block retries
+        if negative_ttl and not isinstance(e, DeadlineExceededError):
+            cache.set(f"failed:{cache_key}", True, ttl=negative_ttl)
+        raise
+    
+    cache.delete(f"failed:{cache_key}")
+    return value
@@ -0,0 +1,111 @@
+"""
+Benchmark response compression: bytes on the wire and CPU per request.
+
+Compares sending an article response uncompressed, compressing it on every
+request (Starlette's GZipMiddleware) and serving the precompressed body from
+``CompressionMiddleware``.
+
+Usage:
+    python -m benchmarks.bench_compression [--requests 500]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import Response
+
+from app.middleware.compression import CompressionMiddleware
+from app.models.articles import ArticleFull
+from app.services.compression import brotli
+
+
+WORDS = (
+    "Église rencontre dimanche louange prière partage Parole famille Dieu parcours "
+    "foi espérance amour communauté grâce témoignage évangile semaine quotidien "
+    "lumière chemin vérité vie joie paix frères sœurs accueil service mission"
+).split()
+
+
+def build_article_body(paragraphs: int = 120) -> bytes:
+    """Build a realistic single-article JSON body with ``content_html``."""
+    rng = random.Random(42)
+    article = ArticleFull(
+        id="42",
+        title="Vivre la foi au quotidien",
+        slug="vivre-la-foi-au-quotidien",
+        excerpt="Quelques pistes pour garder le cap dans la semaine.",
+        author="Équipe pastorale",
+        category="enseignement",
+        status="published",
+        published_at="2024-03-10",
+        link="https://docs.google.com/document/d/abc123/edit",
+        content_html="".join(
+            f'<p class="c{rng.randint(1, 9)}"><span class="c1">'
+            + " ".join(rng.choice(WORDS) for _ in range(60))
+            + "</span></p>"
+            for _ in range(paragraphs)
+        ),
+    )
+    return article.model_dump_json().encode()
+
+
+def make_app(body: bytes):
+    """Minimal ASGI app that always returns ``body`` as JSON."""
+    async def app(scope, receive, send):
+        await Response(body, media_type="application/json")(scope, receive, send)
+    return app
+
+
+async def run(app, requests: int, accept_encoding: str) -> tuple[int, float]:
+    """Drive ``app`` directly over ASGI; return (bytes per request, CPU µs per request)."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/articles/vivre-la-foi-au-quotidien",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+        "query_string": b"",
+    }
+    sent = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal sent
+        if message["type"] == "http.response.body":
+            sent += len(message.get("body", b""))
+
+    cpu_start = time.process_time()
+    for _ in range(requests):
+        await app(scope, receive, send)
+    cpu = time.process_time() - cpu_start
+    return sent // requests, cpu / requests * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    body = build_article_body()
+    inner = make_app(body)
+    scenarios = [
+        ("identity", inner, "identity"),
+        ("gzip per request", GZipMiddleware(inner, minimum_size=1024), "gzip"),
+        ("gzip precompressed", CompressionMiddleware(inner), "gzip"),
+    ]
+    if brotli is not None:
+        scenarios.append(("br precompressed", CompressionMiddleware(inner), "br"))
+
+    print(f"Article body: {len(body)} bytes, {args.requests} requests per scenario\n")
+    print(f"{'scenario':<22}{'bytes/req':>12}{'cpu µs/req':>14}")
+    for name, app, accept in scenarios:
+        size, cpu_us = asyncio.run(run(app, args.requests, accept))
+        print(f"{name:<22}{size:>12}{cpu_us:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark the memory footprint of cached article HTML: str vs CompressedText.
+
+Builds ``--docs`` distinct cleaned article bodies from the fake upstream's
+Google Docs fixtures, stores them in a CacheService as plain strings and as
+compressed text, and reports the memory held (tracemalloc) plus the cost of
+decompressing one body on a cache hit.
+
+Usage:
+    python -m benchmarks.bench_doc_memory [--docs 1000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from app.devtools.fake_upstream import DEFAULT_FIXTURES
+from app.services import compression
+from app.services.cache_service import CacheService
+from app.services.docs_service import clean_google_doc_html
+
+
+def load_fixtures() -> list[str]:
+    """Cleaned article bodies from the doc fixtures."""
+    return [
+        clean_google_doc_html(path.read_text(encoding="utf-8"))
+        for path in sorted((DEFAULT_FIXTURES / "docs").glob("*.html"))
+    ]
+
+
+def article_body(fixtures: list[str], i: int) -> str:
+    """A distinct article body, cycling through the fixtures."""
+    return f"{fixtures[i % len(fixtures)]}<p>Article n° {i}</p>"
+
+
+def cached_bytes(fixtures: list[str], count: int, pack) -> int:
+    """Memory held by a cache of ``count`` packed bodies."""
+    cache = CacheService(default_ttl=3600)
+    tracemalloc.start()
+    for i in range(count):
+        cache.set(f"doc:article-{i}", pack(article_body(fixtures, i)))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def per_call_us(func, arg, repeat: int = 1000) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(arg)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=1000)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    sample = article_body(fixtures, 1)
+    utf8 = sum(len(article_body(fixtures, i).encode()) for i in range(args.docs))
+    print(f"{args.docs} docs, {utf8 / args.docs / 1024:.1f} KiB of UTF-8 each on average\n")
+
+    plain = cached_bytes(fixtures, args.docs, lambda body: body)
+    print(f"{'storage':<22}{'MiB':>8}{'vs str':>9}{'pack µs':>10}{'unpack µs':>11}")
+    print(f"{'str':<22}{plain / 2**20:>8.2f}{'':>9}{'':>10}{'':>11}")
+
+    codecs = [("zlib", None)]
+    if compression.zstandard is not None:
+        codecs.append(("zstd", compression.zstandard))
+    saved = compression.zstandard
+    for name, module in codecs:
+        compression.zstandard = module
+        for level in (1, 6):
+            size = cached_bytes(fixtures, args.docs, lambda body: compression.CompressedText(body, level))
+            pack_us = per_call_us(lambda body: compression.CompressedText(body, level), sample)
+            unpack_us = per_call_us(str, compression.CompressedText(sample, level))
+            print(
+                f"{f'{name} level {level}':<22}{size / 2**20:>8.2f}{size / plain:>9.0%}"
+                f"{pack_us:>10.0f}{unpack_us:>11.1f}"
+            )
+    compression.zstandard = saved
+
+
+if __name__ == "__main__":
+    main()
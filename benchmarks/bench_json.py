@@ -0,0 +1,145 @@
+"""
+Benchmark JSON serialization of the list endpoints.
+
+Compares FastAPI's default path (return the model, let FastAPI re-validate it
+against ``response_model`` and render with ``json.dumps``) with returning a
+``FastJSONResponse`` that serializes the model directly in pydantic-core.
+
+Usage:
+    python -m benchmarks.bench_json [--requests 200] [--sizes 25,200,1000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI
+
+from app.models.articles import ArticleBase, ArticleListResponse
+from app.models.boutique import Product, ProductListResponse
+from app.models.events import Event, EventListResponse
+from app.responses import FastJSONResponse
+
+
+def article_row(i: int) -> dict[str, str]:
+    return {
+        "id": str(i),
+        "title": f"Vivre la foi au quotidien — partie {i}",
+        "slug": f"vivre-la-foi-{i}",
+        "content": "Texte de l'article dans la feuille. " * 20,
+        "excerpt": "Quelques pistes pour garder le cap dans la semaine, entre travail et famille.",
+        "author": "Équipe pastorale",
+        "category": "enseignement",
+        "tags": "foi,quotidien,prière",
+        "image": f"https://drive.google.com/uc?id=img{i}",
+        "status": "published",
+        "created_at": "2024-03-01",
+        "updated_at": "2024-03-09",
+        "published_at": "2024-03-10",
+        "link": f"https://docs.google.com/document/d/doc{i}/edit",
+    }
+
+
+def event_row(i: int) -> dict[str, str]:
+    return {
+        "id": str(i),
+        "title": f"Soirée de louange {i}",
+        "description": "Un temps de louange et de prière ouvert à tous, suivi d'un moment convivial.",
+        "location": "Église LaRencontre",
+        "address": "12 rue de la Paix, 75002 Paris",
+        "start_date": f"2024-{i % 12 + 1:02d}-15",
+        "start_time": "19:30",
+        "end_time": "21:30",
+        "category": "louange",
+        "registration_required": "FALSE",
+        "status": "published",
+    }
+
+
+def product_row(i: int) -> dict[str, str]:
+    return {
+        "id": str(i),
+        "name": f"T-shirt LaRencontre {i}",
+        "description": "T-shirt en coton bio, imprimé en France.",
+        "short_description": "T-shirt coton bio",
+        "category": "vêtements",
+        "price": "20",
+        "is_in_stock": "TRUE",
+        "images": f"https://drive.google.com/uc?id=product{i}",
+        "status": "published",
+    }
+
+
+RESOURCES = {
+    "articles": (article_row, ArticleBase, ArticleListResponse, "articles"),
+    "events": (event_row, Event, EventListResponse, "events"),
+    "boutique": (product_row, Product, ProductListResponse, "products"),
+}
+
+
+def make_app(rows, item_model, list_model, key: str, fast: bool) -> FastAPI:
+    """Build a one-route app mirroring a list endpoint."""
+    app = FastAPI()
+
+    @app.get("/list", response_model=list_model)
+    async def list_items():
+        items = [item_model(**row) for row in rows]
+        response = list_model(**{key: items, "total": len(items)})
+        return FastJSONResponse(response) if fast else response
+
+    return app
+
+
+async def run(app: FastAPI, requests: int) -> tuple[float, int]:
+    """Call ``app`` over ASGI; return (µs per request, body size)."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/list",
+        "headers": [],
+        "query_string": b"",
+        "app": app,
+    }
+    size = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size = len(message.get("body", b""))
+
+    await app(dict(scope), receive, send)  # warm up
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests * 1_000_000, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--sizes", default="25,200,1000")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    print(f"{'resource':<10}{'rows':>6}{'bytes':>10}{'default µs':>13}{'fast µs':>11}{'speedup':>9}")
+    for name, (make_row, item_model, list_model, key) in RESOURCES.items():
+        for n in sizes:
+            rows = [make_row(i) for i in range(n)]
+            requests = max(10, args.requests * 25 // n)
+            default_us, size = asyncio.run(
+                run(make_app(rows, item_model, list_model, key, fast=False), requests)
+            )
+            fast_us, _ = asyncio.run(
+                run(make_app(rows, item_model, list_model, key, fast=True), requests)
+            )
+            print(
+                f"{name:<10}{n:>6}{size:>10}{default_us:>13.0f}{fast_us:>11.0f}"
+                f"{default_us / fast_us:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark the request logging middleware: BaseHTTPMiddleware vs plain ASGI.
+
+Builds two copies of the API, one with the previous ``@app.middleware("http")``
+request logger and one with ``RequestLoggingMiddleware``, and measures
+requests per second on ``/api/health`` and on ``/api/services`` served from a
+warm sheet cache.
+
+Usage:
+    python -m benchmarks.bench_middleware [--requests 2000]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from fastapi import FastAPI, Request
+
+from app.config import get_settings
+from app.logging_config import get_logger
+from app.middleware.timing import RequestLoggingMiddleware
+from app.responses import FastJSONResponse
+from app.routers import services
+from app.services.cache_service import get_cache
+from app.services.snapshot import Snapshot
+
+
+logger = get_logger(__name__)
+
+BENCH_SHEET_ID = "bench-services"
+
+
+def make_app(pure_asgi: bool) -> FastAPI:
+    """Build the app with either the old or the new request logger."""
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    if pure_asgi:
+        app.add_middleware(RequestLoggingMiddleware)
+    else:
+        @app.middleware("http")
+        async def log_requests(request: Request, call_next):
+            start_time = time.time()
+            response = await call_next(request)
+            duration_ms = (time.time() - start_time) * 1000
+            if request.url.path != "/api/health":
+                logger.info(
+                    f"{request.method} {request.url.path}",
+                    extra={
+                        "method": request.method,
+                        "path": request.url.path,
+                        "query": str(request.query_params),
+                        "status_code": response.status_code,
+                        "duration_ms": round(duration_ms, 2),
+                    }
+                )
+            return response
+
+    app.include_router(services.router, prefix="/api/services")
+
+    @app.get("/api/health")
+    async def health_check():
+        return {"status": "healthy", "service": "lr-website-backend"}
+
+    return app
+
+
+def warm_services_cache(rows: int = 20) -> None:
+    """Point the services sheet at pre-cached rows so no upstream call is made."""
+    settings = get_settings()
+    settings.sheet_id_services = BENCH_SHEET_ID
+    header = ("id", "name", "day_of_week", "start_time", "language", "display_order", "status")
+    snapshot = Snapshot.from_records(header, (
+        (str(i), f"Culte du dimanche {i}", "dimanche", "10:30", "fr" if i % 2 else "en", str(i), "published")
+        for i in range(rows)
+    ))
+    get_cache().set(f"sheet:{BENCH_SHEET_ID}:default", snapshot, ttl=3600)
+
+
+async def requests_per_second(app: FastAPI, path: str, requests: int) -> float:
+    """Send ``requests`` sequential GETs to ``path`` over ASGI."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+        "app": app,
+    }
+
+    disconnected = asyncio.Event()  # never set: the client stays connected
+
+    async def call() -> None:
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            pass
+
+        await app(dict(scope), receive, send)
+
+    for _ in range(50):  # warm up
+        await call()
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call()
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    # Keep log records flowing through the logger without writing them out
+    root = logging.getLogger()
+    root.handlers[:] = [logging.NullHandler()]
+    root.setLevel(logging.INFO)
+    warm_services_cache()
+
+    print(f"{'path':<16}{'BaseHTTP req/s':>16}{'ASGI req/s':>13}{'gain':>8}")
+    for path in ("/api/health", "/api/services"):
+        before = asyncio.run(requests_per_second(make_app(pure_asgi=False), path, args.requests))
+        after = asyncio.run(requests_per_second(make_app(pure_asgi=True), path, args.requests))
+        print(f"{path:<16}{before:>16.0f}{after:>13.0f}{after / before - 1:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
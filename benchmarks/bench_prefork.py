@@ -0,0 +1,142 @@
+"""
+Benchmark per-worker memory of the prefork launcher (``python -m app.serve``).
+
+Google is served by the fake upstream in a subprocess. For each mode the
+launcher is started with ``--workers`` workers, every list route and article
+is requested ``--rounds`` times (new connection each time, so all workers get
+traffic and fill their caches), and each worker's memory is read from
+``/proc/<pid>/smaps_rollup``:
+
+    cold       --no-warm: each worker fetches and parses everything itself
+    warm       caches loaded in the master before forking, no gc.freeze
+    frozen     warm, plus gc.freeze (the launcher's default)
+
+    RSS    resident pages, shared ones included
+    PSS    resident pages, shared ones split between the processes using them
+    USS    pages private to the worker (what each extra worker costs)
+
+Linux only.
+
+Usage:
+    python -m benchmarks.bench_prefork [--workers 4] [--rounds 20]
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+RESOURCES = (
+    "articles", "boutique", "church_info", "events",
+    "home_groups", "pastoral_team", "services", "vision",
+)
+PATHS = (
+    "/api/articles", "/api/boutique", "/api/church-info", "/api/events",
+    "/api/home-groups", "/api/pastoral-team", "/api/services", "/api/vision",
+)
+MODES = {
+    "cold": ["--no-warm"],
+    "warm": ["--no-gc-freeze"],
+    "frozen": [],
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def get(url: str, timeout: float = 5) -> bytes | None:
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.read()
+    except (urllib.error.URLError, ConnectionError):
+        return None
+
+
+def wait_until_up(url: str, process: subprocess.Popen) -> None:
+    while get(url) is None:
+        if process.poll() is not None:
+            raise RuntimeError(f"{process.args} exited during startup")
+        time.sleep(0.02)
+
+
+def memory_kib(pid: int) -> dict[str, int]:
+    """Rss, Pss and Uss (private clean + dirty) of a process, in KiB."""
+    fields = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value = line.split(":", 1)
+        fields[name] = int(value.split()[0])
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def measure(mode: str, env: dict[str, str], workers: int, rounds: int) -> list[dict[str, int]]:
+    """Start the launcher in ``mode``, drive traffic and return each worker's memory."""
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.serve", "--port", str(port), "--workers", str(workers), *MODES[mode]],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_up(f"{base}/api/health", server)
+        slugs = [article["slug"] for article in json.loads(get(f"{base}/api/articles"))["articles"]]
+        for _ in range(rounds):
+            for path in (*PATHS, *(f"/api/articles/{slug}" for slug in slugs)):
+                get(base + path)
+
+        children = Path(f"/proc/{server.pid}/task/{server.pid}/children").read_text().split()
+        return [memory_kib(int(pid)) for pid in children]
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    upstream_port = free_port()
+    upstream = subprocess.Popen(
+        [sys.executable, "-m", "app.devtools.fake_upstream", "--port", str(upstream_port)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    env = {
+        **os.environ,
+        "SHEETS_BASE_URL": f"http://127.0.0.1:{upstream_port}/spreadsheets/d",
+        "DOCS_BASE_URL": f"http://127.0.0.1:{upstream_port}/document/d",
+        "RATE_LIMIT_ENABLED": "false",
+        "LOG_LEVEL": "WARNING",
+        **{f"SHEET_ID_{name.upper()}": name for name in RESOURCES},
+    }
+    try:
+        wait_until_up(f"http://127.0.0.1:{upstream_port}/_fake/stats", upstream)
+        print(f"{args.workers} workers, per-worker average (MiB)")
+        print(f"{'mode':<8}{'RSS':>8}{'PSS':>8}{'USS':>8}{'total PSS':>11}")
+        for mode in MODES:
+            workers = measure(mode, env, args.workers, args.rounds)
+            average = {key: sum(w[key] for w in workers) / len(workers) / 1024 for key in ("rss", "pss", "uss")}
+            total = sum(w["pss"] for w in workers) / 1024
+            print(f"{mode:<8}{average['rss']:>8.1f}{average['pss']:>8.1f}{average['uss']:>8.1f}{total:>11.1f}")
+    finally:
+        upstream.terminate()
+        upstream.wait()
+
+
+if __name__ == "__main__":
+    main()
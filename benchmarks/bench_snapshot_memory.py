@@ -0,0 +1,93 @@
+"""
+Benchmark the memory held by cached sheet snapshots: list of dicts vs Snapshot.
+
+Scales the fake upstream's home groups and articles fixtures up to ``--rows``
+rows (distinct ids and titles, the other cells repeated as in a real sheet),
+then parses each export with ``csv.DictReader`` (the previous storage) and with
+``Snapshot.from_csv``, reporting the memory held (tracemalloc), the parse time
+and the cost of reading a column from every row.
+
+Usage:
+    python -m benchmarks.bench_snapshot_memory [--rows 5000]
+"""
+
+import argparse
+import csv
+import io
+import time
+import tracemalloc
+
+from app.devtools.fake_upstream import DEFAULT_FIXTURES
+from app.services.snapshot import Snapshot
+
+# Sheet fixture -> (column made unique per row, column read in the access test)
+SHAPES = {
+    "home_groups": ("HOME", "Fréquence"),
+    "articles": ("title", "status"),
+}
+
+
+def scaled_csv(name: str, rows: int) -> str:
+    """The fixture sheet repeated up to ``rows`` rows, with distinct ids."""
+    unique_column = SHAPES[name][0]
+    records = list(csv.reader(io.StringIO((DEFAULT_FIXTURES / "sheets" / f"{name}.csv").read_text(encoding="utf-8"))))
+    header, body = records[0], records[1:]
+    id_at, unique_at = header.index("id"), header.index(unique_column)
+
+    output = io.StringIO()
+    writer = csv.writer(output, quoting=csv.QUOTE_ALL, lineterminator="\n")
+    writer.writerow(header)
+    for i in range(rows):
+        record = list(body[i % len(body)])
+        record[id_at] = str(i + 1)
+        record[unique_at] = f"{record[unique_at]} {i}"
+        writer.writerow(record)
+    return output.getvalue()
+
+
+def parse_dicts(text: str) -> list[dict]:
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def held_bytes(parse, text: str) -> int:
+    """Memory still allocated once ``parse(text)`` returned (the cached value)."""
+    tracemalloc.start()
+    data = parse(text)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return size
+
+
+def best_ms(func, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'shape':<13}{'storage':<12}{'MiB':>8}{'vs dicts':>10}{'parse ms':>10}{'scan ms':>9}")
+    for name, (_, column) in SHAPES.items():
+        text = scaled_csv(name, args.rows)
+        baseline = None
+        for label, parse in (("dicts", parse_dicts), ("Snapshot", Snapshot.from_csv)):
+            size = held_bytes(parse, text)
+            baseline = baseline or size
+            parse_ms = best_ms(lambda: parse(text))
+            data = parse(text)
+            scan_ms = best_ms(lambda: [row.get(column, "").lower() for row in data])
+            print(
+                f"{name:<13}{label:<12}{size / 2**20:>8.2f}{size / baseline:>10.0%}"
+                f"{parse_ms:>10.1f}{scan_ms:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
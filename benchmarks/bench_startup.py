@@ -0,0 +1,112 @@
+"""
+Benchmark app startup: import cost and time to first response, eager vs lazy.
+
+For each mode (LAZY_STARTUP=false/true) this reports:
+
+    import     total ``-X importtime`` of building ``app.main:app`` in a fresh
+               interpreter, plus the slowest modules by self time
+    first      wall time from spawning uvicorn to the first 200 response on
+               each ``--path`` (median of ``--runs`` server starts)
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 5] [--path /api/health --path /api/events]
+    python -m benchmarks.bench_startup --raw     # print the full -X importtime tree
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BUILD_APP = "import app.main; app.main.app"
+
+
+def mode_env(lazy: bool) -> dict[str, str]:
+    return {**os.environ, "LAZY_STARTUP": "true" if lazy else "false", "LOG_LEVEL": "WARNING"}
+
+
+def import_times(lazy: bool) -> list[tuple[int, int, str]]:
+    """Run ``-X importtime`` and return (self us, cumulative us, module) rows."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BUILD_APP],
+        cwd=ROOT, env=mode_env(lazy), capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_response(lazy: bool, paths: list[str]) -> list[float]:
+    """Start uvicorn and time (from spawn) the first 200 on each path, in order."""
+    port = free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=mode_env(lazy), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        timings = []
+        for path in paths:
+            while True:
+                try:
+                    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=5) as response:
+                        if response.status == 200:
+                            break
+                except (urllib.error.URLError, ConnectionError):
+                    if server.poll() is not None:
+                        raise RuntimeError("uvicorn exited during startup")
+                    time.sleep(0.002)
+            timings.append(time.perf_counter() - start)
+        return timings
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", action="append", help="Paths to time, in order (default: /api/health, /api/events)")
+    parser.add_argument("--top", type=int, default=8, help="Slowest modules to list")
+    parser.add_argument("--raw", action="store_true", help="Print the full -X importtime output")
+    args = parser.parse_args()
+    paths = args.path or ["/api/health", "/api/events"]
+
+    for lazy in (False, True):
+        mode = "lazy" if lazy else "eager"
+        rows = import_times(lazy)
+        # Top-level imports have no indentation; their cumulative times add up to the total
+        total_ms = sum(cumulative for _, cumulative, name in rows if not name.startswith("  ")) / 1000
+        print(f"\n[{mode}] import + build: {total_ms:.1f} ms, {len(rows)} modules")
+        if args.raw:
+            for self_us, cumulative_us, name in rows:
+                print(f"  {self_us:>8} {cumulative_us:>8} {name}")
+        else:
+            for self_us, _, name in sorted(rows, reverse=True)[:args.top]:
+                print(f"  {self_us / 1000:7.1f} ms  {name.strip()}")
+
+        runs = [time_to_first_response(lazy, paths) for _ in range(args.runs)]
+        for i, path in enumerate(paths):
+            median = statistics.median(run[i] for run in runs) * 1000
+            print(f"  first {path:<20} {median:8.1f} ms after spawn (median of {args.runs})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark upstream fetch latency with hedging and request deadlines.
+
+Google is served by the in-process fake upstream with a slow tail (by default
+3% of responses take an extra 300 ms). Measures:
+
+    plain      sequential fetches, no hedging
+    hedged     the same with a second request sent after the host's p95
+    deadline   fetches against an always-slow upstream under a request deadline
+
+Usage:
+    python -m benchmarks.bench_upstream [--requests 400] [--slow-rate 0.03] [--slow-ms 300]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.config import get_settings
+from app.devtools.fake_upstream import FakeUpstream, FakeUpstreamConfig
+from app.services import http_client
+from app.services.http_client import DeadlineExceededError, fetch, set_transport
+from app.services.request_context import set_deadline
+
+
+def percentiles(samples: list[float]) -> str:
+    ms = sorted(s * 1000 for s in samples)
+    cuts = statistics.quantiles(ms, n=100, method="inclusive")
+    return f"p50 {statistics.median(ms):7.1f}  p95 {cuts[94]:7.1f}  p99 {cuts[98]:7.1f}  max {ms[-1]:7.1f} ms"
+
+
+async def run_fetches(host: str, requests: int, warmup: int) -> list[float]:
+    for i in range(warmup):  # fill the host's latency window
+        await fetch(f"http://{host}/document/d/article-{i % 12 + 1}/export")
+    samples = []
+    for i in range(requests):
+        start = time.perf_counter()
+        await fetch(f"http://{host}/document/d/article-{i % 12 + 1}/export")
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def run_deadline(host: str, requests: int, deadline: float) -> tuple[list[float], int]:
+    samples, expired = [], 0
+    for _ in range(requests):
+        set_deadline(deadline)
+        start = time.perf_counter()
+        try:
+            await fetch(f"http://{host}/document/d/article-1/export")
+        except DeadlineExceededError:
+            expired += 1
+        samples.append(time.perf_counter() - start)
+    return samples, expired
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--slow-rate", type=float, default=0.03)
+    parser.add_argument("--slow-ms", type=float, default=300.0)
+    parser.add_argument("--deadline-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    upstream = FakeUpstream(config=FakeUpstreamConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        slow_rate=args.slow_rate,
+        slow_ms=args.slow_ms,
+    ))
+    set_transport(httpx.ASGITransport(app=upstream))
+
+    for mode, hedge in (("plain", False), ("hedged", True)):
+        settings.upstream_hedge_enabled = hedge
+        warmup = settings.upstream_hedge_min_samples
+        before = upstream.stats["requests"]
+        hedges = dict(http_client.hedge_stats)
+        samples = asyncio.run(run_fetches(f"upstream-{mode}", args.requests, warmup))
+        extra = upstream.stats["requests"] - before - args.requests - warmup
+        won = http_client.hedge_stats["won"] - hedges["won"]
+        print(f"{mode:<9}{percentiles(samples)}  extra upstream requests {extra} ({won} hedges won)")
+
+    settings.upstream_hedge_enabled = False
+    upstream.config = FakeUpstreamConfig(latency_ms=args.latency_ms, slow_rate=1.0, slow_ms=2000)
+    samples, expired = asyncio.run(run_deadline("upstream-deadline", 20, args.deadline_ms / 1000))
+    print(f"{'deadline':<9}{percentiles(samples)}  {expired}/20 cut off at {args.deadline_ms:.0f} ms (upstream takes 2 s)")
+
+    set_transport(None)
+
+
+if __name__ == "__main__":
+    main()
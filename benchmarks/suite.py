@@ -0,0 +1,274 @@
+"""
+End-to-end performance benchmark suite with regression thresholds.
+
+Drives the ASGI app in-process (``httpx.ASGITransport``) while Google is
+served by the in-process fake upstream, and reports p50/p99 latency for:
+
+    cold_miss:<route>     first request after the cache has been cleared
+    warm_hit:<route>      requests served from a warm cache (plus req/s)
+    contention:<route>    concurrent requests racing on a cold cache (5 ms upstream)
+    large_sheet_parse     cold fetch + CSV parse of a 5000-row articles sheet
+
+Usage:
+    python -m benchmarks.suite                      # run and print results
+    python -m benchmarks.suite --save-baseline      # write benchmarks/baselines/suite.json
+    python -m benchmarks.suite --check              # exit 1 if p50/p99 regressed
+
+The suite is run ``--repeat`` times (default 5) and the median of each
+number is kept: unlike the best run, it comes out about the same every time
+on a noisy machine, so checking a commit twice gives the same verdict.
+Contention scenarios swing the most (they measure the scheduler as much as
+the app) and get their own, wider ``--contention-threshold``.
+
+Baselines are machine specific: regenerate them on the machine that runs
+``--check`` (e.g. the CI runner) whenever the hardware changes.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+RESOURCES = (
+    "articles", "boutique", "church_info", "events",
+    "home_groups", "pastoral_team", "services", "vision",
+)
+
+# Configure the app before it is imported: Google is the in-process fake upstream,
+# and rate limiting / request logs would only measure themselves here.
+os.environ["SHEETS_BASE_URL"] = "http://upstream/spreadsheets/d"
+os.environ["DOCS_BASE_URL"] = "http://upstream/document/d"
+for _resource in RESOURCES:
+    os.environ[f"SHEET_ID_{_resource.upper()}"] = _resource
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx  # noqa: E402
+
+from app.devtools.fake_upstream import FakeUpstream  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services import sheets_service  # noqa: E402
+from app.services.cache_service import get_cache  # noqa: E402
+from app.services.changes import get_change_log  # noqa: E402
+from app.services.http_client import close_http_client, set_transport  # noqa: E402
+from app.services.response_cache import get_response_cache  # noqa: E402
+
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "suite.json"
+
+ROUTES = {
+    "articles": "/api/articles",
+    "article_detail": "/api/articles/vivre-la-foi-au-quotidien",
+    "boutique": "/api/boutique",
+    "church_info": "/api/church-info",
+    "events": "/api/events",
+    "home_groups": "/api/home-groups",
+    "pastoral_team": "/api/pastoral-team",
+    "services": "/api/services",
+    "vision": "/api/vision",
+}
+
+
+def summarize(samples: list[float], **extra) -> dict[str, float]:
+    """Summarize latency samples (seconds) as p50/p99 in milliseconds."""
+    ms = sorted(s * 1000 for s in samples)
+    p99 = statistics.quantiles(ms, n=100, method="inclusive")[98] if len(ms) > 1 else ms[0]
+    return {"p50_ms": round(statistics.median(ms), 3), "p99_ms": round(p99, 3), **extra}
+
+
+def large_articles_csv(rows: int = 5000) -> str:
+    """Build a large articles sheet export."""
+    header = "id,title,slug,content,excerpt,author,category,tags,image,status,created_at,updated_at,published_at,link\n"
+    lines = [
+        f'{i},"Article {i}",article-{i},"Contenu de l\'article {i}","Résumé {i}",Équipe pastorale,'
+        f"enseignement,\"foi,église\",https://drive.google.com/uc?id=img{i},published,"
+        f"2026-01-01,2026-01-02,2026-01-03,https://docs.google.com/document/d/doc-{i}/edit\n"
+        for i in range(rows)
+    ]
+    return header + "".join(lines)
+
+
+def clear_caches() -> None:
+    """
+    Forget every cached snapshot, doc and rendered response.
+
+    The change log goes too: otherwise a refetch of an unchanged sheet
+    carries over the previous snapshot, and its cached responses with it.
+    """
+    for cache in (get_cache(), get_response_cache(), get_change_log()):
+        cache.clear()
+
+
+async def timed_get(client: httpx.AsyncClient, path: str) -> float:
+    start = time.perf_counter()
+    response = await client.get(path)
+    elapsed = time.perf_counter() - start
+    response.raise_for_status()
+    return elapsed
+
+
+async def run_suite(quick: bool = False) -> dict[str, dict[str, float]]:
+    """Run every scenario and return results keyed by scenario name."""
+    upstream = FakeUpstream()
+    upstream.sheets["articles_large"] = large_articles_csv()
+    set_transport(httpx.ASGITransport(app=upstream))
+
+    cold_runs, warm_runs, contention_rounds, concurrency = (5, 50, 2, 20) if quick else (100, 300, 5, 50)
+    results: dict[str, dict[str, float]] = {}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for name, path in ROUTES.items():
+            samples = []
+            for _ in range(cold_runs):
+                clear_caches()
+                samples.append(await timed_get(client, path))
+            results[f"cold_miss:{name}"] = summarize(samples)
+
+        for name, path in ROUTES.items():
+            await timed_get(client, path)  # warm the cache
+            start = time.perf_counter()
+            samples = [await timed_get(client, path) for _ in range(warm_runs)]
+            rps = warm_runs / (time.perf_counter() - start)
+            results[f"warm_hit:{name}"] = summarize(samples, rps=round(rps, 1))
+
+        # Give the upstream some latency so concurrent misses actually overlap
+        upstream.config.latency_ms = 5
+        for name in ("articles", "events", "article_detail"):
+            samples = []
+            upstream_before = upstream.stats["requests"]
+            for _ in range(contention_rounds):
+                clear_caches()
+                samples += await asyncio.gather(*(
+                    timed_get(client, ROUTES[name]) for _ in range(concurrency)
+                ))
+            upstream_calls = (upstream.stats["requests"] - upstream_before) / contention_rounds
+            results[f"contention:{name}"] = summarize(samples, upstream_calls=upstream_calls)
+        upstream.config.latency_ms = 0
+
+        samples = []
+        for _ in range(cold_runs):
+            gc.collect()  # don't bill one iteration for the previous ones' garbage
+            start = time.perf_counter()
+            await sheets_service.fetch_sheet_data("articles_large", use_cache=False)
+            samples.append(time.perf_counter() - start)
+        results["large_sheet_parse"] = summarize(samples, rows=5000)
+
+    await close_http_client()
+    set_transport(None)
+    return results
+
+
+def median_of(runs: list[dict[str, dict[str, float]]]) -> dict[str, dict[str, float]]:
+    """Merge repeated runs, keeping the median of every number of each scenario."""
+    return {
+        scenario: {
+            key: round(statistics.median(run[scenario][key] for run in runs), 3)
+            for key in values
+        }
+        for scenario, values in runs[0].items()
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    p50_threshold: float,
+    p99_threshold: float,
+    min_delta_ms: float,
+    contention_threshold: float,
+) -> list[str]:
+    """Return a description of every p50/p99 regression beyond its threshold."""
+    regressions = []
+    for scenario, base in baseline.items():
+        current = results.get(scenario)
+        if current is None:
+            continue
+        thresholds = (p50_threshold, p99_threshold)
+        if scenario.startswith("contention:"):
+            thresholds = (contention_threshold, contention_threshold)
+        for metric, threshold in zip(("p50_ms", "p99_ms"), thresholds):
+            before, after = base[metric], current[metric]
+            if after > before * (1 + threshold) and after - before > min_delta_ms:
+                regressions.append(
+                    f"{scenario} {metric}: {before:.3f} -> {after:.3f} ms (+{after / before - 1:.0%})"
+                )
+    return regressions
+
+
+def print_results(results: dict[str, dict[str, float]], baseline: dict | None) -> None:
+    print(f"{'scenario':<30}{'p50 ms':>10}{'p99 ms':>10}{'base p50':>10}{'base p99':>10}  extra")
+    for scenario, values in results.items():
+        base = (baseline or {}).get(scenario, {})
+        extra = {k: v for k, v in values.items() if k not in ("p50_ms", "p99_ms")}
+        print(
+            f"{scenario:<30}{values['p50_ms']:>10.3f}{values['p99_ms']:>10.3f}"
+            f"{base.get('p50_ms', float('nan')):>10.3f}{base.get('p99_ms', float('nan')):>10.3f}"
+            f"  {extra or ''}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end performance benchmark suite")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Store results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if p50/p99 regressed past the threshold")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed p50 slowdown (0.25 = 25%%)")
+    parser.add_argument("--p99-threshold", type=float, default=0.5, help="Allowed p99 slowdown")
+    parser.add_argument(
+        "--contention-threshold", type=float, default=1.0, help="Allowed p50/p99 slowdown of contention scenarios",
+    )
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="Ignore regressions smaller than this")
+    parser.add_argument("--output", type=Path, help="Also write results to this JSON file")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs to take the median of (reduces noise)")
+    parser.add_argument("--quick", action="store_true", help="Fewer iterations (smoke test)")
+    args = parser.parse_args()
+
+    results = median_of([asyncio.run(run_suite(quick=args.quick)) for _ in range(args.repeat)])
+
+    baseline = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+    print_results(results, baseline)
+
+    document = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+
+    if args.check:
+        if baseline is None:
+            sys.exit(f"No baseline at {args.baseline}; run with --save-baseline first")
+        regressions = compare(
+            results, baseline, args.threshold, args.p99_threshold, args.min_delta_ms, args.contention_threshold,
+        )
+        if regressions:
+            print(f"\n{len(regressions)} regression(s):")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(
+            f"\nNo regressions (p50 +{args.threshold:.0%}, p99 +{args.p99_threshold:.0%}, "
+            f"contention +{args.contention_threshold:.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
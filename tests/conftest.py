@@ -0,0 +1,48 @@
+"""Shared fixtures: Google served by the fake upstream, with every cache reset around each test."""
+
+import httpx
+import pytest
+
+from app.devtools.fake_upstream import FakeUpstream
+from app.services import docs_service, preview, sheets_service
+from app.services.cache_service import get_cache
+from app.services.change_tracker import clear_trackers
+from app.services.changes import get_change_log
+from app.services.circuit_breaker import get_breaker
+from app.services.http_client import set_transport
+from app.services.response_cache import get_response_cache
+
+# Host the fake upstream is reached on (circuit breakers and latency windows are per host)
+UPSTREAM_HOST = "upstream-test"
+
+
+def reset_caches() -> None:
+    """Forget everything fetched, rendered or learned from the upstream."""
+    for cache in (get_cache(), get_response_cache(), get_change_log(), preview.cache):
+        cache.clear()
+    clear_trackers()
+    docs_service._digests.clear()
+    get_breaker(UPSTREAM_HOST).record_success()
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """
+    Serve every sheet and doc from the fixtures of a fresh FakeUpstream.
+
+    Each resource's sheet id is the fixture name (``sheet_id_events`` =
+    "events"), and rate limiting is off.
+    """
+    fake = FakeUpstream()
+    set_transport(httpx.ASGITransport(app=fake))
+    settings = sheets_service.settings
+    monkeypatch.setattr(settings, "sheets_base_url", f"http://{UPSTREAM_HOST}/spreadsheets/d")
+    monkeypatch.setattr(settings, "docs_base_url", f"http://{UPSTREAM_HOST}/document/d")
+    monkeypatch.setattr(settings, "rate_limit_enabled", False)
+    for name in sheets_service.SHEET_RESOURCES:
+        if name in fake.sheets:
+            monkeypatch.setattr(settings, f"sheet_id_{name}", name)
+    reset_caches()
+    yield fake
+    reset_caches()
+    set_transport(None)
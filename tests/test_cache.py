@@ -62,3 +62,17 @@ def test_cache_custom_ttl():
     
     time.sleep(1.1)
     assert cache.get("key1") is None
+
+
+def test_cache_get_stale():
+    """Test expired entries stay available to get_stale within their stale window."""
+    cache = CacheService(default_ttl=1)
+    
+    cache.set("key1", "value1", stale_ttl=60)
+    cache.set("key2", "value2")
+    time.sleep(1.1)
+    
+    assert cache.get("key1") is None
+    assert cache.get_stale("key1") == "value1"
+    assert cache.cleanup_expired() == 1
+    assert cache.get_stale("key2") is None
@@ -0,0 +1,87 @@
+"""Tests for the cache invalidation webhook."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import sheets_service
+from app.services.cache_service import get_cache
+
+
+SECRET = "s3cret"
+AUTH = {"Authorization": f"Bearer {SECRET}"}
+
+
+@pytest.fixture(autouse=True)
+def webhook_secret(monkeypatch):
+    monkeypatch.setattr(sheets_service.settings, "cache_webhook_secret", SECRET)
+
+
+def test_invalidate_requires_secret(upstream, monkeypatch):
+    """Test the webhook rejects missing or wrong tokens, and is off without a secret."""
+    client = TestClient(app)
+    body = {"sheet_id": "events"}
+    assert client.post("/api/cache/invalidate", json=body).status_code == 401
+    assert client.post(
+        "/api/cache/invalidate", json=body, headers={"Authorization": "Bearer nope"}
+    ).status_code == 401
+
+    monkeypatch.setattr(sheets_service.settings, "cache_webhook_secret", "")
+    assert client.post("/api/cache/invalidate", json=body, headers=AUTH).status_code == 503
+
+
+def test_invalidate_requires_target(upstream):
+    """Test a sheet_id or doc_id must be given."""
+    response = TestClient(app).post("/api/cache/invalidate", json={}, headers=AUTH)
+    assert response.status_code == 422
+
+
+def test_invalidate_refreshes_only_affected_sheet(upstream):
+    """Test an edited sheet is refetched immediately and other snapshots are untouched."""
+    client = TestClient(app)
+    client.get("/api/events")
+    cache = get_cache()
+    cache.set("sheet:other:default", [{"id": "1"}])
+    before = upstream.stats["requests"]
+
+    upstream.sheets["events"] = upstream.sheets["events"].replace("Culte", "Célébration")
+    response = client.post("/api/cache/invalidate", json={"sheet_id": "events"}, headers=AUTH)
+
+    assert response.status_code == 200
+    assert response.json() == {"refreshed": ["sheet:events:default"]}
+    assert upstream.stats["requests"] - before == 1
+    assert cache.get("sheet:other:default") == [{"id": "1"}]
+    assert "Culte" not in str(cache.get("sheet:events:default"))
+
+
+def test_invalidate_doc(upstream):
+    """Test a cached doc is refetched, and uncached docs are ignored."""
+    client = TestClient(app)
+    cache = get_cache()
+    cache.set("doc:article-1", "<p>old</p>")
+
+    response = client.post(
+        "/api/cache/invalidate", json={"doc_id": "article-1"}, headers=AUTH
+    )
+    assert response.json() == {"refreshed": ["doc:article-1"]}
+    assert cache.get("doc:article-1") != "<p>old</p>"
+
+    response = client.post(
+        "/api/cache/invalidate", json={"doc_id": "article-2"}, headers=AUTH
+    )
+    assert response.json() == {"refreshed": []}
+
+
+def test_metrics_report_learned_intervals(upstream):
+    """Test the metrics endpoint lists each tracked sheet's refresh interval."""
+    client = TestClient(app)
+    client.get("/api/events")
+    assert client.get("/api/cache/metrics").status_code == 401
+
+    response = client.get("/api/cache/metrics", headers=AUTH)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["entries"] >= 1
+    events = next(s for s in data["sheets"] if s["cache_key"] == "sheet:events:default")
+    assert events["generation"] == 1
+    assert events["interval_seconds"] > 0
@@ -0,0 +1,215 @@
+"""Tests for row diffs, targeted cache invalidation and the incremental sync endpoint."""
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.routers.changes import FEEDS
+from app.services import changes, docs_service
+from app.services.cache_service import get_cache
+from app.services.changes import ChangeLog, get_change_log
+from app.services.response_cache import get_response_cache
+from app.services.snapshot import Snapshot
+
+
+def test_snapshot_diff():
+    """Test rows are matched by id and compared by content."""
+    old = Snapshot.from_csv("id,title\n1,A\n2,B\n3,C\n")
+    new = Snapshot.from_csv("id,title,extra\n1,A,\n2,B bis,\n4,D,\n")
+
+    diff = new.diff(old)
+    assert (diff.added, diff.updated, diff.removed) == ({"4"}, {"1", "2"}, {"3"})
+    assert not Snapshot.from_csv("id,title\n1,A\n").diff(Snapshot.from_csv("id,title\n1,A\n"))
+    assert new.diff(None).added == {"1", "2", "4"}
+
+
+def test_carry_over_keeps_unchanged_objects():
+    """Test a refetch reuses the previous snapshot, or its unchanged rows."""
+    old = Snapshot.from_csv("id,title\n1,A\n2,B\n3,C\n")
+    same = Snapshot.from_csv("id,title\n1,A\n2,B\n3,C\n")
+    assert same.carry_over(old, same.diff(old)) is old
+
+    new = Snapshot.from_csv("id,title\n1,A\n2,B bis\n4,D\n")
+    merged = new.carry_over(old, new.diff(old))
+    assert merged == new
+    assert merged[0] is old[0]
+    assert merged[1] is new[1] and merged[2] is new[2]
+
+    reshaped = Snapshot.from_csv("id,title,extra\n1,A,\n")
+    assert reshaped.carry_over(old, reshaped.diff(old)) is reshaped
+
+
+def test_reorders_and_duplicate_ids_are_not_lost():
+    """Test moved rows keep the new order, and edits to any row sharing an id count."""
+    old = Snapshot.from_csv("id,title\n1,A\n2,B\n")
+    moved = Snapshot.from_csv("id,title\n2,B\n1,A\n")
+    diff = moved.diff(old)
+    assert not diff
+    merged = moved.carry_over(old, diff)
+    assert [row["title"] for row in merged] == ["B", "A"]
+    assert merged[0] is old[1] and merged[1] is old[0]
+
+    old = Snapshot.from_csv("id,title\n1,A\n1,X\n")
+    edited = Snapshot.from_csv("id,title\n1,A bis\n1,X\n")
+    diff = edited.diff(old)
+    assert diff.updated == {"1"}
+    assert [row["title"] for row in edited.carry_over(old, diff)] == ["A bis", "X"]
+    assert Snapshot.from_csv("id,title\n1,A\n").diff(old).updated == {"1"}
+
+
+def test_article_docs_follow_their_rows(monkeypatch):
+    """Test only docs whose article link or updated_at changed are refetched or dropped."""
+    refetched = []
+    monkeypatch.setattr(docs_service, "refresh_in_background", lambda key, refresh: refetched.append(key))
+    cache = docs_service.cache
+    for doc_id in ("doc-1", "doc-2", "doc-3"):
+        cache.set(f"doc:{doc_id}@2026-01-01", f"<p>{doc_id}</p>")
+
+    header = "id,title,updated_at,link\n"
+    old = Snapshot.from_csv(
+        header
+        + "1,A,2026-01-01,https://docs.google.com/document/d/doc-1/edit\n"
+        + "2,B,2026-01-01,https://docs.google.com/document/d/doc-2/edit\n"
+        + "3,C,2026-01-01,https://docs.google.com/document/d/doc-3/edit\n"
+    )
+    new = Snapshot.from_csv(
+        header
+        + "1,A bis,2026-01-01,https://docs.google.com/document/d/doc-1/edit\n"
+        + "2,B,2026-01-02,https://docs.google.com/document/d/doc-2/edit\n"
+    )
+    try:
+        docs_service._articles_changed(old, new, new.diff(old))
+
+        assert refetched == ["doc:doc-2@2026-01-02"]
+        assert cache.get("doc:doc-1@2026-01-01") == "<p>doc-1</p>"  # only the title changed
+        assert cache.get("doc:doc-2@2026-01-01") == "<p>doc-2</p>"  # kept until the new revision is fetched
+        assert cache.get("doc:doc-3@2026-01-01") is None  # article deleted
+    finally:
+        cache.clear()
+
+
+def test_article_doc_is_cached_per_revision(upstream):
+    """Test an article's doc is reused until the sheet shows a new updated_at."""
+    client = TestClient(create_app())
+    slug = "vivre-la-foi-au-quotidien"
+    assert client.get(f"/api/articles/{slug}").status_code == 200
+    assert docs_service.cache.get("doc:article-1@2026-02-04") is not None
+
+    requests = upstream.stats["requests"]
+    upstream.docs["article-1"] = upstream.docs["article-1"].replace("Vivre la foi", "Revivre la foi")
+    client.get(f"/api/articles/{slug}")
+    assert upstream.stats["requests"] == requests  # same revision: served from cache
+
+    upstream.sheets["articles"] = upstream.sheets["articles"].replace(
+        '"published","2026-02-04","2026-02-04"', '"published","2026-02-04","2026-02-05"', 1
+    )
+    for key in get_cache().keys("sheet:"):
+        get_cache().delete(key)
+    assert "Revivre la foi" in client.get(f"/api/articles/{slug}").json()["content_html"]
+    assert docs_service.cache.get("doc:article-1@2026-02-04") is None
+
+
+def test_item_responses_survive_other_rows_edits(upstream):
+    """Test a detail response stays cached while only other rows change."""
+    client = TestClient(create_app())
+    assert client.get("/api/events/1").status_code == 200
+    assert client.get("/api/events/2").status_code == 200
+
+    upstream.sheets["events"] = upstream.sheets["events"].replace("Week-end d'église", "Week-end de l'église")
+    get_cache().clear()
+    client.get("/api/events")
+
+    events = get_change_log().snapshot("events")
+    rows = {key: events[position] for key, position in events.ids().items()}
+    assert get_response_cache().get("/api/events/1|", rows["1"]) is not None
+    assert get_response_cache().get("/api/events/2|", rows["2"]) is None
+    assert client.get("/api/events/2").json()["title"] == "Week-end de l'église"
+
+
+def test_change_log_history_is_bounded():
+    """Test a state older than the history is reported as unknown."""
+    log = ChangeLog(max_entries=2)
+    tokens, previous = [], None
+    for version in range(4):
+        snapshot = Snapshot.from_csv(f"id,title\n1,v{version}\n2,same\n")
+        log.record("a", snapshot, snapshot.diff(previous))
+        tokens.append(log.token())
+        previous = snapshot
+    assert log.record("a", previous, previous.diff(previous)) is None  # unchanged: same token
+    assert log.token() == tokens[3]
+
+    assert log.changed_since(tokens[3]) == {}
+    assert log.changed_since(tokens[2]) == {"a": {"1"}}
+    assert log.changed_since(tokens[1]) == {"a": {"1"}}
+    assert log.changed_since(tokens[0]) is None
+    assert log.changed_since("not-a-token") is None
+
+
+def test_tokens_mean_the_same_to_every_process():
+    """Test a token from a peer worker, or from before a restart, is resolved by content."""
+    old = Snapshot.from_csv("id,title\n1,A\n2,B\n")
+    new = Snapshot.from_csv("id,title\n1,A bis\n2,B\n")
+    worker, peer = ChangeLog(), ChangeLog()
+    for log in (worker, peer):
+        log.record("a", old, old.diff(None))
+    token = peer.token()
+    assert token == worker.token()
+
+    worker.record("a", new, new.diff(old))
+    assert worker.changed_since(token) == {"a": {"1"}}
+    assert worker.changed_since(token, ["a", "b"]) is None  # b isn't in the token
+
+    restarted = ChangeLog()
+    restarted.record("a", new, new.diff(None))
+    assert restarted.changed_since(worker.token()) == {}
+    assert restarted.changed_since(token) is None  # content it never held
+
+
+def test_sync_returns_only_changed_items(upstream):
+    """Test a client up to date with a generation gets just the later edits."""
+    client = TestClient(create_app())
+    full = client.get("/api/changes").json()
+    assert full["reset"] is True
+    articles = next(c for c in full["changes"] if c["resource"] == "articles")
+    assert {a["slug"] for a in articles["upserted"]} == {
+        a["slug"] for a in client.get("/api/articles").json()["articles"]
+    }
+
+    assert client.get("/api/changes", params={"since": full["generation"]}).json()["changes"] == []
+
+    sheet = upstream.sheets["articles"]
+    sheet = sheet.replace("Vivre la foi au quotidien", "Vivre la foi chaque jour")
+    sheet = sheet.replace('"draft","2026-02-04"', '"published","2026-02-04"')  # article 10
+    sheet = "\n".join(line for line in sheet.splitlines() if not line.startswith('"2",'))
+    upstream.sheets["articles"] = sheet
+    get_cache().clear()
+
+    delta = client.get("/api/changes", params={"since": full["generation"]}).json()
+    assert delta["reset"] is False
+    assert delta["generation"] != full["generation"]
+    [articles] = delta["changes"]
+    assert articles["resource"] == "articles"
+    assert sorted(a["id"] for a in articles["upserted"]) == ["1", "10"]
+    assert articles["removed"] == ["2"]
+
+
+def test_sync_token_works_on_any_worker(upstream, monkeypatch):
+    """Test a worker that loaded the same sheets answers another worker's token with a delta."""
+    client = TestClient(create_app())
+    token = client.get("/api/changes").json()["generation"]
+
+    # Another worker (or this one restarted): its own change log and caches
+    monkeypatch.setattr(changes, "_change_log", ChangeLog())
+    get_cache().clear()
+    get_response_cache().clear()
+    response = client.get("/api/changes", params={"since": token}).json()
+    assert response == {"generation": token, "reset": False, "changes": []}
+
+
+def test_unknown_generation_resets(upstream):
+    """Test a token naming content this worker never held gets every item with reset set."""
+    client = TestClient(create_app())
+    client.get("/api/changes")
+    since = ",".join(f"{resource}:000000000000" for resource in FEEDS)
+    response = client.get("/api/changes", params={"since": since}).json()
+    assert response["reset"] is True
+    assert {c["resource"] for c in response["changes"]} == set(FEEDS)
@@ -0,0 +1,101 @@
+"""Tests for the upstream circuit breaker and stale fallbacks."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import sheets_service
+from app.services.cache_service import get_cache
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.http_client import fetch
+
+
+def test_breaker_opens_after_threshold_and_backs_off():
+    """Test the circuit opens after consecutive failures and doubles its backoff."""
+    breaker = CircuitBreaker(failure_threshold=2, backoff=10.0, max_backoff=15.0)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    assert 9 < breaker.retry_in() <= 10
+
+    # Half-open probe fails: re-open with a longer (capped) backoff
+    breaker.open_until = 0
+    assert breaker.allow_request()
+    assert not breaker.allow_request()  # only one probe at a time
+    breaker.record_failure()
+    assert 14 < breaker.retry_in() <= 15
+
+    breaker.open_until = 0
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.retry_in() == 0
+
+
+def test_fetch_fails_fast_while_open(upstream):
+    """Test no requests reach the upstream once the circuit is open."""
+    upstream.config.error_rate = 1.0
+    url = f"{sheets_service.settings.sheets_base_url}/services/gviz/tq"
+
+    async def run():
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await fetch(url)
+        with pytest.raises(CircuitOpenError):
+            await fetch(url)
+
+    asyncio.run(run())
+    assert upstream.stats["requests"] == 3
+
+
+def test_failed_fetch_is_negatively_cached(upstream):
+    """Test a failed sheet isn't refetched until the negative entry expires."""
+    upstream.config.error_rate = 1.0
+
+    async def run():
+        assert await sheets_service.fetch_sheet_data("services") == []
+        assert await sheets_service.fetch_sheet_data("services") == []
+
+    asyncio.run(run())
+    assert upstream.stats["requests"] == 1
+
+
+def test_zero_negative_ttl_disables_the_negative_cache(upstream, monkeypatch):
+    """Test NEGATIVE_CACHE_TTL_SECONDS=0 retries every failure, and refreshes still report them."""
+    monkeypatch.setattr(sheets_service.settings, "negative_cache_ttl_seconds", 0)
+
+    async def run():
+        await sheets_service.fetch_sheet_data("services")
+        upstream.config.error_rate = 1.0
+        assert await sheets_service.refresh_sheet("services") == []
+        get_cache()._cache["sheet:services:default"].expires_at = 0
+        await sheets_service.fetch_sheet_data("services")
+        await sheets_service.fetch_sheet_data("services")
+
+    asyncio.run(run())
+    assert upstream.stats["requests"] == 4
+    assert get_cache().get("failed:sheet:services:default") is None
+
+
+def test_serves_stale_snapshot_with_warning_header(upstream):
+    """Test the last good data is served, flagged stale, when the upstream fails."""
+    client = TestClient(app)
+    fresh = client.get("/api/services")
+    assert fresh.status_code == 200
+    assert "warning" not in fresh.headers
+
+    # Expire the snapshot, then break the upstream
+    cache = get_cache()
+    cache._cache["sheet:services:default"].expires_at = 0
+    upstream.config.error_rate = 1.0
+
+    stale = client.get("/api/services")
+    assert stale.status_code == 200
+    assert stale.json() == fresh.json()
+    assert stale.headers["warning"] == '110 - "Response is Stale"'
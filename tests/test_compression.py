@@ -0,0 +1,122 @@
+"""Tests for response compression."""
+
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.compression import CompressionMiddleware
+from app.services import compression
+
+
+LARGE_PAYLOAD = {"content_html": "<p>Bienvenue à l'Église LaRencontre</p>" * 200}
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    async def large():
+        return JSONResponse(LARGE_PAYLOAD)
+
+    @app.get("/small")
+    async def small():
+        return JSONResponse({"status": "healthy"})
+
+    return TestClient(app)
+
+
+def test_negotiate_encoding_prefers_gzip_without_brotli(monkeypatch):
+    """Test gzip is chosen when brotli is unavailable."""
+    monkeypatch.setattr(compression, "brotli", None)
+    assert compression.negotiate_encoding("gzip, deflate, br") == "gzip"
+
+
+def test_negotiate_encoding_respects_q_values(monkeypatch):
+    """Test q=0 disables an encoding and wildcards are honoured."""
+    monkeypatch.setattr(compression, "brotli", None)
+    assert compression.negotiate_encoding("gzip;q=0, deflate") is None
+    assert compression.negotiate_encoding("*") == "gzip"
+    assert compression.negotiate_encoding("") is None
+
+
+def test_large_response_is_compressed():
+    """Test large bodies are gzip-encoded with a Vary header."""
+    client = make_client()
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json() == LARGE_PAYLOAD
+
+
+def test_uncompressed_large_response_varies_on_encoding():
+    """Test a body sent as-is to a client without gzip still says it depends on Accept-Encoding."""
+    client = make_client()
+    response = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert "vary" not in client.get("/small", headers={"Accept-Encoding": "identity"}).headers
+
+
+def test_compressed_bodies_are_bounded():
+    """Test the compressed body cache evicts the least recently used beyond its size."""
+    bodies = compression.CompressedBodies(max_bytes=10)
+    bodies.set("gzip", b"a", b"12345")
+    bodies.set("gzip", b"b", b"12345")
+    assert bodies.get("gzip", b"a") == b"12345"  # now the most recently used
+    bodies.set("gzip", b"c", b"12345")
+
+    assert bodies.get("gzip", b"b") is None
+    assert bodies.get("gzip", b"a") is not None
+    assert len(bodies) == 2 and bodies.size == 10
+    bodies.set("gzip", b"d", b"x" * 11)  # larger than the whole cache: not kept
+    assert bodies.get("gzip", b"d") is None
+
+
+def test_small_response_is_not_compressed():
+    """Test bodies below the threshold are sent as-is."""
+    client = make_client()
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+
+def test_compressed_body_is_reused(monkeypatch):
+    """Test a body is compressed once and then served from the cache."""
+    calls = []
+    real_compress = compression.compress
+
+    def counting_compress(body, encoding):
+        calls.append(encoding)
+        return real_compress(body, encoding)
+
+    monkeypatch.setattr(compression, "compress", counting_compress)
+    body = b"x" * 4096
+    first = compression.get_compressed(body, "gzip")
+    second = compression.get_compressed(body, "gzip")
+
+    assert first is second
+    assert gzip.decompress(first) == body
+    assert len(calls) == 1
+
+
+def test_compressed_text_round_trip():
+    """Test compressed text decodes back to the original, non-ASCII included."""
+    html = "<p>L’Église « LaRencontre » vous accueille chaque dimanche.</p>" * 100
+    packed = compression.CompressedText(html)
+
+    assert str(packed) == html
+    assert len(packed) == len(html)
+    assert len(packed.data) < len(html.encode()) / 5
+
+
+def test_pack_text_only_compresses_large_text(monkeypatch):
+    """Test text below doc_compress_min_size is stored as-is."""
+    monkeypatch.setattr(compression.get_settings(), "doc_compress_min_size", 100)
+    assert compression.pack_text("<p>court</p>") == "<p>court</p>"
+
+    packed = compression.pack_text("<p>long</p>" * 20)
+    assert isinstance(packed, compression.CompressedText)
+    assert compression.unpack_text(packed) == "<p>long</p>" * 20
+    assert compression.unpack_text(None) is None
@@ -0,0 +1,34 @@
+"""Tests for the static snapshot export."""
+
+import asyncio
+import json
+
+from app.export import export_site, output_file
+from app.main import create_app
+
+
+def test_export_writes_lists_and_details(upstream, tmp_path):
+    """Test every list endpoint and each article, event and product is rendered."""
+    result = asyncio.run(export_site(create_app(), tmp_path, concurrency=4))
+
+    assert result["failed"] == [] and result["stale"] == []
+    articles = json.loads(output_file(tmp_path, "/api/articles").read_text())
+    assert articles["total"] > 0
+    for article in articles["articles"]:
+        detail = json.loads(output_file(tmp_path, f"/api/articles/{article['slug']}").read_text())
+        assert detail["slug"] == article["slug"]
+        assert detail["content_html"]
+
+    events = json.loads(output_file(tmp_path, "/api/events").read_text())["events"]
+    assert all(output_file(tmp_path, f"/api/events/{e['id']}").exists() for e in events)
+    assert output_file(tmp_path, "/api/boutique/1").exists()
+    assert output_file(tmp_path, "/api/vision").exists()
+
+
+def test_export_fetches_each_sheet_once(upstream, tmp_path):
+    """Test sheets are warmed up front instead of fetched by every page."""
+    asyncio.run(export_site(create_app(), tmp_path))
+
+    articles = json.loads(output_file(tmp_path, "/api/articles").read_text())["total"]
+    # One request per sheet + one doc per published article
+    assert upstream.stats["requests"] == len(upstream.sheets) + articles
@@ -0,0 +1,76 @@
+"""Tests for the fake Google Sheets/Docs upstream."""
+
+import csv
+import io
+
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.devtools.fake_upstream import FakeUpstream, FakeUpstreamConfig
+
+
+def make_client(**config) -> tuple[FakeUpstream, TestClient]:
+    upstream = FakeUpstream(config=FakeUpstreamConfig(**config))
+    return upstream, TestClient(upstream, base_url="http://fake")
+
+
+def path_of(url: str) -> str:
+    return url.removeprefix("http://fake")
+
+
+def test_serves_sheet_csv_at_settings_url():
+    """Test the URL built by Settings.get_sheet_csv_url serves the fixture."""
+    settings = Settings(sheets_base_url="http://fake/spreadsheets/d")
+    _, client = make_client()
+
+    response = client.get(path_of(settings.get_sheet_csv_url("articles")))
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert rows and rows[0]["slug"]
+
+
+def test_named_tab_falls_back_to_default_sheet():
+    """Test a tab without its own fixture serves the sheet's default file."""
+    settings = Settings(sheets_base_url="http://fake/spreadsheets/d")
+    _, client = make_client()
+    response = client.get(path_of(settings.get_sheet_csv_url("home_groups", "LR_WEBSITE")))
+    assert response.status_code == 200
+    assert "Fréquence" in response.text
+
+
+def test_serves_doc_html_at_settings_url():
+    """Test the URL built by Settings.get_doc_html_url serves the fixture."""
+    settings = Settings(docs_base_url="http://fake/document/d")
+    _, client = make_client()
+    response = client.get(path_of(settings.get_doc_html_url("article-1")))
+    assert response.status_code == 200
+    assert "<body" in response.text
+
+
+def test_error_rate_and_unknown_ids():
+    """Test simulated failures and 404s for unknown fixtures."""
+    upstream, client = make_client(error_rate=1.0)
+    assert client.get("/spreadsheets/d/articles/gviz/tq?tqx=out:csv").status_code == 500
+    assert upstream.stats["errors"] == 1
+
+    _, client = make_client()
+    assert client.get("/spreadsheets/d/missing/gviz/tq?tqx=out:csv").status_code == 404
+
+
+def test_mutation_changes_content_persistently():
+    """Test mutations behave like edits: content changes and stays changed."""
+    upstream, client = make_client(mutation_rate=1.0)
+    original = upstream.sheets["events"]
+
+    mutated = client.get("/spreadsheets/d/events/gviz/tq?tqx=out:csv").text
+    assert mutated != original
+    assert upstream.sheets["events"] == mutated
+
+
+def test_config_can_be_updated_at_runtime():
+    """Test the control endpoint updates and validates settings."""
+    upstream, client = make_client()
+    assert client.post("/_fake/config", json={"latency_ms": 5}).status_code == 200
+    assert upstream.config.latency_ms == 5
+    assert client.post("/_fake/config", json={"error_rate": 2}).status_code == 422
@@ -0,0 +1,86 @@
+"""Tests for the snapshot filter engine."""
+
+from app.services.filters import Contains, Equals, Order, RowFilter, display_order
+from app.services.snapshot import Snapshot
+
+
+SNAPSHOT = Snapshot.from_csv(
+    "id,status,category,is_in_stock,Fréquence\n"
+    "1,published,Livres,TRUE,1 fois par mois\n"
+    "2,Draft,livres,FALSE,2 fois par mois\n"
+    "3,archived,Livres,TRUE,1 fois par mois\n"
+    "4,published,Musique,false,Chaque semaine\n"
+    "5,,Musique,TRUE,\n"
+)
+
+FILTERS = RowFilter(
+    category=Equals("category"),
+    in_stock=Equals("is_in_stock"),
+    frequency=Contains("Fréquence"),
+)
+
+
+def ids(rows) -> list[str]:
+    return [row["id"] for row in rows]
+
+
+def test_status_and_preview():
+    """Test only published rows are kept, plus drafts in preview mode."""
+    assert ids(FILTERS.select(SNAPSHOT)) == ["1", "4"]
+    assert ids(FILTERS.select(SNAPSHOT, preview=True)) == ["1", "2", "4"]
+
+
+def test_missing_status():
+    """Test rows without a status can be treated as published."""
+    assert ids(RowFilter(missing_status="published").select(SNAPSHOT)) == ["1", "4", "5"]
+
+
+def test_filters_ignore_case_and_combine():
+    """Test conditions are case-insensitive, ANDed, and skipped when empty."""
+    assert ids(FILTERS.select(SNAPSHOT, preview=True, category="LIVRES")) == ["1", "2"]
+    assert ids(FILTERS.select(SNAPSHOT, preview=True, category="livres", in_stock=False)) == ["2"]
+    assert ids(FILTERS.select(SNAPSHOT, in_stock=False)) == ["4"]
+    assert ids(FILTERS.select(SNAPSHOT, category="", in_stock=None)) == ["1", "4"]
+    assert FILTERS.select(SNAPSHOT, category="inconnue") == []
+
+
+def test_contains():
+    """Test substring conditions match every distinct value containing the text."""
+    assert ids(FILTERS.select(SNAPSHOT, preview=True, frequency="par mois")) == ["1", "2"]
+
+
+def test_indexes_are_built_once_per_snapshot():
+    """Test column indexes are cached on the snapshot."""
+    masks = SNAPSHOT.value_masks("category")
+    assert masks == {"livres": 0b00111, "musique": 0b11000}
+    assert SNAPSHOT.value_masks("category") is masks
+
+
+def test_order_matches_sorting_the_selection():
+    """Test selected rows come back sorted like a stable sort of the filtered rows."""
+    snapshot = Snapshot.from_csv(
+        "id,status,display_order,category\n"
+        "1,published,3,a\n"
+        "2,published,,b\n"
+        "3,draft,1,a\n"
+        "4,published,1,b\n"
+        "5,published,3,a\n"
+    )
+    by_order = RowFilter(order=Order("display_order", key=display_order), category=Equals("category"))
+
+    for preview in (False, True):
+        for category in (None, "a", "b"):
+            expected = RowFilter(category=Equals("category")).select(snapshot, preview, category=category)
+            expected.sort(key=lambda row: int(row.get("display_order") or "999"))
+            assert by_order.select(snapshot, preview, category=category) == expected
+
+    # Default key: the raw cell, blanks first
+    descending = RowFilter(order=Order("display_order", reverse=True))
+    assert ids(descending.select(snapshot)) == ["1", "5", "4", "2"]
+
+
+def test_order_is_computed_once_per_snapshot():
+    """Test the permutation is stored on the snapshot."""
+    order = Order("id", key=int, reverse=True)
+    assert order.permutation(SNAPSHOT) == (4, 3, 2, 1, 0)
+    assert order.permutation(SNAPSHOT) is order.permutation(SNAPSHOT)
@@ -0,0 +1,80 @@
+"""Tests for upstream deadlines and hedged fetches."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.config import get_settings
+from app.services.http_client import (
+    DeadlineExceededError,
+    LatencyWindow,
+    fetch,
+    get_latency_window,
+    hedge_stats,
+    set_transport,
+)
+from app.services.request_context import set_deadline
+
+
+@pytest.fixture
+def slow_first_call():
+    """Upstream whose first response takes 1 s and later ones are immediate."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        if len(calls) == 1:
+            await asyncio.sleep(1.0)
+        return httpx.Response(200, text=f"call {len(calls)}")
+
+    set_transport(httpx.MockTransport(handler))
+    yield calls
+    set_transport(None)
+
+
+def test_latency_window_quantile():
+    """Test the p95 needs enough samples and tracks recent responses."""
+    window = LatencyWindow(size=100)
+    assert window.quantile(0.95) is None
+    for i in range(100):
+        window.record(i / 1000)
+    assert window.quantile(0.95, min_samples=101) is None
+    assert window.quantile(0.95) == pytest.approx(0.095)
+
+
+def test_deadline_caps_upstream_call(slow_first_call):
+    """Test a fetch gives up when the request's deadline runs out."""
+    async def run():
+        set_deadline(0.1)
+        start = time.perf_counter()
+        with pytest.raises(DeadlineExceededError):
+            await fetch("http://deadline-test/slow")
+        assert time.perf_counter() - start < 0.5
+
+        # Nothing left in the budget: don't even send the request
+        with pytest.raises(DeadlineExceededError):
+            await fetch("http://deadline-test/slow")
+
+    asyncio.run(run())
+    assert len(slow_first_call) == 1
+
+
+def test_hedged_fetch_returns_first_answer(slow_first_call, monkeypatch):
+    """Test a fetch slower than the host's p95 is raced by a second request."""
+    monkeypatch.setattr(get_settings(), "upstream_hedge_enabled", True)
+    window = get_latency_window("hedge-test")
+    for _ in range(50):
+        window.record(0.01)
+    sent, won = hedge_stats["sent"], hedge_stats["won"]
+
+    async def run():
+        start = time.perf_counter()
+        response = await fetch("http://hedge-test/doc")
+        return response, time.perf_counter() - start
+
+    response, elapsed = asyncio.run(run())
+    assert response.text == "call 2"
+    assert elapsed < 0.5
+    assert (hedge_stats["sent"] - sent, hedge_stats["won"] - won) == (1, 1)
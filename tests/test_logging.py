@@ -0,0 +1,57 @@
+"""Tests for the logging pipeline."""
+
+import json
+import logging
+import queue
+import sys
+
+from app.logging_config import JSONFormatter, NonBlockingQueueHandler, SuccessSampleFilter
+
+
+def make_record(msg: str = "GET /api/articles", **attrs) -> logging.LogRecord:
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+    for key, value in attrs.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_json_formatter_output():
+    """Test JSON output has an ISO timestamp and the message."""
+    record = make_record()
+    record.created = 1700000000.25
+    data = json.loads(JSONFormatter().format(record))
+    assert data["timestamp"] == "2023-11-14T22:13:20.250Z"
+    assert data["message"] == "GET /api/articles"
+    assert data["level"] == "INFO"
+
+
+def test_queue_handler_keeps_exception_text():
+    """Test exceptions are rendered before crossing the queue."""
+    log_queue = queue.Queue()
+    handler = NonBlockingQueueHandler(log_queue)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed %s", ("x",), sys.exc_info())
+    handler.handle(record)
+
+    queued = log_queue.get_nowait()
+    data = json.loads(JSONFormatter().format(queued))
+    assert data["message"] == "failed x"
+    assert "ValueError: boom" in data["exception"]
+
+
+def test_queue_handler_drops_when_full():
+    """Test a full queue drops records instead of blocking."""
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    handler.handle(make_record())
+    handler.handle(make_record())
+    assert handler.dropped == 1
+
+
+def test_sample_filter_keeps_errors_and_other_logs():
+    """Test sampling only applies to successful request logs."""
+    sampler = SuccessSampleFilter(rate=0.0)
+    assert sampler.filter(make_record(status_code=200)) is False
+    assert sampler.filter(make_record(status_code=500)) is True
+    assert sampler.filter(make_record()) is True
@@ -0,0 +1,48 @@
+"""Tests for ASGI middleware."""
+
+import logging
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.timing import RequestLoggingMiddleware
+
+
+def make_logged_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk{i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/api/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return app
+
+
+def test_request_logging_records_status_and_duration(caplog):
+    """Test requests are logged with status code and timing after the body is sent."""
+    client = TestClient(make_logged_app())
+    with caplog.at_level(logging.INFO, logger="app.middleware.timing"):
+        response = client.get("/stream?page=2")
+
+    assert response.text == "chunk0\nchunk1\nchunk2\n"
+    record = next(r for r in caplog.records if r.name == "app.middleware.timing")
+    assert record.status_code == 200
+    assert record.query == "page=2"
+    assert record.duration_ms >= 0
+
+
+def test_request_logging_skips_health(caplog):
+    """Test health checks are not logged."""
+    client = TestClient(make_logged_app())
+    with caplog.at_level(logging.INFO, logger="app.middleware.timing"):
+        client.get("/api/health")
+    assert not [r for r in caplog.records if r.name == "app.middleware.timing"]
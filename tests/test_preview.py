@@ -0,0 +1,80 @@
+"""Tests for fresh, isolated preview reads."""
+
+import asyncio
+import time
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.devtools.fake_upstream import FakeUpstreamConfig
+from app.main import create_app
+from app.services import sheets_service
+from app.services.cache_service import get_cache
+from app.services.response_cache import get_response_cache
+
+
+def test_preview_reads_fresh_data_without_touching_public_cache(upstream):
+    """Test previews see an edit at once while public reads keep the cached snapshot."""
+    client = TestClient(create_app())
+    public = client.get("/api/articles").json()
+    snapshot = get_cache().get("sheet:articles:default")
+
+    upstream.sheets["articles"] = upstream.sheets["articles"].replace("Vivre la foi", "Vivre la joie")
+    previewed = client.get("/api/articles", params={"preview": "true"})
+
+    assert "Vivre la joie" in previewed.text
+    assert previewed.json()["total"] > public["total"]  # drafts included
+    assert client.get("/api/articles").json() == public
+    assert get_cache().get("sheet:articles:default") is snapshot
+
+
+def test_preview_responses_are_private(upstream):
+    """Test preview responses are marked uncacheable and skip the response cache."""
+    client = TestClient(create_app())
+    client.get("/api/articles")
+    cached = len(get_response_cache())
+
+    listing = client.get("/api/articles", params={"preview": "true"})
+    detail = client.get("/api/articles/grandir-ensemble-en-home", params={"preview": "true"})
+
+    assert listing.headers["cache-control"] == "private, no-store"
+    assert detail.status_code == 200
+    assert detail.headers["cache-control"] == "private, no-store"
+    assert len(get_response_cache()) == cached
+    assert "cache-control" not in client.get("/api/articles").headers
+
+
+def test_concurrent_previews_share_one_fetch(upstream):
+    """Test simultaneous previews of a sheet make a single upstream request."""
+    upstream.config = FakeUpstreamConfig(latency_ms=20)
+
+    async def run():
+        return await asyncio.gather(*(
+            sheets_service.get_articles(preview=True) for _ in range(10)
+        ))
+
+    results = asyncio.run(run())
+    assert upstream.stats["requests"] == 1
+    assert all(rows is results[0] for rows in results)
+
+
+def test_preview_falls_back_to_public_data(upstream):
+    """Test a failing upstream serves the public snapshot to previews."""
+    public = asyncio.run(sheets_service.get_articles())
+    upstream.config = FakeUpstreamConfig(error_rate=1)
+
+    assert asyncio.run(sheets_service.get_articles(preview=True)) is public
+
+
+def test_preview_fallback_keeps_resource_cache_policy(upstream, monkeypatch):
+    """Test a failed preview seeds the public cache with the resource's own TTL."""
+    async def failing_fetch_fresh(key, load):
+        raise httpx.ConnectError("preview read failed")
+
+    monkeypatch.setattr(sheets_service, "fetch_fresh", failing_fetch_fresh)
+    monkeypatch.setattr(sheets_service.settings, "cache_ttl_articles", 7200)
+    before = time.time()
+    assert len(asyncio.run(sheets_service.get_articles(preview=True))) > 0
+
+    entry = get_cache()._cache["sheet:articles:default"]
+    assert entry.expires_at >= before + 7200
@@ -0,0 +1,97 @@
+"""Tests for token-bucket rate limiting."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.services.rate_limit import (
+    BucketStore,
+    MemoryBucketStore,
+    SharedMemoryBucketStore,
+    client_ip,
+    parse_networks,
+    parse_rate,
+)
+
+
+def test_parse_rate():
+    """Test rate strings become (capacity, tokens per second)."""
+    assert parse_rate("60/minute") == (60.0, 1.0)
+    assert parse_rate("10/second") == (10.0, 10.0)
+
+
+def test_memory_store_allows_burst_then_limits():
+    """Test a bucket allows its capacity and then reports a retry delay."""
+    store = MemoryBucketStore()
+    assert all(store.consume("cheap:1.2.3.4", 3, 1.0) == 0 for _ in range(3))
+    assert store.consume("cheap:1.2.3.4", 3, 1.0) > 0
+    # Other clients have their own bucket
+    assert store.consume("cheap:5.6.7.8", 3, 1.0) == 0
+
+
+def test_memory_store_evicts_least_recently_seen_client():
+    """Test the store never holds more than max_keys buckets, dropping the oldest."""
+    store = MemoryBucketStore(max_keys=2)
+    store.consume("cheap:1", 1, 0.001)
+    store.consume("cheap:2", 1, 0.001)
+    store.consume("cheap:1", 1, 0.001)  # denied, but seen more recently than 2
+    store.consume("cheap:3", 1, 0.001)
+
+    assert list(store._buckets) == ["cheap:1", "cheap:3"]
+    # Still limited: its bucket was kept
+    assert store.consume("cheap:1", 1, 0.001) > 0
+
+
+def test_bucket_store_is_abstract():
+    """Test stores must implement consume."""
+    with pytest.raises(TypeError):
+        BucketStore()
+
+
+def test_shared_store_is_shared_between_instances(tmp_path):
+    """Test two store instances (as in two workers) share bucket state."""
+    path = str(tmp_path / "buckets")
+    worker_a = SharedMemoryBucketStore(path, slots=64)
+    worker_b = SharedMemoryBucketStore(path, slots=64)
+
+    assert worker_a.consume("cheap:1.2.3.4", 2, 0.01) == 0
+    assert worker_b.consume("cheap:1.2.3.4", 2, 0.01) == 0
+    assert worker_a.consume("cheap:1.2.3.4", 2, 0.01) > 0
+
+
+def test_client_ip_behind_trusted_proxy():
+    """Test X-Forwarded-For is only honoured from trusted proxies."""
+    trusted = parse_networks("10.0.0.0/8")
+    assert client_ip("10.0.0.5", "203.0.113.7, 10.0.0.2", trusted) == "203.0.113.7"
+    # Spoofed leftmost entries are ignored
+    assert client_ip("10.0.0.5", "1.1.1.1, 203.0.113.7", trusted) == "203.0.113.7"
+    # Untrusted peers can't set their own IP
+    assert client_ip("198.51.100.1", "203.0.113.7", trusted) == "198.51.100.1"
+
+
+def test_middleware_uses_separate_budgets():
+    """Test expensive routes are limited independently of cheap ones."""
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        store=MemoryBucketStore(),
+        cheap_rate="5/minute",
+        expensive_rate="1/minute",
+        expensive_paths=("/api/articles/",),
+    )
+
+    @app.get("/api/articles")
+    async def list_articles():
+        return {"articles": []}
+
+    @app.get("/api/articles/{slug}")
+    async def get_article(slug: str):
+        return {"slug": slug}
+
+    client = TestClient(app)
+    assert client.get("/api/articles/a").status_code == 200
+    limited = client.get("/api/articles/b")
+    assert limited.status_code == 429
+    assert int(limited.headers["retry-after"]) > 0
+    assert client.get("/api/articles").status_code == 200
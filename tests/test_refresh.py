@@ -0,0 +1,108 @@
+"""Tests for per-resource cache policies and background refreshes."""
+
+import asyncio
+
+import pytest
+
+from app.config import Settings
+from app.devtools.fake_upstream import FakeUpstreamConfig
+from app.services import docs_service, sheets_service
+from app.services.cache_service import get_cache
+from app.services.change_tracker import ChangeTracker, tracker_metrics
+from app.services.refresh import wait_for_refreshes
+
+
+def test_settings_resource_policy():
+    """Test per-resource TTLs fall back to the global TTL."""
+    settings = Settings(cache_ttl_seconds=120, cache_ttl_vision=0, cache_ttl_events=60)
+    assert settings.get_cache_ttl("events") == 60
+    assert settings.get_cache_ttl("vision") == 120
+    assert settings.get_cache_ttl("unknown") == 120
+    assert settings.get_refresh_interval("unknown") == 0
+
+
+def test_get_helpers_apply_resource_ttl(upstream, monkeypatch):
+    """Test each resource is cached with its own TTL."""
+    monkeypatch.setattr(sheets_service.settings, "cache_ttl_vision", 86400)
+    monkeypatch.setattr(sheets_service.settings, "cache_ttl_events", 60)
+
+    asyncio.run(sheets_service.get_vision())
+    asyncio.run(sheets_service.get_events())
+
+    entries = get_cache()._cache
+    vision = entries["sheet:vision:default"]
+    events = entries["sheet:events:default"]
+    assert vision.expires_at - events.expires_at == pytest.approx(86400 - 60, abs=5)
+
+
+def test_soft_refresh_serves_cached_and_refetches_once(upstream, monkeypatch):
+    """Test an entry past its refresh interval is served while one background refresh runs."""
+    monkeypatch.setattr(sheets_service.settings, "refresh_interval_events", 1)
+    cache = get_cache()
+
+    async def run():
+        first = await sheets_service.get_events()
+        entry = cache._cache["sheet:events:default"]
+        entry.refresh_at = 0  # make it due
+        upstream.sheets["events"] = upstream.sheets["events"].replace("Culte", "Célébration")
+        before = upstream.stats["requests"]
+
+        served = await asyncio.gather(*(sheets_service.get_events() for _ in range(10)))
+        assert all(rows == first for rows in served)
+
+        await wait_for_refreshes()
+        assert upstream.stats["requests"] - before == 1
+        return await sheets_service.get_events()
+
+    refreshed = asyncio.run(run())
+    assert "Célébration" in str(list(refreshed))
+
+
+def test_concurrent_misses_share_one_fetch(upstream):
+    """Test a burst of requests for an uncached sheet or doc makes one upstream call per key."""
+    upstream.config = FakeUpstreamConfig(latency_ms=20)
+
+    async def run():
+        await asyncio.gather(
+            *(sheets_service.get_articles() for _ in range(10)),
+            *(docs_service.fetch_doc_by_id("article-1") for _ in range(10)),
+        )
+
+    asyncio.run(run())
+    assert upstream.stats["requests"] == 2
+
+
+def test_change_tracker_adapts_interval():
+    """Test the interval grows while content is stable and halves after a change."""
+    tracker = ChangeTracker(100, min_interval=60, max_interval=300, growth=2)
+
+    assert tracker.observe(b"v1") is False
+    assert (tracker.generation, tracker.interval) == (1, 100)
+    tracker.observe(b"v1")
+    assert tracker.interval == 200
+    tracker.observe(b"v1")
+    assert tracker.interval == 300  # capped
+
+    assert tracker.observe(b"v2") is True
+    assert (tracker.generation, tracker.interval) == (2, 150)
+    tracker.observe(b"v3")
+    tracker.observe(b"v4")
+    assert tracker.interval == 60  # floored
+    assert tracker.metrics()["fetches"] == 6
+
+
+def test_refetch_uses_learned_interval(upstream, monkeypatch):
+    """Test a sheet that doesn't change is soft-refreshed less and less often."""
+    monkeypatch.setattr(sheets_service.settings, "refresh_interval_vision", 100)
+    monkeypatch.setattr(sheets_service.settings, "adaptive_refresh_min_seconds", 10)
+
+    async def run():
+        for _ in range(3):
+            await sheets_service.get_vision(use_cache=False)
+
+    asyncio.run(run())
+    assert tracker_metrics()["sheet:vision:default"]["interval_seconds"] == 225  # 100 * 1.5 * 1.5
+    entry = get_cache()._cache["sheet:vision:default"]
+    assert entry.expires_at - entry.refresh_at == pytest.approx(
+        sheets_service.settings.cache_ttl_vision - 225, abs=2
+    )
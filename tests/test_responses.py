@@ -0,0 +1,26 @@
+"""Tests for the fast JSON response class."""
+
+import json
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models.home_groups import HomeGroup, HomeGroupListResponse
+from app.responses import FastJSONResponse
+
+
+def test_model_renders_like_default_encoder():
+    """Test models serialize to the same JSON as FastAPI's default path."""
+    group = HomeGroup.model_validate({"id": "3", "HOME": "Dance", "Fréquence": "2 fois par mois"})
+    payload = HomeGroupListResponse(home_groups=[group], total=1)
+
+    response = FastJSONResponse(payload)
+
+    assert json.loads(response.body) == jsonable_encoder(payload)
+    assert "Fréquence" not in response.body.decode()
+    assert response.media_type == "application/json"
+
+
+def test_plain_content_renders():
+    """Test dicts render without going through a model."""
+    response = FastJSONResponse({"status": "healthy", "église": True})
+    assert json.loads(response.body) == {"status": "healthy", "église": True}
@@ -0,0 +1,41 @@
+"""Tests for the prefork launcher."""
+
+import asyncio
+
+import pytest
+
+from app import serve
+from app.routers.changes import FEEDS
+from app.services import docs_service
+from app.services.changes import get_change_log
+
+
+def test_warm_loads_sheets_and_published_docs(upstream):
+    """Test warming fetches every configured sheet and each published article's doc once."""
+    rows = asyncio.run(serve.warm())
+    assert set(rows) == set(upstream.sheets)
+    assert rows["articles"] > 0
+
+    published = FEEDS["articles"][1].select(get_change_log().snapshot("articles"))
+    for article in published:
+        doc_id, revision = docs_service.article_doc(article)
+        assert docs_service.cache.get(docs_service.doc_cache_key(doc_id, revision)) is not None
+
+    requests = upstream.stats["requests"]
+    assert requests == len(upstream.sheets) + len(published)
+
+
+def test_missing_loop_or_parser_is_rejected(monkeypatch, capsys):
+    """Test asking for uvloop/httptools when they aren't installed fails up front."""
+    monkeypatch.setitem(serve.OPTIONAL_MODULES, "httptools", "no_such_module_installed")
+    with pytest.raises(SystemExit):
+        serve.main(["--http", "httptools"])
+    assert "httptools is not installed" in capsys.readouterr().err
+
+
+def test_respawn_delay_grows_with_early_exits():
+    """Test workers that keep dying at startup are replaced ever more slowly, up to a cap."""
+    assert serve.respawn_delay(0) == 0
+    assert serve.respawn_delay(1) == serve.RESPAWN_DELAY
+    assert serve.respawn_delay(3) == 4 * serve.RESPAWN_DELAY
+    assert serve.respawn_delay(50) == serve.RESPAWN_MAX_DELAY
@@ -0,0 +1,52 @@
+"""Tests for compact sheet snapshots."""
+
+import csv
+import io
+
+from app.models.home_groups import HomeGroup
+from app.services.snapshot import Snapshot
+
+
+CSV = (
+    '"id","HOME","Fréquence","status","",""\n'
+    '"1","A table","2 fois par mois","published","",""\n'
+    '"2","Ballerz","1 fois par mois","published"\n'
+    "\n"
+    '"3","Louange","1 fois par mois","draft","",""\n'
+)
+
+
+def test_rows_read_like_dict_reader():
+    """Test rows expose the same keys and values as csv.DictReader, minus blank headers."""
+    snapshot = Snapshot.from_csv(CSV)
+    expected = [
+        {key: value for key, value in row.items() if key}
+        for row in csv.DictReader(io.StringIO(CSV))
+    ]
+
+    assert snapshot.columns == ("id", "HOME", "Fréquence", "status")
+    assert snapshot == expected
+    assert snapshot[0]["HOME"] == "A table"
+    assert snapshot[0].get("missing", "") == ""
+    assert dict(**snapshot[1]) == expected[1]
+    assert [row["id"] for row in snapshot[1:]] == ["2", "3"]
+
+
+def test_rows_validate_into_models():
+    """Test aliased models validate straight from a row."""
+    group = HomeGroup.model_validate(Snapshot.from_csv(CSV)[0])
+    assert (group.id, group.home, group.frequency) == (1, "A table", "2 fois par mois")
+
+
+def test_repeated_values_are_shared():
+    """Test headers are shared by all rows and equal cell values are stored once."""
+    first, second, third = Snapshot.from_csv(CSV)
+    assert first._index is third._index
+    assert first["status"] is second["status"]
+    assert second["Fréquence"] is third["Fréquence"]
+
+
+def test_empty_csv():
+    """Test an empty export gives an empty snapshot."""
+    snapshot = Snapshot.from_csv("")
+    assert len(snapshot) == 0 and snapshot == []
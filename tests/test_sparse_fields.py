@@ -0,0 +1,72 @@
+"""Tests for sparse fieldsets and the rendered response cache."""
+
+import inspect
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.models.vision import VisionSection
+from app.routers.listing import sparse_fields
+from app.services.response_cache import ResponseCache, get_response_cache
+
+
+@pytest.fixture
+def client(upstream):
+    return TestClient(create_app())
+
+
+def test_fields_projects_list_items(client):
+    """Test only the requested item fields are returned."""
+    full = client.get("/api/articles")
+    sparse = client.get("/api/articles", params={"fields": "title,slug"})
+
+    assert sparse.status_code == 200
+    body = sparse.json()
+    assert body["total"] == full.json()["total"] > 0
+    assert all(set(article) == {"title", "slug"} for article in body["articles"])
+    assert len(sparse.content) < len(full.content)
+
+
+def test_fields_use_output_names(client):
+    """Test aliased models are projected by their English field names."""
+    response = client.get("/api/home-groups", params={"fields": "home,leaders"})
+    assert response.status_code == 200
+    assert all(set(group) == {"home", "leaders"} for group in response.json()["home_groups"])
+
+
+def test_unknown_field_is_rejected(client):
+    """Test an unknown field name is a 400 naming it."""
+    response = client.get("/api/events", params={"fields": "title,password"})
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+
+def test_each_projection_is_cached_separately(client):
+    """Test projections get their own entry, regardless of field order."""
+    cache = get_response_cache()
+    first = client.get("/api/events", params={"fields": "title,id"})
+    assert len(cache) == 1
+    assert client.get("/api/events", params={"fields": "id,title"}).content == first.content
+    assert len(cache) == 1
+
+    client.get("/api/events")
+    assert len(cache) == 2
+
+
+def test_fields_dependency_runs_on_the_event_loop():
+    """Test the dependency is async, so FastAPI doesn't run it in the threadpool."""
+    assert inspect.iscoroutinefunction(sparse_fields(VisionSection))
+
+
+def test_cached_response_follows_snapshot():
+    """Test a rendered body is only reused for the snapshot it came from."""
+    cache = ResponseCache(max_entries=2)
+    snapshot = [{"id": "1"}]
+    cache.set("/api/events|", snapshot, b"old")
+    assert cache.get("/api/events|", snapshot) == b"old"
+    assert cache.get("/api/events|", [{"id": "1"}]) is None
+
+    cache.set("a", snapshot, b"a")
+    cache.set("b", snapshot, b"b")
+    assert cache.get("/api/events|", snapshot) is None  # evicted
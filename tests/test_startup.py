@@ -0,0 +1,54 @@
+"""Tests for the app factory and lazy startup."""
+
+import subprocess
+import sys
+
+from fastapi.testclient import TestClient
+
+from app.main import ROUTERS, create_app
+
+
+def mounted_prefixes(app) -> set[str]:
+    return {
+        prefix for prefix in ROUTERS
+        if any(getattr(route, "path", "").startswith(prefix) for route in app.routes)
+    }
+
+
+def test_eager_app_mounts_all_routers():
+    """Test the default app has every router mounted up front."""
+    app = create_app(lazy=False)
+    assert mounted_prefixes(app) == set(ROUTERS)
+
+
+def test_lazy_app_mounts_routers_on_first_request():
+    """Test lazy startup mounts only the routers that have been requested."""
+    app = create_app(lazy=True)
+    client = TestClient(app)
+    assert mounted_prefixes(app) == set()
+
+    assert client.get("/api/health").status_code == 200
+    assert mounted_prefixes(app) == set()
+
+    assert client.get("/api/events").status_code == 200
+    assert client.get("/api/events/upcoming").status_code == 200
+    assert mounted_prefixes(app) == {"/api/events"}
+
+
+def test_lazy_app_openapi_lists_every_route():
+    """Test the OpenAPI schema loads all routers first."""
+    app = create_app(lazy=True)
+    paths = TestClient(app).get("/openapi.json").json()["paths"]
+    assert "/api/articles/{slug}" in paths
+    assert "/api/cache/invalidate" in paths
+    assert mounted_prefixes(app) == set(ROUTERS)
+
+
+def test_importing_main_does_not_build_settings():
+    """Test settings are only read once the app is built."""
+    code = (
+        "import app.main\n"
+        "from app.config import get_settings\n"
+        "assert get_settings.cache_info().currsize == 0"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
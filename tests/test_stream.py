@@ -0,0 +1,131 @@
+"""Tests for change notifications and the server-sent events stream."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.routers.stream import event_stream, stream
+from app.services import docs_service, notifications, sheets_service
+from app.services.changes import get_change_log
+from app.services.notifications import Broadcaster, TooManySubscribersError
+from app.services.snapshot import Snapshot
+
+
+@pytest.fixture
+def broadcaster(monkeypatch):
+    broadcaster = Broadcaster(max_subscribers=2, queue_size=2)
+    monkeypatch.setattr(notifications, "_broadcaster", broadcaster)
+    get_change_log().clear()
+    yield broadcaster
+    get_change_log().clear()
+
+
+def test_broadcaster_limits_and_drops_slow_subscribers(broadcaster):
+    """Test the subscriber cap, and that a full queue drops only that subscriber."""
+    slow, fast = broadcaster.subscribe(), broadcaster.subscribe()
+    with pytest.raises(TooManySubscribersError):
+        broadcaster.subscribe()
+
+    for generation in range(3):
+        broadcaster.publish("sheet", {"generation": generation})
+        fast.queue.get_nowait()
+
+    assert slow.overflowed and not fast.overflowed
+    assert len(broadcaster) == 1
+
+
+def test_stream_sends_events_and_heartbeats(broadcaster):
+    """Test published notifications are formatted as SSE, with heartbeats when idle."""
+    async def run():
+        stream = event_stream(heartbeat=0.01)
+        messages = [await anext(stream)]
+        messages.append(await anext(stream))
+        broadcaster.publish("sheet", {"resource": "events", "generation": 3}, event_id="3")
+        messages.append(await anext(stream))
+        await stream.aclose()
+        return messages
+
+    retry, heartbeat, event = asyncio.run(run())
+    assert retry == "retry: 5000\n\n"
+    assert heartbeat == ": heartbeat\n\n"
+    assert event == 'id: 3\nevent: sheet\ndata: {"resource":"events","generation":3}\n\n'
+    assert len(broadcaster) == 0  # unsubscribed when the stream closed
+
+
+def test_reconnect_catches_up(broadcaster):
+    """Test Last-Event-ID replays the resources changed since, or asks for a reset."""
+    log = get_change_log()
+    rows = Snapshot.from_csv("id,title\n1,A\n")
+    log.record("articles", rows, rows.diff(None))
+    log.record("events", rows, rows.diff(None))
+    since = log.token()
+    edited = Snapshot.from_csv("id,title\n1,B\n")
+    log.record("events", edited, edited.diff(rows))
+
+    async def first_events(last_event_id):
+        stream = event_stream(last_event_id, heartbeat=0.01)
+        messages = [await anext(stream) for _ in range(3)]
+        await stream.aclose()
+        return messages[1:]
+
+    events, heartbeat = asyncio.run(first_events(since))
+    assert "event: sheet" in events and '"resource":"events"' in events
+    assert heartbeat == ": heartbeat\n\n"
+
+    reset, _ = asyncio.run(first_events("not-a-generation"))
+    assert reset.startswith(f"id: {log.token()}\nevent: reset\n")
+    reset, _ = asyncio.run(first_events("articles:000000000000,events:000000000000"))
+    assert "event: reset" in reset
+
+
+def test_stream_rejects_clients_over_the_limit(broadcaster):
+    """Test the endpoint answers 503 once the subscriber cap is reached."""
+    broadcaster.subscribe()
+    broadcaster.subscribe()
+    response = TestClient(create_app()).get("/api/stream")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
+
+
+def test_unsent_stream_holds_no_slot(broadcaster):
+    """Test the subscription starts with the body, so a response never sent doesn't leak a slot."""
+    response = asyncio.run(stream(last_event_id=None))
+    assert len(broadcaster) == 0
+
+    async def first_message():
+        message = await anext(response.body_iterator)
+        subscribed = len(broadcaster)
+        await response.body_iterator.aclose()
+        return message, subscribed
+
+    assert asyncio.run(first_message()) == ("retry: 5000\n\n", 1)
+    assert len(broadcaster) == 0
+
+
+def test_sheet_and_doc_edits_are_published(broadcaster, upstream):
+    """Test refreshes that change content notify subscribers, and identical ones don't."""
+    broadcaster.queue_size = 10
+    subscription = broadcaster.subscribe()
+
+    async def run():
+        await sheets_service.get_events(use_cache=False)
+        await docs_service.fetch_doc_by_id("article-1", use_cache=False)
+        await sheets_service.get_events(use_cache=False)
+        await docs_service.fetch_doc_by_id("article-1", use_cache=False)
+        upstream.sheets["events"] = upstream.sheets["events"].replace("Culte", "Célébration")
+        upstream.docs["article-1"] = upstream.docs["article-1"].replace("</body>", "<p>Ajout</p></body>")
+        await sheets_service.get_events(use_cache=False)
+        await docs_service.fetch_doc_by_id("article-1", use_cache=False)
+
+    asyncio.run(run())
+
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    assert [(event, data.get("resource")) for event, data, _ in events] == [
+        ("sheet", "events"), ("sheet", "events"), ("doc", None),
+    ]
+    assert events[0][1]["generation"] != events[1][1]["generation"]
+    assert events[1][1]["generation"] == get_change_log().token()